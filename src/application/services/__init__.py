@@ -1,7 +1,11 @@
 from src.application.services.memory_manager import MemoryManager
 from src.application.services.research_agent import ResearchAgentService
+from src.application.services.response_cache import ResponseCache
+from src.application.services.semantic_cache import SemanticCache
 
 __all__ = [
     "MemoryManager",
     "ResearchAgentService",
+    "ResponseCache",
+    "SemanticCache",
 ]
@@ -6,17 +6,35 @@ combining web search and text analysis tools to conduct comprehensive
 technical research autonomously.
 """
 
+import asyncio
+import hashlib
+import json
+import re
+import string
 import time
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate, chain
 from typing import Any, cast
+from urllib.parse import urlsplit
+from uuid import UUID
 
 import structlog
-from langchain_classic.agents import AgentExecutor, create_react_agent
+from langchain_classic.agents import (
+    AgentExecutor,
+    create_react_agent,
+    create_tool_calling_agent,
+)
+from langchain_core.callbacks import AsyncCallbackHandler
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.prompts import PromptTemplate
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder, PromptTemplate
 from langchain_core.tools import BaseTool
 
 from src.application.services.memory_manager import MemoryManager
+from src.application.services.response_cache import CachedResearch, ResponseCache
+from src.application.services.semantic_cache import SemanticCache
 from src.domain.entities.query import ResearchQuery
 from src.domain.entities.report import ReportFormat, ReportSection, ResearchReport
 from src.domain.entities.research import (
@@ -67,8 +85,269 @@ Begin!
 Question: {input}
 Thought: {agent_scratchpad}"""
 
+# System prompt for LLMs with native tool calling; tools are passed through the
+# provider's tool API, so several searches can be requested in a single step
+TOOL_CALLING_PROMPT = """You are an expert technical research agent. Your goal is to conduct
+thorough research on the given topic and provide accurate, well-sourced information.
+
+CRITICAL LANGUAGE RULE:
+- Detect the language of the user's question
+- You MUST respond ENTIRELY in the SAME language as the question
+- If the question is in Spanish, your ENTIRE response must be in Spanish
+- If the question is in English, your ENTIRE response must be in English
+
+Important guidelines:
+1. Always search for multiple sources to verify information
+2. When you need several searches, request them together in the same step
+3. Focus on recent and authoritative sources
+4. Extract key technical details and best practices
+5. Provide actionable insights when possible
+6. Cite your sources in the final answer
+7. RESPOND IN THE SAME LANGUAGE AS THE QUESTION
+
+When you have enough information, answer with the key findings and synthesis."""
+
+# Parsed once at import; prompt templates are immutable and safe to share.
+# Per-request variables ({input}, {agent_scratchpad}) must stay at the end so
+# every agent turn starts with the same static prefix, which Gemini and Groq
+# reuse through their implicit prompt caching.
+REACT_PROMPT_TEMPLATE = PromptTemplate.from_template(REACT_PROMPT)
+TOOL_CALLING_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", TOOL_CALLING_PROMPT),
+        ("human", "{input}"),
+        MessagesPlaceholder("agent_scratchpad"),
+    ]
+)
+
+# Changes to the prompt templates invalidate previously cached responses
+PROMPT_FINGERPRINT = hashlib.sha256((REACT_PROMPT + TOOL_CALLING_PROMPT).encode()).hexdigest()[:16]
+
+# One line of a search tool observation: a "Result N:"/"News N:" block header,
+# or an optional "Field:" label and its (possibly empty) value
+_FIELD_RE = re.compile(
+    r"^[ \t]*(?:((?:Result|News) \d+):|(Title|URL|Link|Snippet|Description|Summary):)?"
+    r"[ \t]*(.*?)[ \t\r]*$",
+    re.MULTILINE,
+)
+
+# Bullet or numbered list item; the leading markers are dropped from the capture
+_BULLET_RE = re.compile(r"^[ \t]*(?:[-•*→✓►]|\d+[.):-])[-•*→✓►\d.): \t]*(.*\S)", re.MULTILINE)
+
+# Words marking a sentence as a key finding (English and Spanish)
+_KEY_INDICATORS = (
+    "important",
+    "key",
+    "best",
+    "recommend",
+    "should",
+    "must",
+    "first",
+    "principal",
+    "main",
+    "primary",
+    "essential",
+    "importante",
+    "clave",
+    "mejor",
+    "recomienda",
+    "debe",
+    "primero",
+    "esencial",
+    "fundamental",
+)
+_KEY_INDICATOR_RE = re.compile("|".join(_KEY_INDICATORS), re.IGNORECASE)
+
+# Blocked domains - spam, unrelated, or non-research sites (subdomains included)
+_BLOCKED_DOMAINS = frozenset(
+    {
+        "zhihu.com",
+        "baidu.com",
+        "weibo.com",
+        "qq.com",
+        "whitepages.com",
+        "yellowpages.com",
+        "facebook.com",
+        "instagram.com",
+        "tiktok.com",
+        "pinterest.com",
+        "twitter.com",
+        "x.com",
+    }
+)
+# Blocked sections of otherwise allowed sites
+_BLOCKED_PATHS = ("linkedin.com/in/",)
+
+# Maximum number of sources kept per research
+MAX_SEARCH_RESULTS = 10
+
+# Research prompt layout; optional sections render with their own leading blank line
+_RESEARCH_PROMPT_LAYOUT = (
+    "Research Question: {question}{context}{keywords}\n\n"
+    "Research Type: {query_type}\n\n"
+    "Maximum Sources: {max_sources}{memory}"
+)
+
+# Translation table deleting Latin/neutral characters (basic ASCII letters,
+# Latin-1 accented letters for Spanish/Portuguese/French, digits and space)
+_LATIN_DELETE_TABLE = str.maketrans(
+    "",
+    "",
+    string.ascii_letters + string.digits + " " + "".join(map(chr, range(0xC0, 0x100))),
+)
+
+# Source credibility by URL domain
+_HIGH_CREDIBILITY_DOMAINS = (
+    "wikipedia.org",
+    "nasa.gov",
+    ".gov",
+    ".edu",
+    "nature.com",
+    "sciencedirect.com",
+    "ieee.org",
+    "microsoft.com",
+    "google.com",
+    "github.com",
+    "stackoverflow.com",
+    "mozilla.org",
+    "python.org",
+)
+_MEDIUM_CREDIBILITY_DOMAINS = (
+    "medium.com",
+    "dev.to",
+    "bbc.com",
+    "cnn.com",
+    "reuters.com",
+    "techcrunch.com",
+    "wired.com",
+)
+
+
+def _domain_pattern(domains: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a domain list into one alternation matching any of them in a URL."""
+    return re.compile("|".join(map(re.escape, domains)))
+
+
+# One scan per host instead of one substring search per listed domain
+_HIGH_CREDIBILITY_RE = _domain_pattern(_HIGH_CREDIBILITY_DOMAINS)
+_MEDIUM_CREDIBILITY_RE = _domain_pattern(_MEDIUM_CREDIBILITY_DOMAINS)
+
+
+# Distinct hosts remembered by the credibility check
+CHECK_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CHECK_CACHE_SIZE)
+def _host_credibility(host: str) -> SourceCredibility:
+    """Assess credibility for a lowercased hostname."""
+    if _HIGH_CREDIBILITY_RE.search(host):
+        return SourceCredibility.HIGH
+
+    if _MEDIUM_CREDIBILITY_RE.search(host):
+        return SourceCredibility.MEDIUM
+
+    return SourceCredibility.MEDIUM
+
+
+def _assess_credibility(url: str) -> SourceCredibility:
+    """Assess source credibility based on URL domain."""
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:  # Malformed URL, e.g. an unclosed IPv6 bracket
+        return SourceCredibility.MEDIUM
+
+    # Only the host decides credibility, so every page of a site shares one cache entry
+    return _host_credibility(host.lower())
+
 
-@dataclass
+def _has_valid_latin_text(text: str) -> bool:
+    """Check if text contains mostly Latin/Spanish characters."""
+    if not text or len(text) < 5:
+        return False
+
+    # Count Latin characters in C: whatever the table deletes was Latin
+    latin_count = len(text) - len(text.translate(_LATIN_DELETE_TABLE))
+
+    # At least 50% should be Latin/neutral characters
+    return latin_count / len(text) > 0.5
+
+
+def _is_blocked_url(url: str) -> bool:
+    """Check a URL's host (or any parent domain) and path against the blocklists."""
+    try:
+        parts = urlsplit(url.lower())
+    except ValueError:  # Malformed URL, e.g. an unclosed IPv6 bracket
+        return True
+
+    labels = (parts.hostname or "").split(".")
+    if any(".".join(labels[i:]) in _BLOCKED_DOMAINS for i in range(len(labels) - 1)):
+        return True
+
+    location = parts.netloc.removeprefix("www.") + parts.path
+    return any(path in location for path in _BLOCKED_PATHS)
+
+
+def _output_text(output: Any) -> str:
+    """Flatten an agent output that may be a list of content blocks into text."""
+    if isinstance(output, str):
+        return output
+    if isinstance(output, list):
+        return "".join(
+            block if isinstance(block, str) else str(block.get("text", ""))
+            for block in output
+            if isinstance(block, str | dict)
+        )
+    return str(output)
+
+
+class _SearchObservationCollector(AsyncCallbackHandler):
+    """
+    Parse search tool observations while the agent is still running.
+
+    Each search observation is parsed in a worker thread as soon as its
+    tool call finishes, overlapping the parsing with the agent's next
+    LLM turn instead of doing it all after the final answer.
+    """
+
+    def __init__(self, parse: Callable[[str], list[SearchResult]]) -> None:
+        self._parse = parse
+        self._tool_names: dict[UUID, str] = {}
+        self._parsed: dict[UUID, asyncio.Task[list[SearchResult]]] = {}
+
+    async def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,  # noqa: ARG002
+        *,
+        run_id: UUID,
+        **kwargs: Any,  # noqa: ARG002
+    ) -> None:
+        """Remember which tool each run belongs to, in call order."""
+        self._tool_names[run_id] = str((serialized or {}).get("name", ""))
+
+    async def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:  # noqa: ARG002
+        """Start parsing a finished search tool's observation."""
+        if "search" in self._tool_names.get(run_id, "").lower():
+            self._parsed[run_id] = asyncio.create_task(asyncio.to_thread(self._parse, str(output)))
+
+    async def results(self) -> list[list[SearchResult]] | None:
+        """
+        Wait for pending parses and return them in tool call order.
+
+        Returns:
+            Parsed results per search call, or None if no tool events were seen
+        """
+        if not self._tool_names:
+            return None
+        return [await self._parsed[run_id] for run_id in self._tool_names if run_id in self._parsed]
+
+    def cancel(self) -> None:
+        """Cancel parses still running after the agent run was abandoned."""
+        for task in self._parsed.values():
+            task.cancel()
+
+
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     """Configuration for the research agent."""
 
@@ -92,6 +371,8 @@ class ResearchAgentService:
         tools: list[BaseTool],
         memory_manager: MemoryManager,
         config: AgentConfig | None = None,
+        response_cache: ResponseCache | None = None,
+        semantic_cache: SemanticCache | None = None,
     ) -> None:
         """
         Initialize the research agent.
@@ -101,11 +382,15 @@ class ResearchAgentService:
             tools: List of tools available to the agent
             memory_manager: Memory manager for conversation history
             config: Agent configuration options
+            response_cache: Optional cache of previously completed research
+            semantic_cache: Optional cache matching paraphrased questions
         """
         self._llm = llm
         self._tools = tools
         self._memory = memory_manager
         self._config = config or AgentConfig()
+        self._response_cache = response_cache
+        self._semantic_cache = semantic_cache
         self._agent_executor = self._create_agent_executor()
 
         logger.info(
@@ -115,14 +400,27 @@ class ResearchAgentService:
         )
 
     def _create_agent_executor(self) -> AgentExecutor:
-        """Create the LangChain agent executor."""
-        prompt = PromptTemplate.from_template(REACT_PROMPT)
+        """
+        Create the LangChain agent executor.
 
-        agent = create_react_agent(
-            llm=self._llm,
-            tools=self._tools,
-            prompt=prompt,
-        )
+        Uses a tool-calling agent when the LLM supports native tool calling:
+        it can request several tool calls per step, which the executor runs
+        concurrently. Other LLMs use the text-based ReAct loop.
+        """
+        agent: Any
+        try:
+            agent = create_tool_calling_agent(
+                llm=self._llm,
+                tools=self._tools,
+                prompt=TOOL_CALLING_PROMPT_TEMPLATE,
+            )
+        except (ValueError, NotImplementedError):
+            logger.debug("LLM has no tool calling support, using ReAct agent")
+            agent = create_react_agent(
+                llm=self._llm,
+                tools=self._tools,
+                prompt=REACT_PROMPT_TEMPLATE,
+            )
 
         return AgentExecutor(
             agent=cast("Any", agent),
@@ -156,31 +454,84 @@ class ResearchAgentService:
         # Create pending result
         result = ResearchResult.create_pending(query.id)
 
-        try:
-            # Build the research prompt with context
-            research_prompt = self._build_research_prompt(query)
+        # Serve repeated or paraphrased requests without running the agent again
+        cache_scope = self._cache_scope(query)
+        cache_key = self._cache_key(query, cache_scope)
+        cached = self._response_cache.get(cache_key) if self._response_cache is not None else None
+        question_vector: tuple[float, ...] | None = None
 
-            # Execute the agent
-            agent_response = await self._agent_executor.ainvoke({"input": research_prompt})
+        if cached is None and self._semantic_cache is not None:
+            question_vector = await self._embed_question(self._semantic_cache, query)
+            if question_vector is not None:
+                cached = self._semantic_cache.get(question_vector, cache_scope)
+                if cached is not None and self._response_cache is not None:
+                    self._response_cache.put(cache_key, cached)
 
-            # Process agent response
-            search_results = self._extract_search_results(agent_response)
-            key_findings = self._extract_key_findings(agent_response)
-            synthesis = agent_response.get("output", "")
+        if cached is not None:
+            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+            logger.info(
+                "Research served from cache",
+                query_id=str(query.id),
+                cache_hit=True,
+                time_ms=processing_time_ms,
+            )
+            return result.with_results(
+                search_results=cached.search_results,
+                key_findings=cached.key_findings,
+                synthesis=cached.synthesis,
+                confidence_score=cached.confidence_score,
+                processing_time_ms=processing_time_ms,
+            )
 
-            # Calculate confidence based on sources and findings
-            confidence = self._calculate_confidence(search_results, key_findings)
+        try:
+            # Embed the question once, off the event loop, for the memory
+            # lookup and the stored interaction
+            memory_vector = await self._embed_for_memory(query, question_vector)
 
-            # Calculate processing time
-            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+            # Build the research prompt with context
+            research_prompt = self._build_research_prompt(query, memory_vector)
+
+            # Execute the agent, parsing search observations as they arrive
+            collector = _SearchObservationCollector(self._parse_search_observation)
+            try:
+                agent_response = await self._agent_executor.ainvoke(
+                    {"input": research_prompt},
+                    config={"callbacks": [collector]},
+                )
+            except BaseException:
+                collector.cancel()
+                raise
+
+            synthesis = _output_text(agent_response.get("output", ""))
+            parsed_observations = await collector.results()
+
+            # Process the agent response off the event loop
+            (search_results, high_cred_count), key_findings = await asyncio.gather(
+                asyncio.to_thread(
+                    self._extract_search_results, agent_response, parsed_observations
+                ),
+                asyncio.to_thread(self._extract_key_findings, agent_response),
+            )
 
-            # Store in memory
-            self._memory.add_interaction(
+            # Only a successful run is remembered; a failed one must not feed
+            # later prompts
+            await asyncio.to_thread(
+                self._memory.add_interaction,
                 query=query.question,
                 response=synthesis,
                 metadata={"query_id": str(query.id)},
+                query_vector=memory_vector,
+                embed=False,
             )
 
+            # Calculate confidence based on sources and findings
+            confidence = self._calculate_confidence(
+                len(search_results), len(key_findings), high_cred_count
+            )
+
+            # Calculate processing time
+            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+
             # Update result with findings
             result = result.with_results(
                 search_results=tuple(search_results),
@@ -190,6 +541,17 @@ class ResearchAgentService:
                 processing_time_ms=processing_time_ms,
             )
 
+            completed = CachedResearch(
+                search_results=result.search_results,
+                key_findings=result.key_findings,
+                synthesis=result.synthesis,
+                confidence_score=result.confidence_score,
+            )
+            if self._response_cache is not None:
+                self._response_cache.put(cache_key, completed)
+            if self._semantic_cache is not None and question_vector is not None:
+                self._semantic_cache.put(question_vector, cache_scope, completed)
+
             logger.info(
                 "Research completed",
                 query_id=str(query.id),
@@ -209,299 +571,303 @@ class ResearchAgentService:
 
         return result
 
-    def _build_research_prompt(self, query: ResearchQuery) -> str:
-        """Build a comprehensive research prompt."""
-        prompt_parts = [f"Research Question: {query.question}"]
+    async def research_many(
+        self, queries: Sequence[ResearchQuery], concurrency: int = 5
+    ) -> list[ResearchResult]:
+        """
+        Conduct research on several queries concurrently.
 
-        if query.context:
-            prompt_parts.append(f"\nAdditional Context: {query.context}")
+        Args:
+            queries: The research queries to investigate
+            concurrency: Maximum number of queries researched at the same time
 
-        if query.keywords:
-            prompt_parts.append(f"\nFocus Keywords: {', '.join(query.keywords)}")
+        Returns:
+            One ResearchResult per query, in the same order; a query that
+            fails is returned as a failed result instead of raising
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
 
-        prompt_parts.append(f"\nResearch Type: {query.query_type.value}")
-        prompt_parts.append(f"\nMaximum Sources: {query.max_sources}")
+        semaphore = asyncio.Semaphore(concurrency)
 
-        # Add memory context if available
-        recent_context = self._memory.get_relevant_context(query.question)
-        if recent_context:
-            prompt_parts.append(f"\nRelevant Previous Research:\n{recent_context}")
+        async def research_one(query: ResearchQuery) -> ResearchResult:
+            async with semaphore:
+                return await self.research(query)
+
+        outcomes = await asyncio.gather(
+            *(research_one(query) for query in queries), return_exceptions=True
+        )
 
-        return "\n".join(prompt_parts)
+        results: list[ResearchResult] = []
+        for query, outcome in zip(queries, outcomes, strict=True):
+            if isinstance(outcome, ResearchResult):
+                results.append(outcome)
+            elif isinstance(outcome, Exception):
+                results.append(ResearchResult.create_pending(query.id).mark_failed(str(outcome)))
+            else:
+                raise outcome
+        return results
 
-    def _extract_search_results(self, agent_response: dict[str, Any]) -> list[SearchResult]:
-        """Extract search results from agent intermediate steps."""
-        search_results: list[SearchResult] = []
+    def _cache_scope(self, query: ResearchQuery) -> str:
+        """Build the part of the cache key that must match exactly."""
+        # JSON keeps field boundaries: separators inside context or keywords
+        # can't make two different requests share a scope
+        return json.dumps(
+            [
+                self._model_id(),
+                PROMPT_FINGERPRINT,
+                query.context,
+                sorted(query.keywords),
+                query.query_type.value,
+                query.max_sources,
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
 
-        intermediate_steps = agent_response.get("intermediate_steps", [])
+    def _cache_key(self, query: ResearchQuery, scope: str) -> str:
+        """Build the response cache key for a query."""
+        # Case and whitespace differences don't change the question
+        question = " ".join(query.question.lower().split())
+        payload = json.dumps([scope, question], ensure_ascii=False)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
 
-        for step in intermediate_steps:
-            if len(step) >= 2:
-                action, observation = step[0], step[1]
-                if hasattr(action, "tool") and "search" in action.tool.lower():
-                    # Parse observation to extract results
-                    results = self._parse_search_observation(str(observation))
-                    search_results.extend(results)
+    async def _embed_question(
+        self,
+        semantic_cache: SemanticCache,
+        query: ResearchQuery,
+    ) -> tuple[float, ...] | None:
+        """Embed the question for the semantic cache, or None if embedding fails."""
+        try:
+            return await semantic_cache.embed(query.question)
+        except Exception as e:
+            logger.warning(
+                "Question embedding failed, skipping semantic cache",
+                query_id=str(query.id),
+                error=str(e),
+            )
+            return None
+
+    async def _embed_for_memory(
+        self,
+        query: ResearchQuery,
+        question_vector: tuple[float, ...] | None,
+    ) -> tuple[float, ...] | None:
+        """Embed the question for memory, reusing the semantic cache's vector."""
+        embeddings = self._memory.embeddings
+        if embeddings is None:
+            return None
+        if self._semantic_cache is not None and self._semantic_cache.embeddings is embeddings:
+            return question_vector
+        return await self._memory.aembed(query.question)
+
+    def _model_id(self) -> str:
+        """Identify the underlying model so cache entries don't outlive it."""
+        # Fallback-wrapped LLMs keep the primary model on `.runnable`
+        llm = getattr(self._llm, "runnable", self._llm)
+        model = getattr(llm, "model", None) or getattr(llm, "model_name", None)
+        return str(model or type(llm).__name__)
+
+    def _build_research_prompt(
+        self,
+        query: ResearchQuery,
+        question_vector: tuple[float, ...] | None = None,
+    ) -> str:
+        """Build a comprehensive research prompt."""
+        recent_context = self._memory.get_relevant_context(
+            query.question,
+            query_tokens=query.question_tokens,
+            query_vector=question_vector,
+            embed=False,
+        )
+
+        return _RESEARCH_PROMPT_LAYOUT.format(
+            question=query.question,
+            context=f"\n\nAdditional Context: {query.context}" if query.context else "",
+            keywords=f"\n\nFocus Keywords: {', '.join(query.keywords)}" if query.keywords else "",
+            query_type=query.query_type.value,
+            max_sources=query.max_sources,
+            memory=f"\n\nRelevant Previous Research:\n{recent_context}" if recent_context else "",
+        )
+
+    def _extract_search_results(
+        self,
+        agent_response: dict[str, Any],
+        parsed_observations: Iterable[list[SearchResult]] | None = None,
+    ) -> tuple[list[SearchResult], int]:
+        """
+        Extract search results from agent intermediate steps.
+
+        Args:
+            agent_response: Output of the agent executor
+            parsed_observations: Search observations already parsed during the
+                run; when None they are parsed from the intermediate steps
+
+        Returns:
+            The kept sources and how many of them are highly credible
+        """
+        if parsed_observations is None:
+            # Parse each search observation lazily as the filter consumes it
+            parsed_observations = (
+                self._parse_search_observation(str(step[1]))
+                for step in agent_response.get("intermediate_steps", [])
+                if len(step) >= 2 and hasattr(step[0], "tool") and "search" in step[0].tool.lower()
+            )
 
         # Filter out irrelevant sources
-        filtered_results = self._filter_irrelevant_sources(search_results)
-        return filtered_results[:10]  # Limit to 10 results
-
-    def _filter_irrelevant_sources(self, sources: list[SearchResult]) -> list[SearchResult]:
-        """Filter out irrelevant or low-quality sources."""
-        # Blocked domains - spam, unrelated, or non-research sites
-        blocked_domains = [
-            "zhihu.com",
-            "baidu.com",
-            "weibo.com",
-            "qq.com",
-            "whitepages.com",
-            "yellowpages.com",
-            "facebook.com",
-            "instagram.com",
-            "tiktok.com",
-            "pinterest.com",
-            "linkedin.com/in/",
-            "twitter.com",
-            "x.com",
-        ]
+        return self._filter_irrelevant_sources(
+            chain.from_iterable(parsed_observations), limit=MAX_SEARCH_RESULTS
+        )
 
-        filtered = []
+    def _filter_irrelevant_sources(
+        self, sources: Iterable[SearchResult], limit: int | None = None
+    ) -> tuple[list[SearchResult], int]:
+        """
+        Filter out irrelevant or low-quality sources.
+
+        Args:
+            sources: Candidate sources in ranking order
+            limit: Stop once this many sources have been kept
+
+        Returns:
+            The kept sources and how many of them are highly credible
+        """
+        filtered: list[SearchResult] = []
+        high_cred_count = 0
+        high = SourceCredibility.HIGH  # local lookup inside the loop
+        original = 0
         for source in sources:
-            url_lower = source.url.lower()
+            if len(filtered) == limit:
+                break
+            original += 1
 
             # Skip blocked domains
-            if any(blocked in url_lower for blocked in blocked_domains):
+            if _is_blocked_url(source.url):
                 logger.debug("Filtered blocked domain", url=source.url)
                 continue
 
             # Skip if title has too many non-latin characters (likely wrong language)
-            if not self._has_valid_latin_text(source.title):
+            if not _has_valid_latin_text(source.title):
                 logger.debug("Filtered non-latin title", title=source.title[:50])
                 continue
 
             # Skip if snippet has too many non-latin characters
-            if source.snippet and not self._has_valid_latin_text(source.snippet):
+            if source.snippet and not _has_valid_latin_text(source.snippet):
                 logger.debug("Filtered non-latin snippet", url=source.url)
                 continue
 
             filtered.append(source)
+            high_cred_count += source.credibility is high
 
         logger.info(
             "Filtered sources",
-            original=len(sources),
+            original=original,
             filtered=len(filtered),
         )
-        return filtered
-
-    def _has_valid_latin_text(self, text: str) -> bool:
-        """Check if text contains mostly Latin/Spanish characters."""
-        if not text or len(text) < 5:
-            return False
-
-        # Count Latin characters (basic + extended for Spanish/Portuguese/French)
-        latin_count = 0
-        for char in text:
-            # Basic ASCII letters
-            if (
-                "A" <= char <= "Z"
-                or "a" <= char <= "z"
-                or "\u00c0" <= char <= "\u00ff"
-                or char in " 0123456789"
-            ):
-                latin_count += 1
-
-        # At least 50% should be Latin/neutral characters
-        ratio = latin_count / len(text)
-        return ratio > 0.5
+        return filtered, high_cred_count
 
     def _parse_search_observation(self, observation: str) -> list[SearchResult]:
         """Parse search observation string into SearchResult objects."""
         results: list[SearchResult] = []
+        pending: dict[str, str] | None = None
 
-        # Split by "Result" markers for robust parsing
-        import re
-
-        result_blocks = re.split(r"Result \d+:", observation)
-
-        for block in result_blocks:
-            if not block.strip():
-                continue
-
-            lines = block.strip().split("\n")
-            title = ""
-            url = ""
-            snippet = ""
-
-            for line in lines:
-                line = line.strip()
-                if line.startswith("Title:"):
-                    title = line.replace("Title:", "").strip()
-                elif line.startswith("URL:") or line.startswith("Link:"):
-                    # Handle URL: or just the URL after colon
-                    url_part = line.split(":", 1)[-1].strip() if ":" in line else line
-                    # Reconstruct full URL if it was split
-                    if url_part.startswith("//") or url_part.startswith("/"):
-                        url = "https:" + url_part
-                    elif not url_part.startswith("http"):
-                        url = "https://" + url_part
-                    else:
-                        url = url_part
-                elif line.startswith("Snippet:") or line.startswith("Description:"):
-                    snippet = line.split(":", 1)[-1].strip()
-                elif not snippet and title and len(line) > 20:
-                    # Capture any descriptive text as snippet
-                    snippet = line
-
-            if title:
+        def flush() -> None:
+            nonlocal pending
+            if pending is not None:
                 results.append(
                     SearchResult.create(
-                        title=title,
-                        url=url or "https://duckduckgo.com",
-                        snippet=snippet or title,
-                        credibility=self._assess_credibility(url),
+                        title=pending["title"],
+                        url=pending["url"] or "https://duckduckgo.com",
+                        snippet=pending["snippet"] or pending["title"],
+                        credibility=_assess_credibility(pending["url"]),
                     )
                 )
+                pending = None
+
+        # Each block header or "Title:" closes the current result; a non-empty
+        # title opens the next one, which the other labelled lines fill in
+        for match in _FIELD_RE.finditer(observation):
+            header, field, value = match.groups()
+            if header is not None:
+                flush()
+            elif field == "Title":
+                flush()
+                if value:
+                    pending = {"title": value, "url": "", "snippet": ""}
+            elif pending is None:
+                continue
+            elif field in ("URL", "Link"):
+                pending["url"] = self._normalize_url(value)
+            elif field is not None:
+                pending["snippet"] = value
+            elif not pending["snippet"] and len(value) > 20:
+                # Capture any descriptive text as snippet
+                pending["snippet"] = value
+        flush()
 
         logger.debug("Parsed search results", count=len(results))
         return results
 
-    def _assess_credibility(self, url: str) -> SourceCredibility:
-        """Assess source credibility based on URL domain."""
-        high_credibility_domains = [
-            "wikipedia.org",
-            "nasa.gov",
-            ".gov",
-            ".edu",
-            "nature.com",
-            "sciencedirect.com",
-            "ieee.org",
-            "microsoft.com",
-            "google.com",
-            "github.com",
-            "stackoverflow.com",
-            "mozilla.org",
-            "python.org",
-        ]
-        medium_credibility_domains = [
-            "medium.com",
-            "dev.to",
-            "bbc.com",
-            "cnn.com",
-            "reuters.com",
-            "techcrunch.com",
-            "wired.com",
-        ]
-
-        url_lower = url.lower()
-
-        for domain in high_credibility_domains:
-            if domain in url_lower:
-                return SourceCredibility.HIGH
-
-        for domain in medium_credibility_domains:
-            if domain in url_lower:
-                return SourceCredibility.MEDIUM
-
-        return SourceCredibility.MEDIUM
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Reconstruct a full URL from a possibly scheme-less one."""
+        if url.startswith("/"):
+            return "https:" + url
+        if not url.startswith("http"):
+            return "https://" + url
+        return url
 
     def _extract_key_findings(self, agent_response: dict[str, Any]) -> list[str]:
         """Extract key findings from the agent response."""
-        output = agent_response.get("output", "")
-        findings: list[str] = []
+        output = _output_text(agent_response.get("output", ""))
 
         # Extract bullet points and numbered lists
-        lines = output.split("\n")
-        for line in lines:
-            line = line.strip()
-            # Match bullet points or numbered items
-            if (
-                line.startswith("-")
-                or line.startswith("•")
-                or line.startswith("*")
-                or line.startswith("→")
-                or line.startswith("✓")
-                or line.startswith("►")
-                or (len(line) > 2 and line[0].isdigit() and line[1] in ".):-")
-            ):
-                # Remove leading bullet/number characters one by one
-                chars_to_strip = set("-•*→✓►0123456789.):- ")
-                finding = line
-                while finding and finding[0] in chars_to_strip:
-                    finding = finding[1:]
-                finding = finding.strip()
-                if finding and len(finding) > 15:
-                    findings.append(finding)
+        findings = [item for item in _BULLET_RE.findall(output) if len(item) > 15]
 
         # If no bullet points found, try to extract key sentences
         if not findings:
             # Split by periods but keep sentence structure
-            sentences = output.replace("\n", " ").split(". ")
-            key_indicators = [
-                "important",
-                "key",
-                "best",
-                "recommend",
-                "should",
-                "must",
-                "first",
-                "principal",
-                "main",
-                "primary",
-                "essential",
-                "importante",
-                "clave",
-                "mejor",
-                "recomienda",
-                "debe",
-                "primero",
-                "principal",
-                "esencial",
-                "fundamental",
-            ]
-            for s in sentences:
-                s = s.strip()
-                if len(s) > 30 and any(kw in s.lower() for kw in key_indicators):
-                    findings.append(s + "." if not s.endswith(".") else s)
-                    if len(findings) >= 5:
-                        break
-
-        # If still no findings, extract first meaningful sentences
-        if not findings and len(output) > 100:
-            sentences = output.replace("\n", " ").split(". ")
-            for s in sentences[:5]:
-                s = s.strip()
-                if len(s) > 40:
-                    findings.append(s + "." if not s.endswith(".") else s)
+            text = output.replace("\n", " ")
+            parts = text.split(". ")
+            sentences = [s.strip() for s in parts]
+
+            # One keyword scan over the whole text; each match is mapped back to
+            # its sentence through the sentence start offsets
+            starts = list(accumulate((len(s) + 2 for s in parts[:-1]), initial=0))
+            key_sentences = {
+                bisect_right(starts, match.start()) - 1
+                for match in _KEY_INDICATOR_RE.finditer(text)
+            }
+            findings = [
+                s if s.endswith(".") else s + "."
+                for i, s in enumerate(sentences)
+                if i in key_sentences and len(s) > 30
+            ][:5]
+
+            # If still no findings, extract first meaningful sentences
+            if not findings and len(output) > 100:
+                findings = [s if s.endswith(".") else s + "." for s in sentences[:5] if len(s) > 40]
 
         logger.debug("Extracted findings", count=len(findings))
         return findings[:10]  # Limit to 10 findings
 
-    def _calculate_confidence(
-        self,
-        search_results: list[SearchResult],
-        key_findings: list[str],
-    ) -> float:
+    @staticmethod
+    def _calculate_confidence(source_count: int, finding_count: int, high_cred_count: int) -> float:
         """Calculate confidence score based on research quality."""
-        score = 0.0
-
-        # Base score for completing research (0.3)
-        if search_results or key_findings:
-            score += 0.3
-
-        # Source quantity (max 0.35) - more generous scoring
-        source_count = len(search_results)
-        score += min(source_count * 0.07, 0.35)
-
-        # Findings quantity (max 0.25)
-        finding_count = len(key_findings)
-        score += min(finding_count * 0.05, 0.25)
-
-        # Source credibility bonus (max 0.1)
-        high_cred_count = sum(1 for r in search_results if r.credibility == SourceCredibility.HIGH)
-        score += min(high_cred_count * 0.03, 0.1)
-
-        return min(score, 1.0)
+        return min(
+            1.0,
+            # Base score for completing research (0.3)
+            (0.3 if source_count or finding_count else 0.0)
+            # Source quantity (max 0.35) - more generous scoring
+            + min(source_count * 0.07, 0.35)
+            # Findings quantity (max 0.25)
+            + min(finding_count * 0.05, 0.25)
+            # Source credibility bonus (max 0.1)
+            + min(high_cred_count * 0.03, 0.1),
+        )
 
     async def generate_report(
         self,
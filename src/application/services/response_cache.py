@@ -0,0 +1,94 @@
+"""
+Response Cache - Exact-match cache for completed research.
+
+Stores the findings of successful research runs so that repeated
+requests can be answered without re-running the agent loop.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import structlog
+
+from src.domain.entities.research import SearchResult
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResearch:
+    """Findings of a previously completed research run."""
+
+    search_results: tuple[SearchResult, ...]
+    key_findings: tuple[str, ...]
+    synthesis: str
+    confidence_score: float
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of research findings.
+
+    Keys are opaque request fingerprints built by the research agent;
+    the least recently used entry is evicted once the cache is full, and
+    entries older than the TTL are treated as misses.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float | None = None) -> None:
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries: Maximum number of cached research results
+            ttl_seconds: Lifetime of a cached result (None keeps results until evicted)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, CachedResearch]] = OrderedDict()
+
+    def get(self, key: str) -> CachedResearch | None:
+        """
+        Look up cached findings.
+
+        Args:
+            key: Request fingerprint
+
+        Returns:
+            The cached findings, or None on a miss
+        """
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+
+        expires_at, value = cached
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: CachedResearch) -> None:
+        """
+        Store findings for a request fingerprint.
+
+        Args:
+            key: Request fingerprint
+            value: Findings to cache
+        """
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            logger.debug("Evicted cached research", max_entries=self.max_entries)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
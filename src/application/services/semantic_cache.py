@@ -0,0 +1,130 @@
+"""
+Semantic Cache - Embedding-based cache for paraphrased research requests.
+
+Sits above the exact-match response cache: when a question is worded
+differently but means the same thing as one answered before, the
+previous findings are reused instead of running the agent again.
+"""
+
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import structlog
+from langchain_core.embeddings import Embeddings
+
+from src.application.services.response_cache import CachedResearch
+from src.application.services.vectors import normalize, quantize, similarity
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _SemanticEntry:
+    """A cached question embedding (int8 quantized) and the findings it produced."""
+
+    vector: Sequence[int]
+    scope: str
+    value: CachedResearch
+    expires_at: float
+
+
+class SemanticCache:
+    """
+    Cache of research findings looked up by question similarity.
+
+    Questions are embedded and compared by cosine similarity against
+    previously answered ones. Only entries with the same scope (query
+    type, context, keywords, ...) are eligible, so paraphrase matching
+    applies to the question alone.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """
+        Initialize the semantic cache.
+
+        Args:
+            embeddings: Embedding model used to vectorize questions
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached questions (oldest evicted)
+            ttl_seconds: Lifetime of a cached result (None keeps results until evicted)
+        """
+        self._embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: deque[_SemanticEntry] = deque(maxlen=max_entries)
+
+    @property
+    def embeddings(self) -> Embeddings:
+        """The embedding model used for lookup."""
+        return self._embeddings
+
+    async def embed(self, question: str) -> tuple[float, ...]:
+        """
+        Embed a question for lookup and storage.
+
+        Args:
+            question: The research question
+
+        Returns:
+            Unit-length embedding vector
+        """
+        return normalize(await self._embeddings.aembed_query(question))
+
+    def get(self, vector: tuple[float, ...], scope: str) -> CachedResearch | None:
+        """
+        Find cached findings for the most similar question in scope.
+
+        Args:
+            vector: Embedding returned by embed()
+            scope: Exact-match part of the request (query type, context, ...)
+
+        Returns:
+            The cached findings, or None if no question is similar enough
+        """
+        best: _SemanticEntry | None = None
+        best_similarity = self.threshold
+        now = time.monotonic()
+
+        for entry in self._entries:
+            if entry.scope != scope or now >= entry.expires_at:
+                continue
+            score = similarity(vector, entry.vector)
+            if score >= best_similarity:
+                best, best_similarity = entry, score
+
+        if best is None:
+            return None
+
+        logger.debug("Semantic cache hit", similarity=round(best_similarity, 4))
+        return best.value
+
+    def put(self, vector: tuple[float, ...], scope: str, value: CachedResearch) -> None:
+        """
+        Store findings for an embedded question.
+
+        Args:
+            vector: Embedding returned by embed()
+            scope: Exact-match part of the request
+            value: Findings to cache
+        """
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else float("inf")
+        self._entries.append(
+            _SemanticEntry(vector=quantize(vector), scope=scope, value=value, expires_at=expires_at)
+        )
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -7,19 +7,145 @@ ensuring research history is preserved between sessions.
 Author: Danilo Viteri
 """
 
-import json
+import atexit
+import heapq
+import re
 import sqlite3
-from dataclasses import dataclass
+import threading
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
+from langchain_core.embeddings import Embeddings
+
+try:  # Optional faster JSON codec for stored metadata
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize with orjson; non-string keys are stringified like json.dumps."""
+        return _orjson_dumps(obj, option=OPT_NON_STR_KEYS).decode()
+
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import dumps as _json_dumps
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+from src.application.services.vectors import normalize, pack, quantize, similarity, unpack
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
 
 logger = structlog.get_logger(__name__)
 
+# Number of most recent entries searched when looking up relevant context
+CONTEXT_WINDOW = 20
+
+# Number of distinct relevant-context lookups cached per memory version
+CONTEXT_CACHE_SIZE = 128
+
+# Characters of a previous response included as relevant context
+FINDING_PREVIEW_CHARS = 500
+
+# Minimum cosine similarity for an entry to count as relevant context
+MIN_SIMILARITY = 0.5
+
+# Group commit: with a write delay, interactions are queued and written together
+# once it elapses, or as soon as this many are waiting
+WRITE_BATCH_SIZE = 32
+
+# Per-connection tuning. With WAL, synchronous=NORMAL only syncs on checkpoints
+# and readers never block the writer
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=30000000",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Stored metadata of interactions that have none (the column default)
+_EMPTY_METADATA = "{}"
+
+# Insert statement shared by immediate and group-committed writes; the shared
+# connection's statement cache keeps it prepared
+_INSERT_SQL = """
+    INSERT INTO memory_entries (query, response, timestamp, metadata, embedding, embedding_model)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+# The newest ? rows, returned in chronological order by SQLite
+_RECENT_SQL = """
+    SELECT id, query, response, timestamp, metadata
+    FROM (
+        SELECT id, query, response, timestamp, metadata
+        FROM memory_entries
+        ORDER BY timestamp DESC, id DESC
+        LIMIT ?
+    )
+    ORDER BY timestamp ASC, id ASC
+"""
+
+# Managers whose queued writes must reach the database before the process exits
+_open_managers: "weakref.WeakSet[SQLiteMemoryManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers() -> None:
+    """Write out interactions still queued when the interpreter shuts down."""
+    for manager in list(_open_managers):
+        if manager._pending:
+            manager.flush()
+
+
+# Word characters, as split by the FTS5 unicode61 tokenizer
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=512)
+def _tokenize(text: str) -> frozenset[str]:
+    """Split text into the lowercase token set used for relevance scoring."""
+    return frozenset(text.lower().split())
+
+
+def _match_expression(keyword: str) -> str:
+    """
+    Build an FTS5 query matching entries that contain every word of a keyword.
+
+    Each word is quoted (so FTS5 operators in user input are taken literally)
+    and prefix-matched, so "fast" still finds "FastAPI".
+    """
+    return " ".join(f'"{word}"*' for word in _WORD_RE.findall(keyword))
+
+
+def _parse_metadata(raw: str | None) -> dict[str, Any]:
+    """Decode stored metadata; the common empty case skips the JSON parser."""
+    if not raw or raw == _EMPTY_METADATA:
+        return {}
+    metadata: dict[str, Any] = _json_loads(raw)
+    return metadata
+
+
+def _to_micros(moment: datetime) -> int:
+    """Encode a datetime as the integer microseconds stored in the database."""
+    return round(moment.timestamp() * 1_000_000)
+
+
+def _from_micros(micros: int) -> datetime:
+    """Decode a stored timestamp back into a (local, naive) datetime."""
+    return datetime.fromtimestamp(micros / 1_000_000)
+
+
+def _iso_to_micros(value: str) -> int:
+    """Convert an ISO-8601 timestamp written by older versions."""
+    return _to_micros(datetime.fromisoformat(value))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MemoryEntry:
     """A single entry in the agent's memory."""
 
@@ -28,6 +154,11 @@ class MemoryEntry:
     response: str
     timestamp: datetime
     metadata: dict[str, Any]
+    query_tokens: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Tokenize the query once so relevance scoring never re-splits it."""
+        object.__setattr__(self, "query_tokens", _tokenize(self.query))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -52,6 +183,10 @@ class SQLiteMemoryManager:
         self,
         db_path: str = "./data/memory.db",
         max_entries: int = 100,
+        embeddings: Embeddings | None = None,
+        min_similarity: float = MIN_SIMILARITY,
+        write_delay: float = 0.0,
+        embedding_model: str | None = None,
     ) -> None:
         """
         Initialize the SQLite memory manager.
@@ -59,9 +194,75 @@ class SQLiteMemoryManager:
         Args:
             db_path: Path to the SQLite database file
             max_entries: Maximum entries to keep (older ones are pruned)
+            embeddings: Optional embedding model for semantic context lookup;
+                keyword matching is used when not provided
+            min_similarity: Minimum cosine similarity for semantic matches
+            write_delay: Seconds new interactions may wait to be written together
+                with later ones; other connections to the database only see them
+                once written (0 writes each interaction immediately)
+            embedding_model: Identifier of the embedding model, stored with each
+                vector; vectors stored by another model are ignored. Defaults to
+                the model's `model` attribute or class name
         """
         self.db_path = Path(db_path)
         self.max_entries = max_entries
+        self._embeddings = embeddings
+        self.embedding_model = (
+            embedding_model or str(getattr(embeddings, "model", None) or type(embeddings).__name__)
+            if embeddings is not None
+            else None
+        )
+        self.min_similarity = min_similarity
+
+        # Recent context window as a fixed-size ring buffer of slots plus an
+        # inverted index over it (token -> slots), loaded lazily on first lookup.
+        # Each field is kept in its own array so scoring only touches what it
+        # needs, and context is formatted without going back to the database.
+        # Every token in the window is interned to a bit position, so a slot's
+        # token set is also an int bitset and overlap is an AND plus popcount
+        self._window_size = max(1, min(CONTEXT_WINDOW, max_entries))
+        self._slot_queries: list[str] = [""] * self._window_size
+        self._slot_findings: list[str] = [""] * self._window_size
+        self._slot_tokens: list[frozenset[str]] = [frozenset()] * self._window_size
+        self._slot_signatures: list[int] = [0] * self._window_size
+        self._slot_vectors: list[Sequence[int] | None] = [None] * self._window_size
+        self._head = 0
+        self._count = 0
+        self._index: dict[str, set[int]] = {}
+        self._token_bits: dict[str, int] = {}
+        self._free_bits: list[int] = []
+        self._index_loaded = False
+
+        # Guards the window so interactions can be stored from worker threads
+        self._window_lock = threading.Lock()
+
+        # One connection shared by all calls (opened lazily); the lock
+        # serializes its use across threads
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+
+        # Full-text index for search_memory; False if SQLite lacks FTS5
+        self._fts_enabled = False
+
+        # Rows in the table, counted once at startup and then tracked on every
+        # write so len() needs no query. Writes from other processes are not seen
+        self._entry_count = 0
+
+        # Interactions waiting for the next group commit. Every database access
+        # writes them first, so reads always see them
+        self.write_delay = write_delay
+        self._pending: list[tuple[Any, ...]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        _open_managers.add(self)
+
+        # Relevant-context results keyed by (query, max_entries, version); the
+        # version changes on every write so stale results are never returned
+        self._version = 0
+        self._cached_context = lru_cache(maxsize=CONTEXT_CACHE_SIZE)(self._build_relevant_context)
+        # Embeddings of looked-up queries, so repeated lookups skip the model
+        self._cached_embedding = lru_cache(maxsize=CONTEXT_CACHE_SIZE)(self._embed)
+
         self._ensure_db_exists()
         logger.info(
             "SQLiteMemoryManager initialized",
@@ -69,165 +270,530 @@ class SQLiteMemoryManager:
             max_entries=max_entries,
         )
 
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it with the tuned pragmas on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                self._conn.execute(pragma)
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> "Iterator[sqlite3.Connection]":
+        """Use the shared connection exclusively; commits on success, rolls back on error."""
+        with self._db_lock:
+            conn = self._get_conn()
+            try:
+                self._write_pending(conn)
+            except sqlite3.Error as e:
+                # The rows stay queued; a failed write must not fail an unrelated read
+                logger.warning("Failed to write queued interactions", error=str(e))
+            with conn:
+                yield conn
+
+    def _write_pending(self, conn: sqlite3.Connection) -> None:
+        """Insert all queued interactions in one transaction (db lock held).
+
+        On failure the rows are queued again, ahead of newer ones, and the
+        error is raised.
+        """
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        if not rows:
+            return
+
+        try:
+            # Committed on its own so a failing read cannot roll the writes back
+            with conn:
+                conn.executemany(_INSERT_SQL, rows)
+        except BaseException:
+            with self._pending_lock:
+                self._pending[:0] = rows
+                if self.write_delay > 0:
+                    self._schedule_flush()
+            raise
+        with self._pending_lock:
+            # The prune trigger keeps the table at max_entries rows
+            self._entry_count = min(self._entry_count + len(rows), self.max_entries)
+        logger.debug("Wrote queued interactions", count=len(rows))
+
+    def _schedule_flush(self) -> None:
+        """Start the group-commit timer unless one is running (pending lock held)."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.write_delay, self._flush_queued)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_queued(self) -> None:
+        """Write the queue, leaving it for a later retry on failure."""
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            logger.warning(
+                "Failed to write queued interactions, will retry",
+                error=str(e),
+                pending=len(self._pending),
+            )
+
+    def flush(self) -> None:
+        """
+        Write queued interactions to the database now.
+
+        Raises:
+            sqlite3.Error: If the write fails; the interactions stay queued
+        """
+        with self._db_lock:
+            self._write_pending(self._get_conn())
+
+    def close(self) -> None:
+        """Write queued interactions and close the connection; it reopens on next use."""
+        with self._db_lock:
+            try:
+                if self._conn is not None or self._pending:
+                    self._write_pending(self._get_conn())
+            finally:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
     def _ensure_db_exists(self) -> None:
         """Create database and tables if they don't exist."""
         # Create directory if needed
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
+            # Both settings persist in the database file; auto_vacuum only
+            # applies to databases created from here on
+            cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            cursor.execute("PRAGMA journal_mode=WAL")
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS memory_entries (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     query TEXT NOT NULL,
                     response TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     metadata TEXT DEFAULT '{}'
                 )
             """)
+
+            # Databases created before semantic lookup lack the embedding column
+            cursor.execute("PRAGMA table_info(memory_entries)")
+            columns = {row[1]: row[2] for row in cursor.fetchall()}
+            if "embedding" not in columns:
+                cursor.execute("ALTER TABLE memory_entries ADD COLUMN embedding BLOB")
+            # Older rows have no model id; their vectors are never compared
+            if "embedding_model" not in columns:
+                cursor.execute("ALTER TABLE memory_entries ADD COLUMN embedding_model TEXT")
+            if columns["timestamp"] == "TEXT":
+                self._migrate_text_timestamps(conn)
+
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_timestamp
                 ON memory_entries(timestamp DESC)
             """)
-            conn.commit()
+
+            # Prune inside every insert: anything older than the newest
+            # max_entries rows goes (ids grow with insertion order). Recreated
+            # on startup because the limit is baked into the trigger
+            cursor.execute("DROP TRIGGER IF EXISTS trim_memory")
+            cursor.execute(f"""
+                CREATE TRIGGER trim_memory AFTER INSERT ON memory_entries
+                BEGIN
+                    DELETE FROM memory_entries
+                    WHERE id <= (
+                        SELECT id FROM memory_entries
+                        ORDER BY id DESC
+                        LIMIT 1 OFFSET {int(self.max_entries)}
+                    );
+                END
+            """)
+
+            self._fts_enabled = self._ensure_fts_index(conn)
+            self._entry_count = int(
+                cursor.execute("SELECT COUNT(*) FROM memory_entries").fetchone()[0]
+            )
+
+    @staticmethod
+    def _ensure_fts_index(conn: sqlite3.Connection) -> bool:
+        """
+        Create the FTS5 index over queries and responses, kept in sync by triggers.
+
+        Returns:
+            True if the index is available, False if SQLite was built without FTS5
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_fts'"
+        ).fetchone()
+        if not exists:
+            try:
+                conn.execute("""
+                    CREATE VIRTUAL TABLE memory_fts USING fts5(
+                        query, response,
+                        content='memory_entries', content_rowid='id',
+                        tokenize='unicode61'
+                    )
+                """)
+            except sqlite3.OperationalError as e:
+                logger.warning("FTS5 unavailable, memory search falls back to LIKE", error=str(e))
+                return False
+            # Index entries stored before the index existed
+            conn.execute("INSERT INTO memory_fts(memory_fts) VALUES ('rebuild')")
+
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memory_fts_insert AFTER INSERT ON memory_entries
+            BEGIN
+                INSERT INTO memory_fts(rowid, query, response)
+                VALUES (new.id, new.query, new.response);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memory_fts_delete AFTER DELETE ON memory_entries
+            BEGIN
+                INSERT INTO memory_fts(memory_fts, rowid, query, response)
+                VALUES ('delete', old.id, old.query, old.response);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memory_fts_update AFTER UPDATE ON memory_entries
+            BEGIN
+                INSERT INTO memory_fts(memory_fts, rowid, query, response)
+                VALUES ('delete', old.id, old.query, old.response);
+                INSERT INTO memory_fts(rowid, query, response)
+                VALUES (new.id, new.query, new.response);
+            END
+        """)
+        return True
+
+    @staticmethod
+    def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+        """Rebuild the table of an older database, storing timestamps as integers."""
+        conn.create_function("iso_to_micros", 1, _iso_to_micros, deterministic=True)
+        # Left over if a previous migration was interrupted
+        conn.execute("DROP TABLE IF EXISTS memory_entries_new")
+        conn.execute("""
+            CREATE TABLE memory_entries_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT NOT NULL,
+                response TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                metadata TEXT DEFAULT '{}',
+                embedding BLOB,
+                embedding_model TEXT
+            )
+        """)
+        conn.execute("""
+            INSERT INTO memory_entries_new
+                (id, query, response, timestamp, metadata, embedding, embedding_model)
+            SELECT id, query, response, iso_to_micros(timestamp), metadata,
+                embedding, embedding_model
+            FROM memory_entries
+        """)
+        conn.execute("DROP TABLE memory_entries")
+        conn.execute("ALTER TABLE memory_entries_new RENAME TO memory_entries")
+        logger.info("Migrated memory timestamps to integer microseconds")
 
     def add_interaction(
         self,
         query: str,
         response: str,
         metadata: dict[str, Any] | None = None,
+        query_vector: tuple[float, ...] | None = None,
+        embed: bool = True,
     ) -> None:
         """
         Add a new interaction to persistent memory.
 
+        With a write delay the row is queued and written together with other
+        interactions arriving within it (group commit); this manager's own
+        lookups and reads see it immediately. A failed group commit is logged
+        and retried; without a write delay the error is raised.
+
         Args:
             query: The user's query
             response: The agent's response
             metadata: Optional metadata about the interaction
+            query_vector: The query's embedding from aembed(), if already computed
+            embed: Embed the query here when no vector is given; pass False if
+                the caller already tried (e.g. aembed() failed)
+
+        Raises:
+            sqlite3.Error: If writing without a write delay fails; the
+                interaction stays queued for the next database access
         """
-        timestamp = datetime.now().isoformat()
-        metadata_json = json.dumps(metadata or {})
+        timestamp = _to_micros(datetime.now())
+        # Most interactions carry no metadata; store the column default without serializing
+        metadata_json = _json_dumps(metadata) if metadata else _EMPTY_METADATA
+        tokens = _tokenize(query)
+        vector = query_vector if query_vector is not None or not embed else self._embed(query)
+
+        row = (
+            query,
+            response,
+            timestamp,
+            metadata_json,
+            pack(vector) if vector is not None else None,
+            self.embedding_model if vector is not None else None,
+        )
+        # Queue and index under the window lock: a concurrent first lookup then
+        # either loads the row from the database or finds it indexed, never both
+        with self._window_lock:
+            with self._pending_lock:
+                self._pending.append(row)
+                write_now = self.write_delay <= 0 or len(self._pending) >= WRITE_BATCH_SIZE
+                if not write_now:
+                    self._schedule_flush()
+            if self._index_loaded:
+                self._index_entry(query, response[:FINDING_PREVIEW_CHARS], tokens, vector)
+            self._version += 1
+        if write_now and self.write_delay <= 0:
+            # Written synchronously, so a failure reaches the caller
+            self.flush()
+        elif write_now:
+            self._flush_queued()
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO memory_entries (query, response, timestamp, metadata)
-                VALUES (?, ?, ?, ?)
-                """,
-                (query, response, timestamp, metadata_json),
-            )
-            conn.commit()
+        logger.debug("Added interaction to memory", query=query[:50])
 
-            # Prune old entries if exceeding max
-            cursor.execute("SELECT COUNT(*) FROM memory_entries")
-            count = cursor.fetchone()[0]
+    def _embed(self, text: str) -> tuple[float, ...] | None:
+        """Embed text for semantic lookup, or None if unavailable."""
+        if self._embeddings is None:
+            return None
 
-            if count > self.max_entries:
-                excess = count - self.max_entries
-                cursor.execute(
-                    """
-                    DELETE FROM memory_entries
-                    WHERE id IN (
-                        SELECT id FROM memory_entries
-                        ORDER BY timestamp ASC
-                        LIMIT ?
-                    )
-                    """,
-                    (excess,),
-                )
-                conn.commit()
-                logger.debug("Pruned old memory entries", removed=excess)
+        try:
+            return normalize(self._embeddings.embed_query(text))
+        except Exception as e:
+            logger.warning("Failed to embed memory text", error=str(e))
+            return None
 
-        logger.debug("Added interaction to memory", query=query[:50])
+    @property
+    def embeddings(self) -> Embeddings | None:
+        """The embedding model used for semantic lookup, if any."""
+        return self._embeddings
 
-    def get_recent_context(self, n: int = 5) -> list[MemoryEntry]:
+    async def aembed(self, text: str) -> tuple[float, ...] | None:
         """
-        Get the N most recent interactions.
+        Embed text without blocking the event loop.
+
+        The vector can be passed to get_relevant_context() and
+        add_interaction() so a query is embedded only once.
 
         Args:
-            n: Number of recent entries to retrieve
+            text: Text to embed
 
         Returns:
-            List of recent memory entries
+            Unit-length embedding, or None if no model is configured or it fails
         """
-        with sqlite3.connect(self.db_path) as conn:
+        if self._embeddings is None:
+            return None
+
+        try:
+            return normalize(await self._embeddings.aembed_query(text))
+        except Exception as e:
+            logger.warning("Failed to embed memory text", error=str(e))
+            return None
+
+    def _ensure_index(self) -> None:
+        """Load the recent context window into the inverted index if needed."""
+        if self._index_loaded:
+            return
+
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT id, query, response, timestamp, metadata
+                SELECT query, substr(response, 1, ?), embedding, embedding_model
                 FROM memory_entries
-                ORDER BY timestamp DESC
+                ORDER BY timestamp DESC, id DESC
                 LIMIT ?
                 """,
-                (n,),
+                (FINDING_PREVIEW_CHARS, self._window_size),
             )
             rows = cursor.fetchall()
 
-        entries = []
-        for row in reversed(rows):  # Reverse to get chronological order
-            entries.append(
+        for query, finding, embedding, model in reversed(rows):
+            # Vectors from another embedding model aren't comparable with this one's
+            usable = embedding and model is not None and model == self.embedding_model
+            self._index_entry(
+                query, finding, _tokenize(query), unpack(embedding) if usable else None
+            )
+        self._index_loaded = True
+
+    def _index_entry(
+        self,
+        query: str,
+        finding: str,
+        tokens: frozenset[str],
+        vector: tuple[float, ...] | None = None,
+    ) -> None:
+        """Write an entry into the window ring, overwriting the oldest if full."""
+        if self._count == self._window_size:
+            slot = self._head
+            self._unindex_slot(slot)
+            self._head = (self._head + 1) % self._window_size
+        else:
+            slot = (self._head + self._count) % self._window_size
+            self._count += 1
+
+        self._slot_queries[slot] = query
+        self._slot_findings[slot] = finding
+        self._slot_tokens[slot] = tokens
+        self._slot_vectors[slot] = quantize(vector) if vector is not None else None
+        signature = 0
+        for token in tokens:
+            postings = self._index.get(token)
+            if postings is None:
+                postings = self._index[token] = set()
+                self._token_bits[token] = (
+                    self._free_bits.pop() if self._free_bits else len(self._token_bits)
+                )
+            postings.add(slot)
+            signature |= 1 << self._token_bits[token]
+        self._slot_signatures[slot] = signature
+
+    def _unindex_slot(self, slot: int) -> None:
+        """Remove the entry in a slot from every posting list it appears in."""
+        for token in self._slot_tokens[slot]:
+            postings = self._index[token]
+            postings.discard(slot)
+            if not postings:
+                # Last use of the token in the window; its bit can be reused
+                del self._index[token]
+                self._free_bits.append(self._token_bits.pop(token))
+
+    def _slot_age(self, slot: int) -> int:
+        """Position of a slot in the window, 0 being the oldest entry."""
+        return (slot - self._head) % self._window_size
+
+    def get_recent_context(self, n: int = 5) -> list[MemoryEntry]:
+        """
+        Get the N most recent interactions.
+
+        Args:
+            n: Number of recent entries to retrieve
+
+        Returns:
+            List of recent memory entries
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(_RECENT_SQL, (n,))
+            return [
                 MemoryEntry(
                     id=row[0],
                     query=row[1],
                     response=row[2],
-                    timestamp=datetime.fromisoformat(row[3]),
-                    metadata=json.loads(row[4]) if row[4] else {},
+                    timestamp=_from_micros(row[3]),
+                    metadata=_parse_metadata(row[4]),
                 )
-            )
-        return entries
+                for row in cursor
+            ]
 
     def get_relevant_context(
         self,
         query: str,
         max_entries: int = 3,
+        query_tokens: frozenset[str] | None = None,
+        query_vector: tuple[float, ...] | None = None,
+        embed: bool = True,
     ) -> str:
         """
         Get context relevant to the current query.
 
-        Uses keyword matching to find relevant past interactions.
+        Searches the most recent interactions. When an embedding model is
+        configured, entries are ranked by cosine similarity of their stored
+        query embeddings; otherwise (or if embedding the query fails) only
+        entries sharing at least one token with the query (looked up through
+        the inverted index) are scored by keyword overlap.
 
         Args:
             query: The current query to find context for
             max_entries: Maximum number of entries to return
+            query_tokens: The query's lowercase word set, if already computed
+            query_vector: The query's embedding from aembed(), if already computed
+            embed: Embed the query here (a blocking call) when no vector is
+                given; async callers embed with aembed() and pass False
 
         Returns:
             Formatted string of relevant context
         """
-        # Get recent entries to search through
-        recent = self.get_recent_context(n=20)
-
-        if not recent:
-            return ""
-
-        query_words = set(query.lower().split())
-        scored_entries: list[tuple[float, MemoryEntry]] = []
-
-        for entry in recent:
-            entry_words = set(entry.query.lower().split())
-            overlap = len(query_words & entry_words)
-            if overlap > 0:
-                score = overlap / max(len(query_words), len(entry_words))
-                scored_entries.append((score, entry))
+        if query_vector is None and embed:
+            query_vector = self._cached_embedding(query)
+
+        # Embedding happens above, so the lock is only held for scoring
+        with self._window_lock:
+            self._ensure_index()
+            return self._cached_context(
+                query, max_entries, self._version, query_tokens, query_vector
+            )
 
-        scored_entries.sort(key=lambda x: x[0], reverse=True)
-        relevant = scored_entries[:max_entries]
+    def _build_relevant_context(
+        self,
+        query: str,
+        max_entries: int,
+        _version: int,
+        query_tokens: frozenset[str] | None,
+        query_vector: tuple[float, ...] | None,
+    ) -> str:
+        """Score and format relevant context; version only keys the cache."""
+        if query_vector is not None:
+            scored_slots = self._score_semantic(query_vector)
+        else:
+            scored_slots = self._score_lexical(
+                query_tokens if query_tokens is not None else _tokenize(query)
+            )
 
-        if not relevant:
-            return ""
+        # Stable like sorted(), so chronological order still breaks score ties
+        top = heapq.nlargest(max_entries, scored_slots, key=lambda x: x[0])
 
-        context_parts = []
-        for _score, entry in relevant:
-            context_parts.append(
-                f"Previous Query: {entry.query}\nPrevious Finding: {entry.response[:500]}..."
-            )
+        return "\n\n".join(
+            f"Previous Query: {self._slot_queries[slot]}\n"
+            f"Previous Finding: {self._slot_findings[slot]}..."
+            for _score, slot in top
+        )
 
-        return "\n\n".join(context_parts)
+    def _score_semantic(self, query_vector: tuple[float, ...]) -> list[tuple[float, int]]:
+        """Score window slots by cosine similarity to the query embedding."""
+        scored_slots: list[tuple[float, int]] = []
+        dimensions = len(query_vector)
+        for age in range(self._count):  # Chronological order breaks score ties
+            slot = (self._head + age) % self._window_size
+            vector = self._slot_vectors[slot]
+            if vector is None or len(vector) != dimensions:
+                continue
+            score = similarity(query_vector, vector)
+            if score >= self.min_similarity:
+                scored_slots.append((score, slot))
+        return scored_slots
+
+    def _score_lexical(self, query_words: frozenset[str]) -> list[tuple[float, int]]:
+        """Score window slots sharing tokens with the query by keyword overlap."""
+        query_signature = 0
+        for word in query_words:
+            bit = self._token_bits.get(word)
+            if bit is not None:
+                query_signature |= 1 << bit
+        candidates = set().union(*(self._index.get(word, ()) for word in query_words))
+
+        scored_slots: list[tuple[float, int]] = []
+        # Chronological order breaks score ties
+        for slot in sorted(candidates, key=self._slot_age):
+            overlap = (query_signature & self._slot_signatures[slot]).bit_count()
+            score = overlap / max(len(query_words), len(self._slot_tokens[slot]))
+            scored_slots.append((score, slot))
+        return scored_slots
 
     def search_memory(self, keyword: str, limit: int = 10) -> list[MemoryEntry]:
         """
         Search memory entries by keyword.
 
+        Uses the full-text index when available: entries containing every
+        word of the keyword (as a word prefix) are returned best match first
+        by BM25. Without FTS5, entries containing the keyword as a substring
+        are returned newest first.
+
         Args:
             keyword: Keyword to search for
             limit: Maximum results to return
@@ -235,18 +801,32 @@ class SQLiteMemoryManager:
         Returns:
             List of matching memory entries
         """
-        with sqlite3.connect(self.db_path) as conn:
+        match = _match_expression(keyword)
+        with self._transaction() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT id, query, response, timestamp, metadata
-                FROM memory_entries
-                WHERE query LIKE ? OR response LIKE ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (f"%{keyword}%", f"%{keyword}%", limit),
-            )
+            if self._fts_enabled and match:
+                cursor.execute(
+                    """
+                    SELECT m.id, m.query, m.response, m.timestamp, m.metadata
+                    FROM memory_fts f
+                    JOIN memory_entries m ON m.id = f.rowid
+                    WHERE memory_fts MATCH ?
+                    ORDER BY bm25(memory_fts)
+                    LIMIT ?
+                    """,
+                    (match, limit),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT id, query, response, timestamp, metadata
+                    FROM memory_entries
+                    WHERE query LIKE ? OR response LIKE ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                    """,
+                    (f"%{keyword}%", f"%{keyword}%", limit),
+                )
             rows = cursor.fetchall()
 
         return [
@@ -254,61 +834,83 @@ class SQLiteMemoryManager:
                 id=row[0],
                 query=row[1],
                 response=row[2],
-                timestamp=datetime.fromisoformat(row[3]),
-                metadata=json.loads(row[4]) if row[4] else {},
+                timestamp=_from_micros(row[3]),
+                metadata=_parse_metadata(row[4]),
             )
             for row in rows
         ]
 
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of the current memory state."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM memory_entries")
-            total = cursor.fetchone()[0]
-
-            cursor.execute("SELECT timestamp FROM memory_entries ORDER BY timestamp ASC LIMIT 1")
-            oldest = cursor.fetchone()
-
-            cursor.execute("SELECT timestamp FROM memory_entries ORDER BY timestamp DESC LIMIT 1")
-            newest = cursor.fetchone()
+        with self._transaction() as conn:
+            total, oldest, newest = conn.execute(
+                "SELECT COUNT(*), MIN(timestamp), MAX(timestamp) FROM memory_entries"
+            ).fetchone()
+            # Size of the main database file, without a filesystem call
+            (db_size,) = conn.execute(
+                "SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()"
+            ).fetchone()
 
         return {
             "total_entries": total,
             "max_entries": self.max_entries,
-            "oldest_entry": oldest[0] if oldest else None,
-            "newest_entry": newest[0] if newest else None,
+            "oldest_entry": _from_micros(oldest).isoformat() if oldest is not None else None,
+            "newest_entry": _from_micros(newest).isoformat() if newest is not None else None,
             "db_path": str(self.db_path),
-            "db_size_kb": round(self.db_path.stat().st_size / 1024, 2)
-            if self.db_path.exists()
-            else 0,
+            "db_size_kb": round(db_size / 1024, 2),
         }
 
     def clear(self) -> None:
         """Clear all memory entries."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pending_lock:
+            # Queued interactions would only be deleted again
+            self._pending.clear()
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM memory_entries")
             conn.commit()
+            self._entry_count = 0
+            # Run to completion; a plain execute() frees a single page
+            conn.executescript("PRAGMA incremental_vacuum;")
+
+        with self._window_lock:
+            self._slot_queries = [""] * self._window_size
+            self._slot_findings = [""] * self._window_size
+            self._slot_tokens = [frozenset()] * self._window_size
+            self._slot_signatures = [0] * self._window_size
+            self._slot_vectors = [None] * self._window_size
+            self._head = 0
+            self._count = 0
+            self._index.clear()
+            self._token_bits.clear()
+            self._free_bits.clear()
+            self._version += 1
+            self._index_loaded = True
         logger.info("Memory cleared")
 
     def to_list(self) -> list[dict[str, Any]]:
-        """Convert all entries to a list of dictionaries."""
-        entries = self.get_recent_context(n=self.max_entries)
-        return [entry.to_dict() for entry in entries]
+        """Convert all entries to a list of dictionaries (same shape as MemoryEntry.to_dict)."""
+        # Rows go straight to dicts; no MemoryEntry is built only to be converted back
+        with self._transaction() as conn:
+            cursor = conn.execute(_RECENT_SQL, (self.max_entries,))
+            return [
+                {
+                    "id": row[0],
+                    "query": row[1],
+                    "response": row[2],
+                    "timestamp": _from_micros(row[3]).isoformat(),
+                    "metadata": _parse_metadata(row[4]),
+                }
+                for row in cursor
+            ]
 
     def __len__(self) -> int:
-        """Return the number of entries in memory."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM memory_entries")
-            result = cursor.fetchone()
-            return int(result[0]) if result else 0
+        """Return the number of stored entries (tracked, no database access)."""
+        return self._entry_count
 
     def __bool__(self) -> bool:
         """Return True if memory has entries."""
-        return len(self) > 0
+        return self._entry_count > 0
 
 
 # Alias for backward compatibility
@@ -0,0 +1,55 @@
+"""
+Vector helpers - Small utilities for comparing and storing embeddings.
+
+Embeddings are kept as unit-length tuples so that cosine similarity is
+a plain dot product. Vectors that are stored for later comparison can be
+quantized to int8 components, a compact array instead of one Python float
+object per dimension.
+"""
+
+import math
+from array import array
+from collections.abc import Sequence
+
+# Scale mapping unit-vector components in [-1, 1] onto the int8 range
+INT8_SCALE = 127
+
+
+def normalize(vector: Sequence[float]) -> tuple[float, ...]:
+    """Scale a vector to unit length so dot products are cosine similarities."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return tuple(vector)
+    return tuple(x / norm for x in vector)
+
+
+def dot(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Dot product of two vectors (cosine similarity for unit vectors).
+
+    Raises:
+        ValueError: If the vectors differ in length (e.g. come from different models)
+    """
+    return sum(x * y for x, y in zip(a, b, strict=True))
+
+
+def pack(vector: Sequence[float]) -> bytes:
+    """Serialize a vector as packed float32 values for storage."""
+    return array("f", vector).tobytes()
+
+
+def unpack(blob: bytes) -> tuple[float, ...]:
+    """Deserialize a vector stored with pack()."""
+    values = array("f")
+    values.frombytes(blob)
+    return tuple(values)
+
+
+def quantize(vector: Sequence[float]) -> Sequence[int]:
+    """Quantize a unit vector to int8 components for compact in-memory storage."""
+    return array("b", [max(-INT8_SCALE, min(INT8_SCALE, round(x * INT8_SCALE))) for x in vector])
+
+
+def similarity(query: Sequence[float], quantized: Sequence[int]) -> float:
+    """Cosine similarity between a unit vector and a quantize()d one."""
+    return dot(query, quantized) / INT8_SCALE
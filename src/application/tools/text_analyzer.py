@@ -5,6 +5,8 @@ This tool provides text analysis capabilities including summarization,
 key point extraction, and sentiment analysis using the LLM.
 """
 
+import re
+from collections.abc import Callable
 from enum import StrEnum
 from typing import Any
 
@@ -15,6 +17,82 @@ from pydantic import BaseModel, Field
 
 logger = structlog.get_logger(__name__)
 
+# LLM prompt per analysis type; {text} is replaced with the text to analyze
+_PROMPT_TEMPLATES: dict[str, str] = {
+    "summarize": "Provide a concise summary of the following text in 2-3 sentences:\n\n{text}",
+    "key_points": "Extract the key points from the following text as a bulleted list:\n\n{text}",
+    "sentiment": (
+        "Analyze the sentiment of the following text. "
+        "Indicate if it's positive, negative, or neutral, "
+        "and explain why:\n\n{text}"
+    ),
+    "technical_terms": (
+        "Identify and explain the technical terms used in the following text:\n\n{text}"
+    ),
+    "pros_cons": "List the pros and cons discussed or implied in the following text:\n\n{text}",
+}
+_DEFAULT_PROMPT = "Analyze the following text:\n\n{text}"
+
+# Word lists for the rule-based fallback
+_KEY_INDICATORS = frozenset(
+    {
+        "important",
+        "key",
+        "main",
+        "critical",
+        "essential",
+        "primary",
+        "significant",
+        "must",
+        "should",
+    }
+)
+_POSITIVE_WORDS = frozenset(
+    {
+        "good",
+        "great",
+        "excellent",
+        "best",
+        "amazing",
+        "wonderful",
+        "fantastic",
+        "love",
+        "like",
+        "helpful",
+        "useful",
+        "benefit",
+    }
+)
+_NEGATIVE_WORDS = frozenset(
+    {
+        "bad",
+        "poor",
+        "worst",
+        "terrible",
+        "hate",
+        "dislike",
+        "problem",
+        "issue",
+        "difficult",
+        "fail",
+        "error",
+        "wrong",
+    }
+)
+_TECH_PATTERNS = frozenset({"API", "SDK", "HTTP", "JSON", "SQL", "REST", "GraphQL"})
+_PRO_INDICATORS = ("advantage", "benefit", "pro", "good", "strength")
+_CON_INDICATORS = ("disadvantage", "drawback", "con", "issue", "weakness")
+
+_WORD_RE = re.compile(r"[a-z]+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+# All-caps words of 3+ characters (acronyms) plus the known mixed-case terms
+_TECH_TERM_RE = re.compile(rf"\b(?:[A-Z][A-Z0-9]{{2,}}|{'|'.join(sorted(_TECH_PATTERNS))})\b")
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text into sentences, keeping their closing punctuation."""
+    return _SENTENCE_RE.split(text.replace("\n", " ").strip())
+
 
 class AnalysisType(StrEnum):
     """Types of text analysis available."""
@@ -39,6 +117,80 @@ class TextAnalysisInput(BaseModel):
     )
 
 
+def _summarize(text: str) -> str:
+    """Simple extractive summary - first and last sentences."""
+    sentences = _split_sentences(text)
+    if len(sentences) <= 3:
+        return text
+    return f"Summary: {sentences[0]} {sentences[-1]}"
+
+
+def _key_points(text: str) -> str:
+    """Extract sentences with key indicators."""
+    sentences = _split_sentences(text)
+    key_points = []
+    for sentence in sentences:
+        if any(ind in sentence.lower() for ind in _KEY_INDICATORS):
+            key_points.append(f"• {sentence.strip()}")
+    if not key_points:
+        # Just take first 3 sentences
+        key_points = [f"• {s.strip()}" for s in sentences[:3]]
+    return "Key Points:\n" + "\n".join(key_points[:5])
+
+
+def _sentiment(text: str) -> str:
+    """Simple sentiment based on positive/negative word counts."""
+    words = _WORD_RE.findall(text.lower())
+    pos_count = sum(1 for w in words if w in _POSITIVE_WORDS)
+    neg_count = sum(1 for w in words if w in _NEGATIVE_WORDS)
+
+    if pos_count > neg_count * 1.5:
+        sentiment = "Positive"
+    elif neg_count > pos_count * 1.5:
+        sentiment = "Negative"
+    else:
+        sentiment = "Neutral"
+
+    return f"Sentiment: {sentiment} (positive indicators: {pos_count}, negative indicators: {neg_count})"
+
+
+def _technical_terms(text: str) -> str:
+    """Extract capitalized terms and common tech patterns."""
+    terms = set(_TECH_TERM_RE.findall(text))
+    if terms:
+        return "Technical Terms Found: " + ", ".join(sorted(terms))
+    return "No specific technical terms identified."
+
+
+def _pros_cons(text: str) -> str:
+    """Look for pros/cons indicators."""
+    pros = []
+    cons = []
+    for sentence in _split_sentences(text):
+        s_lower = sentence.lower()
+        if any(w in s_lower for w in _PRO_INDICATORS):
+            pros.append(sentence.strip())
+        elif any(w in s_lower for w in _CON_INDICATORS):
+            cons.append(sentence.strip())
+
+    result = []
+    if pros:
+        result.append("Pros:\n" + "\n".join(f"+ {p}" for p in pros[:3]))
+    if cons:
+        result.append("Cons:\n" + "\n".join(f"- {c}" for c in cons[:3]))
+    return "\n\n".join(result) if result else "No clear pros or cons identified."
+
+
+# Rule-based fallback per analysis type (StrEnum keys also match plain strings)
+_RULE_BASED_HANDLERS: dict[str, Callable[[str], str]] = {
+    AnalysisType.SUMMARIZE: _summarize,
+    AnalysisType.KEY_POINTS: _key_points,
+    AnalysisType.SENTIMENT: _sentiment,
+    AnalysisType.TECHNICAL_TERMS: _technical_terms,
+    AnalysisType.PROS_CONS: _pros_cons,
+}
+
+
 class TextAnalyzerTool(BaseTool):
     """
     LangChain tool for analyzing text content.
@@ -68,29 +220,7 @@ class TextAnalyzerTool(BaseTool):
 
     def _get_analysis_prompt(self, text: str, analysis_type: str) -> str:
         """Generate the appropriate analysis prompt."""
-        prompts = {
-            "summarize": (
-                f"Provide a concise summary of the following text in 2-3 sentences:\n\n{text}"
-            ),
-            "key_points": (
-                f"Extract the key points from the following text as a bulleted list:\n\n{text}"
-            ),
-            "sentiment": (
-                f"Analyze the sentiment of the following text. "
-                f"Indicate if it's positive, negative, or neutral, "
-                f"and explain why:\n\n{text}"
-            ),
-            "technical_terms": (
-                f"Identify and explain the technical terms used in the following text:\n\n{text}"
-            ),
-            "pros_cons": (
-                f"List the pros and cons discussed or implied in the following text:\n\n{text}"
-            ),
-        }
-        return prompts.get(
-            analysis_type,
-            f"Analyze the following text:\n\n{text}",
-        )
+        return _PROMPT_TEMPLATES.get(analysis_type, _DEFAULT_PROMPT).format(text=text)
 
     def _run(self, text: str, analysis_type: str = "summarize") -> str:
         """
@@ -129,116 +259,10 @@ class TextAnalyzerTool(BaseTool):
 
     def _rule_based_analysis(self, text: str, analysis_type: str) -> str:
         """Perform rule-based text analysis as fallback."""
-        if analysis_type == "summarize":
-            # Simple extractive summary - first and last sentences
-            sentences = text.replace("\n", " ").split(". ")
-            if len(sentences) <= 3:
-                return text
-            summary = ". ".join([sentences[0], sentences[-1]])
-            return f"Summary: {summary}."
-
-        elif analysis_type == "key_points":
-            # Extract sentences with key indicators
-            sentences = text.replace("\n", " ").split(". ")
-            key_indicators = [
-                "important",
-                "key",
-                "main",
-                "critical",
-                "essential",
-                "primary",
-                "significant",
-                "must",
-                "should",
-            ]
-            key_points = []
-            for sentence in sentences:
-                if any(ind in sentence.lower() for ind in key_indicators):
-                    key_points.append(f"• {sentence.strip()}")
-            if not key_points:
-                # Just take first 3 sentences
-                key_points = [f"• {s.strip()}" for s in sentences[:3]]
-            return "Key Points:\n" + "\n".join(key_points[:5])
-
-        elif analysis_type == "sentiment":
-            # Simple sentiment based on positive/negative word counts
-            positive_words = [
-                "good",
-                "great",
-                "excellent",
-                "best",
-                "amazing",
-                "wonderful",
-                "fantastic",
-                "love",
-                "like",
-                "helpful",
-                "useful",
-                "benefit",
-            ]
-            negative_words = [
-                "bad",
-                "poor",
-                "worst",
-                "terrible",
-                "hate",
-                "dislike",
-                "problem",
-                "issue",
-                "difficult",
-                "fail",
-                "error",
-                "wrong",
-            ]
-            text_lower = text.lower()
-            pos_count = sum(1 for w in positive_words if w in text_lower)
-            neg_count = sum(1 for w in negative_words if w in text_lower)
-
-            if pos_count > neg_count * 1.5:
-                sentiment = "Positive"
-            elif neg_count > pos_count * 1.5:
-                sentiment = "Negative"
-            else:
-                sentiment = "Neutral"
-
-            return f"Sentiment: {sentiment} (positive indicators: {pos_count}, negative indicators: {neg_count})"
-
-        elif analysis_type == "technical_terms":
-            # Extract capitalized terms and common tech patterns
-            words = text.split()
-            tech_patterns = ["API", "SDK", "HTTP", "JSON", "SQL", "REST", "GraphQL"]
-            terms = set()
-            for word in words:
-                clean_word = word.strip(".,!?()[]{}\"'")
-                if (clean_word.isupper() and len(clean_word) > 2) or clean_word in tech_patterns:
-                    terms.add(clean_word)
-            if terms:
-                return "Technical Terms Found: " + ", ".join(sorted(terms))
-            return "No specific technical terms identified."
-
-        elif analysis_type == "pros_cons":
-            text_lower = text.lower()
-            # Look for pros/cons indicators
-            pros = []
-            cons = []
-            sentences = text.replace("\n", " ").split(". ")
-            for sentence in sentences:
-                s_lower = sentence.lower()
-                if any(w in s_lower for w in ["advantage", "benefit", "pro", "good", "strength"]):
-                    pros.append(sentence.strip())
-                elif any(
-                    w in s_lower for w in ["disadvantage", "drawback", "con", "issue", "weakness"]
-                ):
-                    cons.append(sentence.strip())
-
-            result = []
-            if pros:
-                result.append("Pros:\n" + "\n".join(f"+ {p}" for p in pros[:3]))
-            if cons:
-                result.append("Cons:\n" + "\n".join(f"- {c}" for c in cons[:3]))
-            return "\n\n".join(result) if result else "No clear pros or cons identified."
-
-        return f"Analysis type '{analysis_type}' not supported."
+        handler = _RULE_BASED_HANDLERS.get(analysis_type)
+        if handler is None:
+            return f"Analysis type '{analysis_type}' not supported."
+        return handler(text)
 
     async def _arun(self, text: str, analysis_type: str = "summarize") -> str:
         """Execute text analysis asynchronously."""
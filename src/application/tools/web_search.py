@@ -9,13 +9,41 @@ Library: https://pypi.org/project/ddgs/
 """
 
 import asyncio
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 import structlog
+from langchain_core.rate_limiters import BaseRateLimiter
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+try:
+    from ddgs import DDGS
+except ImportError:  # pragma: no cover - depends on the environment
+    DDGS = None  # type: ignore[assignment,misc]
+
 logger = structlog.get_logger(__name__)
 
+_NOT_INSTALLED = "Error: Search functionality not available. Install ddgs: pip install ddgs"
+
+# Maximum number of searches running at once. ddgs is synchronous, so each
+# search blocks a thread on network I/O; a dedicated pool keeps them from
+# queueing behind (or starving) other work on the event loop's default executor
+SEARCH_CONCURRENCY = 16
+_search_executor = ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY, thread_name_prefix="search")
+
+
+@cache
+def _get_ddgs() -> "DDGS":
+    """
+    Return the DDGS client shared by all search tools.
+
+    DDGS keeps one engine instance (with its HTTP session) per backend, so
+    reusing a single client keeps connections alive across searches.
+    """
+    return DDGS()
+
 
 class WebSearchInput(BaseModel):
     """Input schema for web search tool."""
@@ -29,7 +57,51 @@ class WebSearchInput(BaseModel):
     )
 
 
-class WebSearchTool(BaseTool):
+class _SearchTool(BaseTool):
+    """Base of the search tools: paces searches and runs them on the search pool."""
+
+    # Share one limiter between the tools so together they stay within the
+    # search backends' rate limits
+    rate_limiter: BaseRateLimiter | None = Field(default=None, exclude=True)
+
+    @abstractmethod
+    def _search(self, query: str, max_results: int) -> str:
+        """Run the search and format its results."""
+
+    def _run(self, query: str, max_results: int = 5) -> str:
+        """
+        Execute a synchronous search.
+
+        Args:
+            query: The search query
+            max_results: Maximum results to return
+
+        Returns:
+            Formatted search results string
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self._search(query, max_results)
+
+    async def _arun(self, query: str, max_results: int = 5) -> str:
+        """
+        Execute an asynchronous search.
+
+        Args:
+            query: The search query
+            max_results: Maximum results to return
+
+        Returns:
+            Formatted search results string
+        """
+        # Wait for the rate limiter on the loop, not on a search pool thread
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_search_executor, self._search, query, max_results)
+
+
+class WebSearchTool(_SearchTool):
     """
     LangChain tool for performing web searches.
 
@@ -47,9 +119,9 @@ class WebSearchTool(BaseTool):
     )
     args_schema: type[BaseModel] = WebSearchInput
 
-    def _run(self, query: str, max_results: int = 5) -> str:
+    def _search(self, query: str, max_results: int = 5) -> str:
         """
-        Execute a synchronous web search.
+        Execute a web search.
 
         Args:
             query: The search query
@@ -58,13 +130,14 @@ class WebSearchTool(BaseTool):
         Returns:
             Formatted search results string
         """
-        try:
-            from ddgs import DDGS
+        if DDGS is None:
+            logger.error("ddgs not installed, run: pip install ddgs")
+            return _NOT_INSTALLED
 
+        try:
             logger.info("Executing web search", query=query, max_results=max_results)
 
-            ddgs = DDGS()
-            search_results = ddgs.text(
+            search_results = _get_ddgs().text(
                 query,
                 max_results=max_results,
                 region="us-en",
@@ -85,28 +158,12 @@ class WebSearchTool(BaseTool):
             logger.info("Search completed", results_count=len(results))
             return "\n".join(results)
 
-        except ImportError:
-            logger.error("ddgs not installed, run: pip install ddgs")
-            return "Error: Search functionality not available. Install ddgs: pip install ddgs"
         except Exception as e:
             logger.error("Search failed", error=str(e))
             return f"Error performing search: {e!s}"
 
-    async def _arun(self, query: str, max_results: int = 5) -> str:
-        """
-        Execute an asynchronous web search.
-
-        Args:
-            query: The search query
-            max_results: Maximum results to return
-
-        Returns:
-            Formatted search results string
-        """
-        return await asyncio.get_event_loop().run_in_executor(None, self._run, query, max_results)
 
-
-class NewsSearchTool(BaseTool):
+class NewsSearchTool(_SearchTool):
     """
     LangChain tool for searching news articles.
 
@@ -123,15 +180,16 @@ class NewsSearchTool(BaseTool):
     )
     args_schema: type[BaseModel] = WebSearchInput
 
-    def _run(self, query: str, max_results: int = 5) -> str:
-        """Execute a synchronous news search."""
-        try:
-            from ddgs import DDGS
+    def _search(self, query: str, max_results: int = 5) -> str:
+        """Execute a news search."""
+        if DDGS is None:
+            logger.error("ddgs not installed, run: pip install ddgs")
+            return _NOT_INSTALLED
 
+        try:
             logger.info("Executing news search", query=query)
 
-            ddgs = DDGS()
-            news_results = ddgs.news(
+            news_results = _get_ddgs().news(
                 query,
                 max_results=max_results,
                 region="us-en",
@@ -156,7 +214,3 @@ class NewsSearchTool(BaseTool):
         except Exception as e:
             logger.error("News search failed", error=str(e))
             return f"Error performing news search: {e!s}"
-
-    async def _arun(self, query: str, max_results: int = 5) -> str:
-        """Execute an asynchronous news search."""
-        return await asyncio.get_event_loop().run_in_executor(None, self._run, query, max_results)
@@ -0,0 +1,31 @@
+"""
+Fast dataclass decorator for domain value objects.
+
+Frozen dataclasses set every field through object.__setattr__ in the
+generated __init__, which makes construction noticeably slower. Domain
+entities use this decorator instead: a slotted, non-frozen dataclass whose
+immutability is a convention (every update goes through a with_*/mark_*
+factory that returns a new instance).
+"""
+
+from dataclasses import dataclass, field
+from typing import TypeVar, dataclass_transform
+
+_T = TypeVar("_T")
+
+
+@dataclass_transform(field_specifiers=(field,))
+def fast_frozen_dataclass(cls: type[_T]) -> type[_T]:
+    """
+    Turn a class into a slotted dataclass without the frozen __setattr__ cost.
+
+    Instances compare by value but are not hashable unless the class
+    defines __hash__ itself (e.g. by its id).
+
+    Args:
+        cls: The class to convert
+
+    Returns:
+        The dataclass
+    """
+    return dataclass(slots=True, eq=True)(cls)
@@ -0,0 +1,34 @@
+"""
+Shared copies of repeated search text.
+
+Searches keep returning the same pages, so the same URL, title and snippet
+strings are decoded again for every result. share_text() hands back the
+copy already in memory instead, so long sessions hold one string per
+distinct value. The table is bounded by MAX_ENTRIES and simply starts over
+when full; sys.intern() is avoided because untrusted text should not be
+able to grow the interpreter's own intern table.
+"""
+
+# Distinct strings remembered before the table is reset
+MAX_ENTRIES = 8192
+
+_shared: dict[str, str] = {}
+
+
+def share_text(value: str) -> str:
+    """
+    Return an equal string that is already shared, or start sharing this one.
+
+    Args:
+        value: The string to deduplicate
+
+    Returns:
+        A string equal to value, possibly the same object as an earlier call's
+    """
+    shared = _shared.get(value)
+    if shared is not None:
+        return shared
+    if len(_shared) >= MAX_ENTRIES:
+        _shared.clear()
+    _shared[value] = value
+    return value
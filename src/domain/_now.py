@@ -0,0 +1,36 @@
+"""
+Cached wall-clock time for entity timestamps.
+
+Entities stamp themselves on creation, often many at once (every result of
+a search batch). Timestamps only need millisecond freshness, so the current
+datetime is reused for up to RESOLUTION_NS, checked against the much
+cheaper monotonic clock.
+"""
+
+import time
+from datetime import datetime
+
+# How long a cached datetime may be reused, in nanoseconds (1 ms)
+RESOLUTION_NS = 1_000_000
+
+# (monotonic expiry, cached datetime); replaced as a whole so threads never
+# see a half-updated pair
+_cached: tuple[int, datetime] = (0, datetime.min)
+
+
+def recent_now() -> datetime:
+    """
+    Return the current local datetime, at most RESOLUTION_NS old.
+
+    Returns:
+        A naive local datetime, as datetime.now() would return
+    """
+    global _cached
+    expires_ns, value = _cached
+    now_ns = time.monotonic_ns()
+    if now_ns < expires_ns:
+        return value
+
+    value = datetime.now()
+    _cached = (now_ns + RESOLUTION_NS, value)
+    return value
@@ -1,8 +1,9 @@
 from src.domain.entities.query import ResearchQuery
-from src.domain.entities.report import ReportSection, ResearchReport
+from src.domain.entities.report import ReportMetadata, ReportSection, ResearchReport
 from src.domain.entities.research import ResearchResult, SearchResult
 
 __all__ = [
+    "ReportMetadata",
     "ReportSection",
     "ResearchQuery",
     "ResearchReport",
@@ -5,10 +5,16 @@ This entity encapsulates all the information needed to conduct a research task,
 following the principle of making invalid states unrepresentable.
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from dataclasses import field
 from datetime import datetime
 from enum import StrEnum
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from src.domain._fast_dataclass import fast_frozen_dataclass
+from src.domain._now import recent_now
+from src.domain._uuidpool import fast_uuid4
 
 
 class QueryType(StrEnum):
@@ -29,7 +35,7 @@ class QueryPriority(StrEnum):
     CRITICAL = "critical"
 
 
-@dataclass(frozen=True, slots=True)
+@fast_frozen_dataclass
 class ResearchQuery:
     """
     Immutable entity representing a research query.
@@ -42,6 +48,7 @@ class ResearchQuery:
         priority: Priority level of the query
         max_sources: Maximum number of sources to consult
         created_at: Timestamp when the query was created
+        question_tokens: Lowercase word set of the question, computed once
 
     Example:
         >>> query = ResearchQuery.create(
@@ -58,14 +65,14 @@ class ResearchQuery:
     priority: QueryPriority
     max_sources: int
     created_at: datetime
-    keywords: tuple[str, ...] = field(default_factory=tuple)
+    keywords: tuple[str, ...] = ()
+    question_tokens: frozenset[str] = field(init=False, repr=False, compare=False)
+    # search_query, built on first access (a keyword change creates a new query)
+    _search_query: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate the entity after initialization."""
-        if not self.question or len(self.question.strip()) < 10:
-            raise ValueError("Question must be at least 10 characters long")
-        if self.max_sources < 1 or self.max_sources > 20:
-            raise ValueError("max_sources must be between 1 and 20")
+        """Derive the question tokens (inputs are validated by create())."""
+        self.question_tokens = frozenset(self.question.lower().split())
 
     @classmethod
     def create(
@@ -76,7 +83,7 @@ class ResearchQuery:
         priority: QueryPriority = QueryPriority.MEDIUM,
         max_sources: int = 5,
         keywords: tuple[str, ...] | None = None,
-    ) -> "ResearchQuery":
+    ) -> ResearchQuery:
         """
         Factory method to create a new ResearchQuery.
 
@@ -90,48 +97,67 @@ class ResearchQuery:
 
         Returns:
             A new ResearchQuery instance
+
+        Raises:
+            ValueError: If the question is too short or max_sources is out of range
         """
+        question = question.strip()
+        if len(question) < 10:
+            raise ValueError("Question must be at least 10 characters long")
+        if max_sources < 1 or max_sources > 20:
+            raise ValueError("max_sources must be between 1 and 20")
+
         return cls(
-            id=uuid4(),
-            question=question.strip(),
+            id=fast_uuid4(),
+            question=question,
             context=context.strip(),
             query_type=query_type,
             priority=priority,
             max_sources=max_sources,
-            created_at=datetime.now(),
+            created_at=recent_now(),
             keywords=keywords or (),
         )
 
-    def with_keywords(self, keywords: tuple[str, ...]) -> "ResearchQuery":
+    def with_keywords(self, keywords: tuple[str, ...]) -> ResearchQuery:
         """Create a new query with updated keywords (immutable update)."""
-        return ResearchQuery(
-            id=self.id,
-            question=self.question,
-            context=self.context,
-            query_type=self.query_type,
-            priority=self.priority,
-            max_sources=self.max_sources,
-            created_at=self.created_at,
-            keywords=keywords,
-        )
+        # Internal fast path: everything but the keywords is copied from this
+        # already validated query, so __init__/__post_init__ are skipped and the
+        # question tokens are reused rather than recomputed
+        updated = object.__new__(ResearchQuery)
+        updated.id = self.id
+        updated.question = self.question
+        updated.context = self.context
+        updated.query_type = self.query_type
+        updated.priority = self.priority
+        updated.max_sources = self.max_sources
+        updated.created_at = self.created_at
+        updated.keywords = keywords
+        updated.question_tokens = self.question_tokens
+        updated._search_query = None
+        return updated
 
     @property
     def search_query(self) -> str:
-        """Generate an optimized search query string."""
-        parts = [self.question]
-        if self.keywords:
-            parts.extend(self.keywords)
-        return " ".join(parts)
-
-    def to_dict(self) -> dict[str, str | int | list[str]]:
+        """Generate an optimized search query string (computed once per query)."""
+        search_query = self._search_query
+        if search_query is None:
+            search_query = " ".join((self.question, *self.keywords))
+            self._search_query = search_query
+        return search_query
+
+    def __hash__(self) -> int:
+        """Hash by id; equal entities always share an id."""
+        return hash(self.id)
+
+    def to_dict(self) -> dict[str, str | int | tuple[str, ...]]:
         """Convert to dictionary for serialization."""
         return {
             "id": str(self.id),
             "question": self.question,
             "context": self.context,
-            "query_type": self.query_type.value,
-            "priority": self.priority.value,
+            "query_type": self.query_type._value_,
+            "priority": self.priority._value_,
             "max_sources": self.max_sources,
             "created_at": self.created_at.isoformat(),
-            "keywords": list(self.keywords),
+            "keywords": self.keywords,
         }
@@ -5,13 +5,23 @@ This entity structures the final output that will be delivered to the user,
 with proper formatting and organization of findings.
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import field
 from datetime import datetime
 from enum import StrEnum
-from typing import Any
-from uuid import UUID, uuid4
+from itertools import pairwise
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from src.domain._fast_dataclass import fast_frozen_dataclass
+from src.domain._now import recent_now
+from src.domain._uuidpool import fast_uuid4
 
-from src.domain.entities.research import ResearchResult
+if TYPE_CHECKING:
+    from src.domain.entities.research import ResearchResult
 
 
 class ReportFormat(StrEnum):
@@ -22,7 +32,7 @@ class ReportFormat(StrEnum):
     STRUCTURED = "structured"
 
 
-@dataclass(frozen=True, slots=True)
+@fast_frozen_dataclass
 class ReportSection:
     """
     Immutable entity representing a section of the report.
@@ -37,7 +47,7 @@ class ReportSection:
     title: str
     content: str
     order: int
-    sources: tuple[str, ...] = field(default_factory=tuple)
+    sources: tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
         """Validate the section."""
@@ -53,7 +63,7 @@ class ReportSection:
         content: str,
         order: int,
         sources: tuple[str, ...] | None = None,
-    ) -> "ReportSection":
+    ) -> ReportSection:
         """Factory method to create a ReportSection."""
         return cls(
             title=title.strip(),
@@ -68,11 +78,51 @@ class ReportSection:
             "title": self.title,
             "content": self.content,
             "order": self.order,
-            "sources": list(self.sources),
+            "sources": self.sources,
         }
 
 
-@dataclass(frozen=True, slots=True)
+@fast_frozen_dataclass
+class ReportMetadata:
+    """
+    Immutable summary figures of the research behind a report.
+
+    Attributes:
+        sources_consulted: Number of sources consulted
+        findings_count: Number of key findings
+        processing_time_ms: Research time in milliseconds
+        confidence_score: Research confidence score (0-1)
+    """
+
+    sources_consulted: int
+    findings_count: int
+    processing_time_ms: int
+    confidence_score: float
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Convert to dictionary."""
+        return {
+            "sources_consulted": self.sources_consulted,
+            "findings_count": self.findings_count,
+            "processing_time_ms": self.processing_time_ms,
+            "confidence_score": self.confidence_score,
+        }
+
+
+_section_order = attrgetter("order")
+
+# Confidence labels by score band: a score below the first threshold gets the
+# first label, one at or above the last threshold gets the last label
+_CONFIDENCE_THRESHOLDS = (0.4, 0.6, 0.8)
+_CONFIDENCE_LABELS = (
+    "Very Low - Insufficient evidence",
+    "Low - Results should be verified",
+    "Medium - Results are reasonably supported",
+    "High - Results are well-supported by multiple sources",
+)
+
+
+@fast_frozen_dataclass
 class ResearchReport:
     """
     Immutable entity representing the final research report.
@@ -86,8 +136,9 @@ class ResearchReport:
         recommendations: Actionable recommendations
         confidence_level: Overall confidence in the report
         format: Report format
-        metadata: Additional metadata
+        metadata: Figures of the research behind the report
         created_at: When the report was created
+        sorted_sections: Sections in display order, sorted once
     """
 
     id: UUID
@@ -98,8 +149,17 @@ class ResearchReport:
     recommendations: tuple[str, ...]
     confidence_level: str
     format: ReportFormat
-    metadata: dict[str, str | int | float]
+    metadata: ReportMetadata
     created_at: datetime
+    sorted_sections: tuple[ReportSection, ...] = field(init=False, repr=False, compare=False)
+    # to_dict() result, built on first call and dropped on any assignment
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached to_dict() result."""
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
 
     def __post_init__(self) -> None:
         """Validate the report."""
@@ -107,6 +167,12 @@ class ResearchReport:
             raise ValueError("Report title cannot be empty")
         if not self.executive_summary:
             raise ValueError("Executive summary cannot be empty")
+        sections = self.sections
+        # Generated sections usually arrive in order; share the tuple then
+        if all(a.order <= b.order for a, b in pairwise(sections)):
+            self.sorted_sections = sections
+        else:
+            self.sorted_sections = tuple(sorted(sections, key=_section_order))
 
     @classmethod
     def from_research(
@@ -116,7 +182,7 @@ class ResearchReport:
         sections: tuple[ReportSection, ...],
         recommendations: tuple[str, ...],
         report_format: ReportFormat = ReportFormat.JSON,
-    ) -> "ResearchReport":
+    ) -> ResearchReport:
         """
         Factory method to create a report from research results.
 
@@ -134,15 +200,15 @@ class ResearchReport:
 
         executive_summary = research.synthesis or "No synthesis available."
 
-        metadata: dict[str, str | int | float] = {
-            "sources_consulted": research.source_count,
-            "findings_count": len(research.key_findings),
-            "processing_time_ms": research.processing_time_ms,
-            "confidence_score": research.confidence_score,
-        }
+        metadata = ReportMetadata(
+            sources_consulted=research.source_count,
+            findings_count=len(research.key_findings),
+            processing_time_ms=research.processing_time_ms,
+            confidence_score=research.confidence_score,
+        )
 
         return cls(
-            id=uuid4(),
+            id=fast_uuid4(),
             research_id=research.id,
             title=title,
             executive_summary=executive_summary,
@@ -151,20 +217,13 @@ class ResearchReport:
             confidence_level=confidence_level,
             format=report_format,
             metadata=metadata,
-            created_at=datetime.now(),
+            created_at=recent_now(),
         )
 
     @staticmethod
     def _calculate_confidence_level(score: float) -> str:
         """Calculate human-readable confidence level."""
-        if score >= 0.8:
-            return "High - Results are well-supported by multiple sources"
-        elif score >= 0.6:
-            return "Medium - Results are reasonably supported"
-        elif score >= 0.4:
-            return "Low - Results should be verified"
-        else:
-            return "Very Low - Insufficient evidence"
+        return _CONFIDENCE_LABELS[bisect_right(_CONFIDENCE_THRESHOLDS, score)]
 
     @property
     def section_count(self) -> int:
@@ -173,66 +232,59 @@ class ResearchReport:
 
     def get_sections_sorted(self) -> list[ReportSection]:
         """Get sections sorted by order."""
-        return sorted(self.sections, key=lambda s: s.order)
+        return list(self.sorted_sections)
+
+    def __hash__(self) -> int:
+        """Hash by id; equal entities always share an id."""
+        return hash(self.id)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """
+        Convert to dictionary for JSON serialization.
+
+        The values are built once per report; each call returns a new
+        (shallow) copy of the dict.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return dict(self._dict_cache)
+
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the to_dict() values."""
         return {
             "id": str(self.id),
             "research_id": str(self.research_id),
             "title": self.title,
             "executive_summary": self.executive_summary,
-            "sections": [s.to_dict() for s in self.get_sections_sorted()],
-            "recommendations": list(self.recommendations),
+            "sections": list(map(ReportSection.to_dict, self.sorted_sections)),
+            "recommendations": self.recommendations,
             "confidence_level": self.confidence_level,
-            "format": self.format.value,
-            "metadata": self.metadata,
+            "format": self.format._value_,
+            "metadata": self.metadata.to_dict(),
             "created_at": self.created_at.isoformat(),
         }
 
     def to_markdown(self) -> str:
         """Convert to Markdown format."""
-        lines = [
-            f"# {self.title}",
-            "",
-            "## Executive Summary",
-            "",
-            self.executive_summary,
-            "",
-        ]
-
-        for section in self.get_sections_sorted():
-            lines.extend(
-                [
-                    f"## {section.title}",
-                    "",
-                    section.content,
-                    "",
-                ]
-            )
+        # One block per heading (its lines already joined); the blank line
+        # between blocks comes from the final join
+        blocks = [f"# {self.title}\n\n## Executive Summary\n\n{self.executive_summary}\n"]
+
+        for section in self.sorted_sections:
+            blocks.append(f"## {section.title}\n\n{section.content}\n")
             if section.sources:
-                lines.append("**Sources:**")
-                for source in section.sources:
-                    lines.append(f"- {source}")
-                lines.append("")
+                sources = "\n".join(f"- {source}" for source in section.sources)
+                blocks.append(f"**Sources:**\n{sources}\n")
 
         if self.recommendations:
-            lines.extend(
-                [
-                    "## Recommendations",
-                    "",
-                ]
+            recommendations = "\n".join(
+                f"{i}. {rec}" for i, rec in enumerate(self.recommendations, 1)
             )
-            for i, rec in enumerate(self.recommendations, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
-
-        lines.extend(
-            [
-                "---",
-                f"*Confidence Level: {self.confidence_level}*",
-                f"*Generated at: {self.created_at.isoformat()}*",
-            ]
+            blocks.append(f"## Recommendations\n\n{recommendations}\n")
+
+        blocks.append(
+            f"---\n*Confidence Level: {self.confidence_level}*\n"
+            f"*Generated at: {self.created_at.isoformat()}*"
         )
 
-        return "\n".join(lines)
+        return "\n".join(blocks)
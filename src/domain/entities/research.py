@@ -5,11 +5,18 @@ This entity contains the structured data collected during research,
 including individual search results and aggregated findings.
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from dataclasses import field
 from datetime import datetime
 from enum import StrEnum
-from typing import Any
-from uuid import UUID, uuid4
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from src.domain._fast_dataclass import fast_frozen_dataclass
+from src.domain._intern import share_text
+from src.domain._now import recent_now
+from src.domain._uuidpool import fast_uuid4
 
 
 class SourceCredibility(StrEnum):
@@ -31,11 +38,14 @@ class ResearchStatus(StrEnum):
     PARTIAL = "partial"
 
 
-@dataclass(frozen=True, slots=True)
-class SearchResult:
+class SearchResult(NamedTuple):
     """
     Immutable entity representing a single search result.
 
+    A NamedTuple rather than a dataclass: one is built per search hit, and
+    tuple construction is the cheapest there is. Instances are validated by
+    create(), which every producer goes through.
+
     Attributes:
         title: Title of the source
         url: URL of the source
@@ -47,15 +57,8 @@ class SearchResult:
     title: str
     url: str
     snippet: str
-    credibility: SourceCredibility = SourceCredibility.UNKNOWN
-    retrieved_at: datetime = field(default_factory=datetime.now)
-
-    def __post_init__(self) -> None:
-        """Validate the search result."""
-        if not self.title:
-            raise ValueError("Title cannot be empty")
-        if not self.url:
-            raise ValueError("URL cannot be empty")
+    credibility: SourceCredibility
+    retrieved_at: datetime
 
     @classmethod
     def create(
@@ -64,14 +67,20 @@ class SearchResult:
         url: str,
         snippet: str,
         credibility: SourceCredibility = SourceCredibility.UNKNOWN,
-    ) -> "SearchResult":
-        """Factory method to create a SearchResult."""
+    ) -> SearchResult:
+        """Factory method to create a validated SearchResult."""
+        title = title.strip()
+        url = url.strip()
+        if not title:
+            raise ValueError("Title cannot be empty")
+        if not url:
+            raise ValueError("URL cannot be empty")
         return cls(
-            title=title.strip(),
-            url=url.strip(),
-            snippet=snippet.strip(),
+            title=share_text(title),
+            url=share_text(url),
+            snippet=share_text(snippet.strip()),
             credibility=credibility,
-            retrieved_at=datetime.now(),
+            retrieved_at=recent_now(),
         )
 
     def to_dict(self) -> dict[str, str]:
@@ -80,12 +89,13 @@ class SearchResult:
             "title": self.title,
             "url": self.url,
             "snippet": self.snippet,
-            "credibility": self.credibility.value,
+            # _value_ is a plain attribute read; .value goes through a property
+            "credibility": self.credibility._value_,
             "retrieved_at": self.retrieved_at.isoformat(),
         }
 
 
-@dataclass(frozen=True, slots=True)
+@fast_frozen_dataclass
 class ResearchResult:
     """
     Immutable entity representing the complete research result.
@@ -113,19 +123,20 @@ class ResearchResult:
     processing_time_ms: int
     created_at: datetime
     completed_at: datetime | None = None
+    # to_dict() result, built on first call and dropped on any assignment
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
-    def __post_init__(self) -> None:
-        """Validate the research result."""
-        if not 0 <= self.confidence_score <= 1:
-            raise ValueError("Confidence score must be between 0 and 1")
-        if self.processing_time_ms < 0:
-            raise ValueError("Processing time cannot be negative")
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached to_dict() result."""
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
 
     @classmethod
-    def create_pending(cls, query_id: UUID) -> "ResearchResult":
+    def create_pending(cls, query_id: UUID) -> ResearchResult:
         """Create a pending research result."""
         return cls(
-            id=uuid4(),
+            id=fast_uuid4(),
             query_id=query_id,
             status=ResearchStatus.PENDING,
             search_results=(),
@@ -133,7 +144,7 @@ class ResearchResult:
             synthesis="",
             confidence_score=0.0,
             processing_time_ms=0,
-            created_at=datetime.now(),
+            created_at=recent_now(),
             completed_at=None,
         )
 
@@ -144,8 +155,19 @@ class ResearchResult:
         synthesis: str,
         confidence_score: float,
         processing_time_ms: int,
-    ) -> "ResearchResult":
-        """Create a completed research result with findings."""
+    ) -> ResearchResult:
+        """
+        Create a completed research result with findings.
+
+        Raises:
+            ValueError: If the confidence score or processing time is out of range
+        """
+        # Only new scores need checking; the factories only copy validated state
+        if not 0 <= confidence_score <= 1:
+            raise ValueError("Confidence score must be between 0 and 1")
+        if processing_time_ms < 0:
+            raise ValueError("Processing time cannot be negative")
+
         return ResearchResult(
             id=self.id,
             query_id=self.query_id,
@@ -156,10 +178,10 @@ class ResearchResult:
             confidence_score=confidence_score,
             processing_time_ms=processing_time_ms,
             created_at=self.created_at,
-            completed_at=datetime.now(),
+            completed_at=recent_now(),
         )
 
-    def mark_failed(self, error_message: str) -> "ResearchResult":
+    def mark_failed(self, error_message: str) -> ResearchResult:
         """Create a failed research result."""
         return ResearchResult(
             id=self.id,
@@ -171,7 +193,7 @@ class ResearchResult:
             confidence_score=0.0,
             processing_time_ms=self.processing_time_ms,
             created_at=self.created_at,
-            completed_at=datetime.now(),
+            completed_at=recent_now(),
         )
 
     @property
@@ -182,25 +204,41 @@ class ResearchResult:
     @property
     def is_complete(self) -> bool:
         """Check if the research is complete."""
-        return self.status == ResearchStatus.COMPLETED
+        return self.status is ResearchStatus.COMPLETED
 
     @property
     def is_successful(self) -> bool:
         """Check if the research was successful."""
         return self.is_complete and self.confidence_score > 0.3
 
+    def __hash__(self) -> int:
+        """Hash by id; equal entities always share an id."""
+        return hash(self.id)
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
+        """
+        Convert to dictionary for serialization.
+
+        The values are built once per result; each call returns a new
+        (shallow) copy of the dict.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return dict(self._dict_cache)
+
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the to_dict() values."""
         return {
             "id": str(self.id),
             "query_id": str(self.query_id),
-            "status": self.status.value,
-            "search_results": [sr.to_dict() for sr in self.search_results],
-            "key_findings": list(self.key_findings),
+            "status": self.status._value_,
+            "key_findings": self.key_findings,
             "synthesis": self.synthesis,
             "confidence_score": self.confidence_score,
             "processing_time_ms": self.processing_time_ms,
             "source_count": self.source_count,
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            # tuple(map()) of no results is the shared empty tuple, no allocation
+            "search_results": tuple(map(SearchResult.to_dict, self.search_results)),
         }
@@ -5,17 +5,21 @@ This port defines the contract that any LLM adapter must implement,
 following the Ports and Adapters (Hexagonal) architecture pattern.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
 
-from langchain_core.language_models import BaseChatModel
+# Finish reasons that mean the model stopped on its own (not cut off)
+_COMPLETE_REASONS = frozenset({"stop", "end_turn", "complete"})
 
 
-@dataclass(frozen=True, slots=True)
-class LLMResponse:
+class LLMResponse(NamedTuple):
     """
-    Immutable response from the LLM.
+    Immutable response from the LLM (a NamedTuple, cheap to build per call).
 
     Attributes:
         content: The generated text content
@@ -34,7 +38,7 @@ class LLMResponse:
     @property
     def is_complete(self) -> bool:
         """Check if generation completed normally."""
-        return self.finish_reason in ("stop", "end_turn", "complete")
+        return self.finish_reason in _COMPLETE_REASONS
 
 
 class LLMPort(ABC):
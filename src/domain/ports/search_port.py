@@ -5,16 +5,16 @@ This port defines the contract for any search adapter implementation,
 enabling easy swapping between different search providers.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 
-@dataclass(frozen=True, slots=True)
-class WebSearchResult:
+class WebSearchResult(NamedTuple):
     """
-    Immutable web search result.
+    Immutable web search result (a NamedTuple, cheap to build per hit).
 
     Attributes:
         title: Page title
@@ -1,7 +1,32 @@
-from src.infrastructure.adapters.duckduckgo_adapter import DuckDuckGoAdapter
-from src.infrastructure.adapters.gemini_adapter import GeminiLLMAdapter
-from src.infrastructure.adapters.groq_adapter import GroqLLMAdapter
-from src.infrastructure.adapters.llm_factory import FallbackLLMAdapter, LLMFactory, LLMProvider
+"""
+Adapters for external services (LLM providers, web search).
+
+Exports are resolved lazily (PEP 562): importing one adapter module, or
+this package, does not import every provider SDK.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.infrastructure.adapters.duckduckgo_adapter import DuckDuckGoAdapter
+    from src.infrastructure.adapters.gemini_adapter import GeminiLLMAdapter
+    from src.infrastructure.adapters.groq_adapter import GroqLLMAdapter
+    from src.infrastructure.adapters.llm_factory import (
+        FallbackLLMAdapter,
+        LLMFactory,
+        LLMProvider,
+    )
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "DuckDuckGoAdapter": "duckduckgo_adapter",
+    "FallbackLLMAdapter": "llm_factory",
+    "GeminiLLMAdapter": "gemini_adapter",
+    "GroqLLMAdapter": "groq_adapter",
+    "LLMFactory": "llm_factory",
+    "LLMProvider": "llm_factory",
+}
 
 __all__ = [
     "DuckDuckGoAdapter",
@@ -11,3 +36,19 @@ __all__ = [
     "LLMFactory",
     "LLMProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported adapter on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazy exports alongside the module's own names."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,162 @@
+"""
+Client-side rate limiting for the free-tier providers.
+
+Gemini, Groq and DuckDuckGo all throttle bursts (HTTP 429 / 202), and the
+adapters only used to find out by being throttled and backing off for
+seconds. A token bucket in front of each provider paces requests to the
+published limits instead, so bursts wait briefly rather than fail.
+
+TokenBucketRateLimiter exposes the buckets through LangChain's rate limiter
+interface, so the chat models handed to the agent and the search tools are
+paced too, not just the adapters' own calls.
+"""
+
+import asyncio
+import threading
+import time
+
+import structlog
+from langchain_core.rate_limiters import BaseRateLimiter
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket that makes callers wait for capacity instead of failing.
+
+    Holds up to `burst` tokens and refills at `rate` tokens per second.
+    Tokens are reserved up front, so concurrent callers queue behind each
+    other in arrival order and each sleeps only for its own share.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Initialize a full token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens (requests allowed back to back)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # Reservations are plain arithmetic, so a thread lock (not an
+        # asyncio.Lock bound to one loop) keeps them consistent
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take tokens (possibly going into debt) and return the wait in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _try_reserve(self, tokens: int) -> bool:
+        """Take tokens only if they are available now."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def _release(self, tokens: int) -> None:
+        """Give back tokens reserved for a request that was never made."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + tokens)
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Wait until the bucket can serve `tokens` requests.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        await _wait(self._reserve(tokens), (self,), tokens)
+
+
+async def _wait(delay: float, buckets: tuple[AsyncTokenBucket, ...], tokens: int) -> None:
+    """Sleep for a reservation, refunding it if the caller is cancelled."""
+    if delay <= 0:
+        return
+
+    logger.debug("Rate limit pacing", delay_seconds=round(delay, 2))
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        # The request is never made; let the callers queued behind it go sooner
+        for bucket in buckets:
+            bucket._release(tokens)
+        raise
+
+
+class TokenBucketRateLimiter(BaseRateLimiter):
+    """
+    LangChain rate limiter taking one token from each bucket per request.
+
+    Set as a chat model's `rate_limiter` it paces every call the model makes,
+    including the agent's. Several buckets enforce several windows at once
+    (e.g. per minute and per day).
+    """
+
+    def __init__(self, *buckets: AsyncTokenBucket) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            *buckets: Token buckets that must all have capacity for a request
+        """
+        self.buckets = buckets
+
+    def _try_acquire(self) -> bool:
+        """Take a token from every bucket, or from none if one is empty."""
+        taken: list[AsyncTokenBucket] = []
+        for bucket in self.buckets:
+            if not bucket._try_reserve(1):
+                for earlier in taken:
+                    earlier._release(1)
+                return False
+            taken.append(bucket)
+        return True
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """
+        Take a token from every bucket, sleeping the thread until they are due.
+
+        Args:
+            blocking: Wait for the tokens instead of failing when they are not available
+
+        Returns:
+            True if the tokens were acquired
+        """
+        if not blocking:
+            return self._try_acquire()
+
+        delay = max((bucket._reserve(1) for bucket in self.buckets), default=0.0)
+        if delay > 0:
+            logger.debug("Rate limit pacing", delay_seconds=round(delay, 2))
+            time.sleep(delay)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """
+        Take a token from every bucket, waiting until they are due.
+
+        Args:
+            blocking: Wait for the tokens instead of failing when they are not available
+
+        Returns:
+            True if the tokens were acquired
+        """
+        if not blocking:
+            return self._try_acquire()
+
+        delay = max((bucket._reserve(1) for bucket in self.buckets), default=0.0)
+        await _wait(delay, self.buckets, 1)
+        return True
@@ -0,0 +1,76 @@
+"""
+Exponential backoff shared by the adapters.
+
+Free-tier providers (Gemini quotas, DuckDuckGo's 202 rate limit) reject
+bursts but usually succeed after a short wait, so transient failures are
+retried with exponential backoff plus jitter before being reported.
+"""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_T = TypeVar("_T")
+
+
+async def retry_with_backoff(
+    operation: str,
+    func: Callable[[], Awaitable[_T]],
+    *,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    is_retryable: Callable[[Exception], bool],
+) -> _T:
+    """
+    Await func(), retrying retryable errors with exponential backoff.
+
+    Attempt n (from 0) waits base_delay * 2**n plus up to a second of
+    jitter, capped at max_delay, before the next try.
+
+    Args:
+        operation: Name of the operation for logging
+        func: Zero-argument function returning a fresh awaitable per attempt
+        max_retries: Retries after the first attempt
+        base_delay: Delay before the first retry, in seconds
+        max_delay: Upper bound on a single delay, in seconds
+        is_retryable: Whether an error is transient and worth retrying
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        Exception: The first non-retryable error, or the last retryable
+            one once all retries are exhausted
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await func()
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+
+            if attempt == max_retries:
+                logger.error(
+                    f"All retries exhausted for {operation}",
+                    attempts=max_retries + 1,
+                    error=str(e),
+                )
+                raise
+
+            delay = min(base_delay * (2**attempt) + random.uniform(0, 1), max_delay)
+            logger.warning(
+                f"Transient error, retrying {operation}",
+                attempt=attempt + 1,
+                max_retries=max_retries,
+                delay_seconds=round(delay, 2),
+                error=str(e)[:100],
+            )
+            await asyncio.sleep(delay)
+
+    raise AssertionError("unreachable")  # pragma: no cover
@@ -0,0 +1,74 @@
+"""
+Structured (JSON) generation helpers shared by the LLM adapters.
+
+Schemas are sent to the model as compact JSON (indentation only costs
+tokens), and callers such as analyze_text pass the same small schemas over
+and over, so the rendered prompt is cached per schema. orjson is used for
+encoding and parsing when installed (the "speedups" extra).
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any
+
+__all__ = ["parse_json", "strip_code_fence", "structured_system_prompt"]
+
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as parse_json
+
+    def _compact_json(obj: Any) -> str:
+        """Serialize without whitespace using orjson."""
+        return _orjson_dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import loads as parse_json  # type: ignore[assignment]
+
+    def _compact_json(obj: Any) -> str:
+        """Serialize without whitespace, keeping non-ASCII text like orjson."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# A whole reply wrapped in a markdown code fence, with an optional language
+# tag (```json); the closing fence may be missing if the reply was cut off
+_FENCE_RE = re.compile(r"```[\w-]*[ \t]*\n(.*?)(?:\n```)?\s*", re.DOTALL)
+
+
+@lru_cache(maxsize=128)
+def _build_prompt(schema_json: str, system_prompt: str | None) -> str:
+    """Render the structured system prompt for a compact-JSON schema."""
+    return (
+        f"{system_prompt or ''}\n\n"
+        f"You must respond with valid JSON matching this schema:\n"
+        f"{schema_json}\n\n"
+        f"Respond ONLY with the JSON object, no additional text."
+    ).strip()
+
+
+def structured_system_prompt(output_schema: dict[str, Any], system_prompt: str | None) -> str:
+    """
+    Build the system prompt asking for JSON that matches a schema.
+
+    Args:
+        output_schema: Expected JSON schema
+        system_prompt: Optional system instructions to prepend
+
+    Returns:
+        The combined system prompt
+    """
+    return _build_prompt(_compact_json(output_schema), system_prompt)
+
+
+def strip_code_fence(content: str) -> str:
+    """
+    Remove a markdown code fence around a model reply.
+
+    Args:
+        content: The stripped reply text
+
+    Returns:
+        The fenced body, or content unchanged if it is not fenced
+    """
+    match = _FENCE_RE.fullmatch(content)
+    return match.group(1) if match else content
@@ -5,8 +5,15 @@ DuckDuckGo provides FREE, unlimited search without requiring an API key.
 This makes it perfect for open-source projects and portfolio demos.
 """
 
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from types import TracebackType
+from typing import Any, ClassVar
 
 import structlog
 
@@ -17,9 +24,48 @@ from src.domain.ports.search_port import (
     SearchRateLimitError,
     WebSearchResult,
 )
+from src.infrastructure.adapters._rate_limit import AsyncTokenBucket, TokenBucketRateLimiter
+from src.infrastructure.adapters._retry import retry_with_backoff
+
+# ddgs exceptions of transient failures that usually succeed after a short wait
+_RATE_LIMIT_ERRORS: tuple[type[Exception], ...] = ()
+_TIMEOUT_ERRORS: tuple[type[Exception], ...] = ()
+
+try:
+    from ddgs import DDGS
+    from ddgs.exceptions import RatelimitException, TimeoutException
+
+    _RATE_LIMIT_ERRORS = (RatelimitException,)
+    _TIMEOUT_ERRORS = (TimeoutException,)
+except ImportError:  # pragma: no cover - depends on the environment
+    DDGS = None  # type: ignore[assignment,misc]
 
 logger = structlog.get_logger(__name__)
 
+# Maximum number of DuckDuckGo requests running at once. ddgs is synchronous;
+# a dedicated pool keeps blocked searches off the loop's default executor
+DDG_CONCURRENCY = 16
+_ddg_executor = ThreadPoolExecutor(max_workers=DDG_CONCURRENCY, thread_name_prefix="ddg")
+
+# Whole-word error message fragments for failures raised outside ddgs'
+# exception types (DuckDuckGo answers bursts with HTTP 202 "Ratelimit")
+_RATE_LIMIT_RE = re.compile(r"\b(?:rate.?limit(?:ed)?|429|202)\b", re.IGNORECASE)
+_CONNECTION_RE = re.compile(r"\b(?:connect\w*|time(?:d ?)?out)\b", re.IGNORECASE)
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """Whether a search failed because DuckDuckGo is rate limiting."""
+    return isinstance(error, _RATE_LIMIT_ERRORS) or _RATE_LIMIT_RE.search(str(error)) is not None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a search failure is worth retrying after a short wait."""
+    return isinstance(error, _TIMEOUT_ERRORS) or _is_rate_limit(error)
+
+
+# Cache key: (search kind, query, max_results, region or time range)
+_CacheKey = tuple[str, str, int, str]
+
 
 # Language to region mapping for DuckDuckGo
 LANGUAGE_REGION_MAP = {
@@ -105,20 +151,128 @@ class DuckDuckGoAdapter(SearchPort):
     """
     DuckDuckGo search adapter implementing the Search port.
 
-    Uses the duckduckgo-search library for free, unlimited searches
-    without requiring any API key.
+    Uses the ddgs metasearch library (the successor of duckduckgo-search)
+    for free, unlimited searches without requiring any API key.
+    One client is kept per adapter so its HTTP sessions are reused, and
+    recent results are cached so repeated queries skip the network (and
+    DuckDuckGo's rate limit).
     """
 
-    def __init__(self, timeout: int = 10) -> None:
+    # Retry backoff for rate limited or timed out requests
+    BASE_DELAY: ClassVar[float] = 1.0  # seconds
+    MAX_DELAY: ClassVar[float] = 30.0  # seconds
+
+    # Client-side pacing; DuckDuckGo starts answering 202 beyond roughly
+    # 5 requests per 10 seconds
+    REQUESTS_PER_SECOND: ClassVar[float] = 0.5
+    REQUEST_BURST: ClassVar[int] = 5
+
+    # How long a successful health check is trusted before probing again
+    HEALTH_CHECK_TTL: ClassVar[float] = 30.0  # seconds
+
+    @classmethod
+    def create_rate_limiter(cls) -> TokenBucketRateLimiter:
+        """
+        Create a rate limiter pacing requests to DuckDuckGo's limits.
+
+        Returns:
+            A new limiter; pass the same one to every DuckDuckGo client
+        """
+        return TokenBucketRateLimiter(AsyncTokenBucket(cls.REQUESTS_PER_SECOND, cls.REQUEST_BURST))
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        cache_size: int = 512,
+        cache_ttl: float = 300,
+        max_retries: int = 4,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+    ) -> None:
         """
         Initialize the DuckDuckGo adapter.
 
         Args:
             timeout: Request timeout in seconds
+            cache_size: Maximum number of cached searches
+            cache_ttl: Lifetime of cached results in seconds (0 disables the cache)
+            max_retries: Max retry attempts for rate limited or timed out requests
+            rate_limiter: Limiter shared with other DuckDuckGo clients, such as
+                the agent's search tools (a new one by default)
+
+        Raises:
+            SearchError: If the ddgs package is not installed
         """
+        if DDGS is None:
+            raise SearchError("ddgs package not installed. Run: pip install ddgs")
+
+        self._max_retries = max_retries
         self._timeout = timeout
+        # Built on first search, and again after aclose()
+        self._ddgs: DDGS | None = None
+        self._rate_limiter = rate_limiter or self.create_rate_limiter()
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        # Monotonic time until which the last successful health check stands
+        self._healthy_until = 0.0
+        self._cache: OrderedDict[_CacheKey, tuple[float, tuple[WebSearchResult, ...]]] = (
+            OrderedDict()
+        )
         logger.info("DuckDuckGoAdapter initialized", timeout=timeout)
 
+    def _get_ddgs(self) -> "DDGS":
+        """
+        Return the adapter's ddgs client, creating it if needed.
+
+        The client is shared by every search of this adapter (it keeps one
+        engine, with its HTTP session, per backend) until aclose().
+        """
+        if self._ddgs is None:
+            self._ddgs = DDGS(timeout=self._timeout)
+        return self._ddgs
+
+    def _get_cached(self, key: _CacheKey) -> list[WebSearchResult] | None:
+        """Return a copy of unexpired cached results, or None on a miss."""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+
+        expires_at, results = cached
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return list(results)
+
+    async def _run_with_retry(
+        self, operation: str, func: Callable[[], list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Run a blocking ddgs call on the search pool, paced and retrying transient errors."""
+        loop = asyncio.get_running_loop()
+
+        async def attempt() -> list[dict[str, Any]]:
+            await self._rate_limiter.aacquire()
+            return await loop.run_in_executor(_ddg_executor, func)
+
+        return await retry_with_backoff(
+            operation,
+            attempt,
+            max_retries=self._max_retries,
+            base_delay=self.BASE_DELAY,
+            max_delay=self.MAX_DELAY,
+            is_retryable=_is_transient,
+        )
+
+    def _put_cached(self, key: _CacheKey, results: list[WebSearchResult]) -> None:
+        """Cache search results, evicting the least recently used entry when full."""
+        if self._cache_ttl <= 0:
+            return
+
+        self._cache[key] = (time.monotonic() + self._cache_ttl, tuple(results))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
     async def search(
         self,
         query: str,
@@ -136,11 +290,15 @@ class DuckDuckGoAdapter(SearchPort):
         Returns:
             List of WebSearchResult objects
         """
-        import asyncio
+        ddgs = self._get_ddgs()
 
-        try:
-            from duckduckgo_search import DDGS
+        cache_key = ("text", query, max_results, region)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug("Search cache hit", query=query)
+            return cached
 
+        try:
             logger.info(
                 "Executing DuckDuckGo search",
                 query=query,
@@ -149,27 +307,29 @@ class DuckDuckGoAdapter(SearchPort):
 
             # Run synchronous search in executor
             def do_search() -> list[dict[str, Any]]:
-                with DDGS() as ddgs:
-                    return list(
-                        ddgs.text(
-                            query,
-                            region=region,
-                            max_results=max_results,
-                        )
+                return list(
+                    ddgs.text(
+                        query,
+                        region=region,
+                        max_results=max_results,
                     )
+                )
 
-            results = await asyncio.get_event_loop().run_in_executor(None, do_search)
+            results = await self._run_with_retry("search", do_search)
 
+            # ddgs results are flattened dataclasses, so every key is present
+            # and one lookup per field is enough (no legacy fallback keys)
+            retrieved_at = datetime.now()
             search_results = [
                 WebSearchResult(
                     title=r.get("title", ""),
-                    url=r.get("href", r.get("link", "")),
-                    snippet=r.get("body", r.get("snippet", "")),
+                    url=r.get("href", ""),
+                    snippet=r.get("body", ""),
                     source="duckduckgo",
-                    position=i + 1,
-                    retrieved_at=datetime.now(),
+                    position=position,
+                    retrieved_at=retrieved_at,
                 )
-                for i, r in enumerate(results)
+                for position, r in enumerate(results, 1)
             ]
 
             logger.info(
@@ -177,21 +337,50 @@ class DuckDuckGoAdapter(SearchPort):
                 results_count=len(search_results),
             )
 
+            self._put_cached(cache_key, search_results)
             return search_results
 
-        except ImportError:
-            raise SearchError(
-                "duckduckgo-search package not installed. Run: pip install duckduckgo-search"
-            )
         except Exception as e:
-            error_msg = str(e).lower()
-            if "rate" in error_msg:
+            if _is_rate_limit(e):
                 raise SearchRateLimitError(f"Rate limited: {e}", e)
-            elif "connection" in error_msg or "timeout" in error_msg:
+            elif isinstance(e, _TIMEOUT_ERRORS) or _CONNECTION_RE.search(str(e)):
                 raise SearchConnectionError(f"Connection failed: {e}", e)
             else:
                 raise SearchError(f"Search failed: {e}", e)
 
+    async def search_many(
+        self,
+        queries: list[str],
+        max_results: int = 5,
+        region: str = "us-en",
+        concurrency: int = 5,
+    ) -> list[list[WebSearchResult]]:
+        """
+        Run several searches concurrently.
+
+        At most `concurrency` searches are in flight at once; all of them
+        share the adapter's ddgs client and result cache.
+
+        Args:
+            queries: Search query strings
+            max_results: Maximum results per query
+            region: Region code (us-en = United States English)
+            concurrency: Maximum number of searches running at once
+
+        Returns:
+            One result list per query, in query order
+
+        Raises:
+            SearchError: If any of the searches fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search_one(query: str) -> list[WebSearchResult]:
+            async with semaphore:
+                return await self.search(query, max_results=max_results, region=region)
+
+        return list(await asyncio.gather(*map(search_one, queries)))
+
     async def search_news(
         self,
         query: str,
@@ -209,50 +398,94 @@ class DuckDuckGoAdapter(SearchPort):
         Returns:
             List of news results
         """
-        import asyncio
+        ddgs = self._get_ddgs()
 
-        try:
-            from duckduckgo_search import DDGS
+        cache_key = ("news", query, max_results, time_range)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug("News search cache hit", query=query)
+            return cached
 
+        try:
             logger.info("Executing DuckDuckGo news search", query=query)
 
             def do_news_search() -> list[dict[str, Any]]:
-                with DDGS() as ddgs:
-                    return list(
-                        ddgs.news(
-                            query,
-                            timelimit=time_range,
-                            max_results=max_results,
-                        )
+                return list(
+                    ddgs.news(
+                        query,
+                        timelimit=time_range,
+                        max_results=max_results,
                     )
+                )
 
-            results = await asyncio.get_event_loop().run_in_executor(None, do_news_search)
+            results = await self._run_with_retry("news search", do_news_search)
 
-            return [
+            retrieved_at = datetime.now()
+            news_results = [
                 WebSearchResult(
                     title=r.get("title", ""),
-                    url=r.get("url", r.get("link", "")),
-                    snippet=r.get("body", r.get("excerpt", "")),
+                    url=r.get("url", ""),
+                    snippet=r.get("body", ""),
                     source=r.get("source", "duckduckgo_news"),
-                    position=i + 1,
-                    retrieved_at=datetime.now(),
+                    position=position,
+                    retrieved_at=retrieved_at,
                 )
-                for i, r in enumerate(results)
+                for position, r in enumerate(results, 1)
             ]
 
+            self._put_cached(cache_key, news_results)
+            return news_results
+
         except Exception as e:
             raise SearchError(f"News search failed: {e}", e)
 
+    async def __aenter__(self) -> "DuckDuckGoAdapter":
+        """Use the adapter as an async context manager that closes on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the adapter when leaving the context."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Drop the ddgs client and cached results.
+
+        ddgs has no close method; dropping the client releases its engines
+        (and their HTTP sessions) once no search still uses them. Closing
+        twice is harmless, and a later search builds a new client.
+        """
+        self._ddgs = None
+        self._cache.clear()
+        self._healthy_until = 0.0
+        logger.debug("DuckDuckGoAdapter closed")
+
     async def health_check(self) -> bool:
         """
         Check if DuckDuckGo search is available.
 
+        A success is reused for HEALTH_CHECK_TTL seconds, so frequent probes
+        do not eat into DuckDuckGo's rate limit.
+
         Returns:
             True if service is working
         """
+        if time.monotonic() < self._healthy_until:
+            return True
+
+        # A cached search result would say nothing about the service right now
+        self._cache.pop(("text", "test", 1, "us-en"), None)
         try:
             results = await self.search("test", max_results=1)
-            return len(results) > 0
+            if not results:
+                return False
+            self._healthy_until = time.monotonic() + self.HEALTH_CHECK_TTL
+            return True
         except Exception as e:
             logger.error("Health check failed", error=str(e))
             return False
@@ -8,9 +8,9 @@ Google Gemini provides a generous FREE tier:
 Get your free API key at: https://aistudio.google.com/apikey
 """
 
-import asyncio
 import json
-import random
+import re
+import time
 from typing import Any, ClassVar
 
 import structlog
@@ -22,9 +22,26 @@ from src.domain.ports.llm_port import (
     LLMResponse,
     LLMResponseError,
 )
+from src.infrastructure.adapters._rate_limit import AsyncTokenBucket, TokenBucketRateLimiter
+from src.infrastructure.adapters._retry import retry_with_backoff
+from src.infrastructure.adapters._structured import (
+    parse_json,
+    strip_code_fence,
+    structured_system_prompt,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Error message fragments that mean the request hit a quota or rate limit
+_RATE_LIMIT_RE = re.compile(
+    r"rate limit|quota|429|too many requests|resource_exhausted", re.IGNORECASE
+)
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """Check whether an error is a (retryable) rate limit error."""
+    return _RATE_LIMIT_RE.search(str(error)) is not None
+
 
 class GeminiLLMAdapter(LLMPort):
     """
@@ -52,6 +69,14 @@ class GeminiLLMAdapter(LLMPort):
     BASE_DELAY: ClassVar[float] = 2.0  # seconds
     MAX_DELAY: ClassVar[float] = 60.0  # seconds
 
+    # Free tier limits of the default model, enforced client-side so bursts
+    # wait instead of running into 429s and retry backoff
+    REQUESTS_PER_MINUTE: ClassVar[int] = 15
+    REQUESTS_PER_DAY: ClassVar[int] = 1500
+
+    # How long a successful health check is trusted before probing again
+    HEALTH_CHECK_TTL: ClassVar[float] = 30.0  # seconds
+
     def __init__(
         self,
         api_key: str,
@@ -75,12 +100,23 @@ class GeminiLLMAdapter(LLMPort):
         self._temperature = temperature
         self._max_tokens = max_tokens
         self._max_retries = max_retries
+        # Set on every client, so the agent's calls are paced as well
+        self._rate_limiter = TokenBucketRateLimiter(
+            AsyncTokenBucket(self.REQUESTS_PER_MINUTE / 60, self.REQUESTS_PER_MINUTE),
+            AsyncTokenBucket(self.REQUESTS_PER_DAY / 86400, self.REQUESTS_PER_DAY),
+        )
+        # Monotonic time until which the last successful health check stands
+        self._healthy_until = 0.0
+
+        # Clients for overridden (temperature, max_tokens), created on first use
+        self._clients: dict[tuple[float, int], ChatGoogleGenerativeAI] = {}
 
         self._client = ChatGoogleGenerativeAI(
             model=model,
             google_api_key=api_key,
             temperature=temperature,
             max_tokens=max_tokens,
+            rate_limiter=self._rate_limiter,
         )
 
         logger.info(
@@ -90,6 +126,31 @@ class GeminiLLMAdapter(LLMPort):
             max_retries=max_retries,
         )
 
+    def _get_client(
+        self, temperature: float | None, max_tokens: int | None
+    ) -> ChatGoogleGenerativeAI:
+        """
+        Get a client for the given overrides, reusing earlier ones.
+
+        Building a client sets up its credentials and HTTP transport, so one
+        is kept per (temperature, max_tokens) pair instead of per call.
+        """
+        if temperature is None and max_tokens is None:
+            return self._client
+
+        key = (temperature or self._temperature, max_tokens or self._max_tokens)
+        client = self._clients.get(key)
+        if client is None:
+            client = ChatGoogleGenerativeAI(
+                model=self._model,
+                google_api_key=self._api_key,
+                temperature=key[0],
+                max_tokens=key[1],
+                rate_limiter=self._rate_limiter,
+            )
+            self._clients[key] = client
+        return client
+
     def get_langchain_llm(self) -> ChatGoogleGenerativeAI:
         """
         Get the LangChain ChatGoogleGenerativeAI instance for use with agents.
@@ -120,58 +181,21 @@ class GeminiLLMAdapter(LLMPort):
         Raises:
             LLMRateLimitError: If all retries exhausted
         """
-        last_error = None
-
-        for attempt in range(self._max_retries + 1):
-            try:
-                return await coro_func(*args, **kwargs)
-
-            except Exception as e:
-                error_msg = str(e).lower()
-
-                # Check if it's a rate limit error
-                is_rate_limit = any(
-                    x in error_msg
-                    for x in [
-                        "rate limit",
-                        "quota",
-                        "429",
-                        "too many requests",
-                        "resource_exhausted",
-                    ]
-                )
-
-                if not is_rate_limit:
-                    # Not a rate limit error, don't retry
-                    raise
-
-                last_error = e
-
-                if attempt < self._max_retries:
-                    # Calculate delay with exponential backoff + jitter
-                    delay = min(
-                        self.BASE_DELAY * (2**attempt) + random.uniform(0, 1), self.MAX_DELAY
-                    )
-
-                    logger.warning(
-                        f"Rate limit hit, retrying {operation}",
-                        attempt=attempt + 1,
-                        max_retries=self._max_retries,
-                        delay_seconds=round(delay, 2),
-                        error=str(e)[:100],
-                    )
-
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(
-                        f"All retries exhausted for {operation}",
-                        attempts=self._max_retries + 1,
-                        error=str(e),
-                    )
-
-        raise LLMRateLimitError(
-            f"Rate limit exceeded after {self._max_retries + 1} attempts: {last_error}", last_error
-        )
+        try:
+            return await retry_with_backoff(
+                operation,
+                lambda: coro_func(*args, **kwargs),
+                max_retries=self._max_retries,
+                base_delay=self.BASE_DELAY,
+                max_delay=self.MAX_DELAY,
+                is_retryable=_is_rate_limit,
+            )
+        except Exception as e:
+            if not _is_rate_limit(e):
+                raise
+            raise LLMRateLimitError(
+                f"Rate limit exceeded after {self._max_retries + 1} attempts: {e}", e
+            )
 
     async def generate(
         self,
@@ -210,22 +234,14 @@ class GeminiLLMAdapter(LLMPort):
         max_tokens: int | None = None,
     ) -> LLMResponse:
         """Internal generate method without retry wrapper."""
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        user_message = {"role": "user", "content": prompt}
+        messages = (
+            ({"role": "system", "content": system_prompt}, user_message)
+            if system_prompt
+            else (user_message,)
+        )
 
-        messages.append({"role": "user", "content": prompt})
-
-        # Create a new client with overridden parameters if needed
-        client = self._client
-        if temperature is not None or max_tokens is not None:
-            client = ChatGoogleGenerativeAI(
-                model=self._model,
-                google_api_key=self._api_key,
-                temperature=temperature or self._temperature,
-                max_tokens=max_tokens or self._max_tokens,
-            )
+        client = self._get_client(temperature, max_tokens)
 
         response = await client.ainvoke(messages)
 
@@ -273,19 +289,10 @@ class GeminiLLMAdapter(LLMPort):
         Returns:
             Parsed dictionary matching the schema
         """
-        schema_str = json.dumps(output_schema, indent=2)
-
-        structured_system_prompt = (
-            f"{system_prompt or ''}\n\n"
-            f"You must respond with valid JSON matching this schema:\n"
-            f"{schema_str}\n\n"
-            f"Respond ONLY with the JSON object, no additional text."
-        )
-
         try:
             response = await self.generate(
                 prompt=prompt,
-                system_prompt=structured_system_prompt.strip(),
+                system_prompt=structured_system_prompt(output_schema, system_prompt),
                 temperature=0.3,  # Lower temperature for structured output
             )
 
@@ -293,11 +300,9 @@ class GeminiLLMAdapter(LLMPort):
             content = response.content.strip()
 
             # Handle markdown code blocks
-            if content.startswith("```"):
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1])
+            content = strip_code_fence(content)
 
-            result: dict[str, Any] = json.loads(content)
+            result: dict[str, Any] = parse_json(content)
             return result
 
         except json.JSONDecodeError as e:
@@ -339,15 +344,24 @@ class GeminiLLMAdapter(LLMPort):
         """
         Check if Gemini API is available.
 
+        A success is reused for HEALTH_CHECK_TTL seconds, so frequent probes
+        do not spend the daily request quota.
+
         Returns:
             True if service is healthy
         """
+        if time.monotonic() < self._healthy_until:
+            return True
+
         try:
             response = await self.generate(
                 prompt="Say 'OK' if you're working.",
                 max_tokens=10,
             )
-            return bool(response.content)
+            if not response.content:
+                return False
+            self._healthy_until = time.monotonic() + self.HEALTH_CHECK_TTL
+            return True
         except Exception as e:
             logger.error("Gemini health check failed", error=str(e))
             return False
@@ -7,6 +7,8 @@ https://console.groq.com/keys
 """
 
 import json
+import re
+import time
 from typing import Any, ClassVar
 
 import structlog
@@ -21,9 +23,19 @@ from src.domain.ports.llm_port import (
     LLMResponse,
     LLMResponseError,
 )
+from src.infrastructure.adapters._rate_limit import AsyncTokenBucket, TokenBucketRateLimiter
+from src.infrastructure.adapters._structured import (
+    parse_json,
+    strip_code_fence,
+    structured_system_prompt,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Error message fragments used to map failures onto LLMError subclasses
+_RATE_LIMIT_RE = re.compile(r"rate limit", re.IGNORECASE)
+_CONNECTION_RE = re.compile(r"connection|timeout", re.IGNORECASE)
+
 
 class GroqLLMAdapter(LLMPort):
     """
@@ -41,6 +53,13 @@ class GroqLLMAdapter(LLMPort):
         "gemma2-9b-it",
     ]
 
+    # Free tier request limit, enforced client-side so bursts wait instead
+    # of running into 429s
+    REQUESTS_PER_MINUTE: ClassVar[int] = 30
+
+    # How long a successful health check is trusted before probing again
+    HEALTH_CHECK_TTL: ClassVar[float] = 30.0  # seconds
+
     def __init__(
         self,
         api_key: str,
@@ -61,12 +80,22 @@ class GroqLLMAdapter(LLMPort):
         self._model = model
         self._temperature = temperature
         self._max_tokens = max_tokens
+        # Set on every client, so the agent's calls are paced as well
+        self._rate_limiter = TokenBucketRateLimiter(
+            AsyncTokenBucket(self.REQUESTS_PER_MINUTE / 60, self.REQUESTS_PER_MINUTE)
+        )
+        # Monotonic time until which the last successful health check stands
+        self._healthy_until = 0.0
+
+        # Clients for overridden (temperature, max_tokens), created on first use
+        self._clients: dict[tuple[float, int], ChatGroq] = {}
 
         self._client = ChatGroq(
             api_key=SecretStr(api_key),
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
+            rate_limiter=self._rate_limiter,
         )
 
         logger.info(
@@ -75,6 +104,29 @@ class GroqLLMAdapter(LLMPort):
             temperature=temperature,
         )
 
+    def _get_client(self, temperature: float | None, max_tokens: int | None) -> ChatGroq:
+        """
+        Get a client for the given overrides, reusing earlier ones.
+
+        Building a client sets up its credentials and HTTP transport, so one
+        is kept per (temperature, max_tokens) pair instead of per call.
+        """
+        if temperature is None and max_tokens is None:
+            return self._client
+
+        key = (temperature or self._temperature, max_tokens or self._max_tokens)
+        client = self._clients.get(key)
+        if client is None:
+            client = ChatGroq(
+                api_key=SecretStr(self._api_key),
+                model=self._model,
+                temperature=key[0],
+                max_tokens=key[1],
+                rate_limiter=self._rate_limiter,
+            )
+            self._clients[key] = client
+        return client
+
     def get_langchain_llm(self) -> ChatGroq:
         """
         Get the LangChain ChatGroq instance for use with agents.
@@ -104,22 +156,14 @@ class GroqLLMAdapter(LLMPort):
             LLMResponse with generated content
         """
         try:
-            messages = []
-
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            messages.append({"role": "user", "content": prompt})
+            user_message = {"role": "user", "content": prompt}
+            messages = (
+                ({"role": "system", "content": system_prompt}, user_message)
+                if system_prompt
+                else (user_message,)
+            )
 
-            # Create a new client with overridden parameters if needed
-            client = self._client
-            if temperature is not None or max_tokens is not None:
-                client = ChatGroq(
-                    api_key=SecretStr(self._api_key),
-                    model=self._model,
-                    temperature=temperature or self._temperature,
-                    max_tokens=max_tokens or self._max_tokens,
-                )
+            client = self._get_client(temperature, max_tokens)
 
             response = await client.ainvoke(messages)
 
@@ -138,10 +182,10 @@ class GroqLLMAdapter(LLMPort):
             )
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "rate limit" in error_msg:
+            error_msg = str(e)
+            if _RATE_LIMIT_RE.search(error_msg):
                 raise LLMRateLimitError(f"Rate limit exceeded: {e}", e)
-            elif "connection" in error_msg or "timeout" in error_msg:
+            elif _CONNECTION_RE.search(error_msg):
                 raise LLMConnectionError(f"Connection failed: {e}", e)
             else:
                 raise LLMError(f"Generation failed: {e}", e)
@@ -163,19 +207,10 @@ class GroqLLMAdapter(LLMPort):
         Returns:
             Parsed dictionary matching the schema
         """
-        schema_str = json.dumps(output_schema, indent=2)
-
-        structured_system_prompt = (
-            f"{system_prompt or ''}\n\n"
-            f"You must respond with valid JSON matching this schema:\n"
-            f"{schema_str}\n\n"
-            f"Respond ONLY with the JSON object, no additional text."
-        )
-
         try:
             response = await self.generate(
                 prompt=prompt,
-                system_prompt=structured_system_prompt.strip(),
+                system_prompt=structured_system_prompt(output_schema, system_prompt),
                 temperature=0.3,  # Lower temperature for structured output
             )
 
@@ -183,11 +218,9 @@ class GroqLLMAdapter(LLMPort):
             content = response.content.strip()
 
             # Handle markdown code blocks
-            if content.startswith("```"):
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1])
+            content = strip_code_fence(content)
 
-            result: dict[str, Any] = json.loads(content)
+            result: dict[str, Any] = parse_json(content)
             return result
 
         except json.JSONDecodeError as e:
@@ -229,15 +262,24 @@ class GroqLLMAdapter(LLMPort):
         """
         Check if Groq API is available.
 
+        A success is reused for HEALTH_CHECK_TTL seconds, so frequent probes
+        do not spend the request quota.
+
         Returns:
             True if service is healthy
         """
+        if time.monotonic() < self._healthy_until:
+            return True
+
         try:
             response = await self.generate(
                 prompt="Say 'OK' if you're working.",
                 max_tokens=10,
             )
-            return bool(response.content)
+            if not response.content:
+                return False
+            self._healthy_until = time.monotonic() + self.HEALTH_CHECK_TTL
+            return True
         except Exception as e:
             logger.error("Health check failed", error=str(e))
             return False
@@ -10,15 +10,20 @@ from typing import Annotated
 
 import structlog
 from fastapi import Depends
+from langchain_core.embeddings import Embeddings
 from langchain_core.tools import BaseTool
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.application.services.memory_manager import MemoryManager
 from src.application.services.research_agent import AgentConfig, ResearchAgentService
+from src.application.services.response_cache import ResponseCache
+from src.application.services.semantic_cache import SemanticCache
 from src.application.services.sqlite_memory import SQLiteMemoryManager
 from src.application.tools.text_analyzer import TextAnalyzerTool
 from src.application.tools.web_search import NewsSearchTool, WebSearchTool
 from src.domain.ports.llm_port import LLMPort
+from src.infrastructure.adapters._rate_limit import TokenBucketRateLimiter
+from src.infrastructure.adapters.duckduckgo_adapter import DuckDuckGoAdapter
 from src.infrastructure.adapters.llm_factory import LLMFactory
 
 logger = structlog.get_logger(__name__)
@@ -54,6 +59,21 @@ class Settings(BaseSettings):
 
     # Memory Database
     memory_db_path: str = "./data/memory.db"
+    memory_write_delay: float = 0.2  # seconds interactions wait to be written together
+
+    # Semantic memory lookup (embeds stored queries, needs GOOGLE_API_KEY)
+    memory_embeddings_enabled: bool = False
+
+    # Response Cache (0 disables caching of completed research)
+    response_cache_size: int = 256
+    response_cache_ttl: int = 86400  # seconds, 0 keeps results until evicted
+
+    # Semantic Cache (reuses research for paraphrased questions, needs GOOGLE_API_KEY)
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.92
+
+    # Embedding model shared by semantic memory and the semantic cache
+    embedding_model: str = "models/gemini-embedding-001"
 
     # Logging
     log_level: str = "INFO"
@@ -78,6 +98,33 @@ def get_settings() -> Settings:
     return Settings()
 
 
+# Embedding model singleton shared by memory and the semantic cache
+_embeddings: Embeddings | None = None
+
+
+def get_embeddings() -> Embeddings | None:
+    """
+    Get or create the embedding model singleton.
+
+    Returns:
+        Gemini embeddings instance, or None if no GOOGLE_API_KEY is set
+    """
+    global _embeddings
+    settings = get_settings()
+    if not settings.google_api_key:
+        return None
+    if _embeddings is None:
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+        from pydantic import SecretStr
+
+        _embeddings = GoogleGenerativeAIEmbeddings(
+            model=settings.embedding_model,
+            api_key=SecretStr(settings.google_api_key),
+        )
+        logger.info("Embeddings initialized", model=settings.embedding_model)
+    return _embeddings
+
+
 # Memory manager singleton
 _memory_manager: MemoryManager | None = None
 
@@ -92,18 +139,90 @@ def get_memory_manager() -> MemoryManager:
     global _memory_manager
     if _memory_manager is None:
         settings = get_settings()
+        embeddings = get_embeddings() if settings.memory_embeddings_enabled else None
         _memory_manager = SQLiteMemoryManager(
             db_path=settings.memory_db_path,
             max_entries=settings.agent_memory_size,
+            embeddings=embeddings,
+            write_delay=settings.memory_write_delay,
+            embedding_model=settings.embedding_model,
         )
         logger.info(
             "SQLiteMemoryManager initialized",
             db_path=settings.memory_db_path,
             max_entries=settings.agent_memory_size,
+            semantic=embeddings is not None,
         )
     return _memory_manager
 
 
+def close_memory_manager() -> None:
+    """Close the memory manager's database connection, if it was created."""
+    if _memory_manager is not None:
+        _memory_manager.close()
+
+
+# Response cache singleton shared by all agent instances
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    Get or create the response cache singleton.
+
+    Returns:
+        ResponseCache instance, or None if caching is disabled
+    """
+    global _response_cache
+    settings = get_settings()
+    if settings.response_cache_size <= 0:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_entries=settings.response_cache_size,
+            ttl_seconds=settings.response_cache_ttl or None,
+        )
+        logger.info(
+            "ResponseCache initialized",
+            max_entries=settings.response_cache_size,
+            ttl_seconds=settings.response_cache_ttl,
+        )
+    return _response_cache
+
+
+# Semantic cache singleton shared by all agent instances
+_semantic_cache: SemanticCache | None = None
+
+
+def get_semantic_cache() -> SemanticCache | None:
+    """
+    Get or create the semantic cache singleton.
+
+    Returns:
+        SemanticCache instance, or None if disabled or no embedding key is set
+    """
+    global _semantic_cache
+    settings = get_settings()
+    if not settings.semantic_cache_enabled:
+        return None
+    embeddings = get_embeddings()
+    if embeddings is None:
+        return None
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache(
+            embeddings=embeddings,
+            threshold=settings.semantic_cache_threshold,
+            max_entries=settings.response_cache_size,
+            ttl_seconds=settings.response_cache_ttl or None,
+        )
+        logger.info(
+            "SemanticCache initialized",
+            model=settings.embedding_model,
+            threshold=settings.semantic_cache_threshold,
+        )
+    return _semantic_cache
+
+
 # LLM adapter singleton for consistent state
 _llm_adapter: LLMPort | None = None
 
@@ -145,6 +264,17 @@ def get_llm_adapter(
     return _llm_adapter
 
 
+@lru_cache
+def get_search_rate_limiter() -> TokenBucketRateLimiter:
+    """
+    Get the rate limiter shared by all web searches.
+
+    Returns:
+        Limiter pacing searches to DuckDuckGo's request limits
+    """
+    return DuckDuckGoAdapter.create_rate_limiter()
+
+
 def get_tools(
     settings: Annotated[Settings, Depends(get_settings)],  # noqa: ARG001
     llm_adapter: Annotated[LLMPort, Depends(get_llm_adapter)],
@@ -162,9 +292,11 @@ def get_tools(
     # Use the LLM adapter for text analyzer
     llm = llm_adapter.get_langchain_llm()
 
+    # Both search tools draw on one request budget
+    search_rate_limiter = get_search_rate_limiter()
     tools: list[BaseTool] = [
-        WebSearchTool(),
-        NewsSearchTool(),
+        WebSearchTool(rate_limiter=search_rate_limiter),
+        NewsSearchTool(rate_limiter=search_rate_limiter),
         TextAnalyzerTool(llm=llm),
     ]
 
@@ -172,33 +304,46 @@ def get_tools(
     return tools
 
 
+# Research agent singleton; building the executor binds tools and prompts
+_research_agent: ResearchAgentService | None = None
+
+
 def get_research_agent(
     settings: Annotated[Settings, Depends(get_settings)],
     llm_adapter: Annotated[LLMPort, Depends(get_llm_adapter)],
-    tools: Annotated[list[BaseTool], Depends(get_tools)],
     memory: Annotated[MemoryManager, Depends(get_memory_manager)],
+    response_cache: Annotated[ResponseCache | None, Depends(get_response_cache)],
+    semantic_cache: Annotated[SemanticCache | None, Depends(get_semantic_cache)],
 ) -> ResearchAgentService:
     """
-    Get the research agent service.
+    Get or create the research agent service singleton.
 
     Args:
         settings: Application settings
         llm_adapter: LLM adapter instance
-        tools: Available tools
         memory: Memory manager
+        response_cache: Cache of previously completed research
+        semantic_cache: Cache matching paraphrased questions
 
     Returns:
         Configured ResearchAgentService
     """
-    config = AgentConfig(
-        max_iterations=settings.agent_max_iterations,
-        max_execution_time=settings.agent_max_execution_time,
-        verbose=settings.api_debug,
-    )
-
-    return ResearchAgentService(
-        llm=llm_adapter.get_langchain_llm(),
-        tools=tools,
-        memory_manager=memory,
-        config=config,
-    )
+    global _research_agent
+    if _research_agent is None:
+        # Tools are only built for the first request; later ones reuse the agent
+        tools = get_tools(settings, llm_adapter)
+        config = AgentConfig(
+            max_iterations=settings.agent_max_iterations,
+            max_execution_time=settings.agent_max_execution_time,
+            verbose=settings.api_debug,
+        )
+        _research_agent = ResearchAgentService(
+            llm=llm_adapter.get_langchain_llm(),
+            tools=tools,
+            memory_manager=memory,
+            config=config,
+            response_cache=response_cache,
+            semantic_cache=semantic_cache,
+        )
+        logger.info("ResearchAgentService initialized", tools=[t.name for t in tools])
+    return _research_agent
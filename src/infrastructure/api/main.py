@@ -13,7 +13,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from src.infrastructure.api.dependencies import get_settings
+from src.infrastructure.api.dependencies import close_memory_manager, get_settings
 from src.infrastructure.api.routes import research
 
 logger = structlog.get_logger(__name__)
@@ -39,6 +39,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down Autonomous Tech Research Agent")
+    close_memory_manager()
 
 
 def create_app() -> FastAPI:
@@ -179,7 +179,7 @@ async def generate_research_report(
             ],
             recommendations=list(report.recommendations),
             confidence_level=report.confidence_level,
-            metadata=report.metadata,
+            metadata=report.metadata.to_dict(),
         )
 
     except Exception as e:
@@ -6,12 +6,18 @@ with mocked dependencies.
 """
 
 from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-from src.infrastructure.api.dependencies import get_llm_adapter, get_research_agent
+from src.application.services.sqlite_memory import SQLiteMemoryManager
+from src.infrastructure.api.dependencies import (
+    get_llm_adapter,
+    get_memory_manager,
+    get_research_agent,
+)
 from src.infrastructure.api.main import app
 
 
@@ -31,17 +37,21 @@ def mock_research_agent() -> MagicMock:
 
 @pytest.fixture
 def client(
-    mock_llm_adapter: MagicMock, mock_research_agent: MagicMock
+    mock_llm_adapter: MagicMock, mock_research_agent: MagicMock, tmp_path: Path
 ) -> Generator[TestClient, None, None]:
     """Create a test client with mocked dependencies."""
     # Override dependencies that require API keys
     app.dependency_overrides[get_llm_adapter] = lambda: mock_llm_adapter
     app.dependency_overrides[get_research_agent] = lambda: mock_research_agent
+    # Keep the memory database out of the working tree
+    memory = SQLiteMemoryManager(db_path=str(tmp_path / "memory.db"))
+    app.dependency_overrides[get_memory_manager] = lambda: memory
 
     yield TestClient(app)
 
     # Clean up overrides
     app.dependency_overrides.clear()
+    memory.close()
 
 
 class TestHealthEndpoints:
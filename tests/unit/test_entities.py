@@ -5,11 +5,17 @@ These tests verify the business logic in the domain layer,
 ensuring entities behave correctly and maintain invariants.
 """
 
+import json
+import sys
+from dataclasses import replace
 from datetime import datetime
-from uuid import UUID
+from uuid import RFC_4122, UUID
 
 import pytest
 
+from src.domain import _now, _uuidpool
+from src.domain._now import recent_now
+from src.domain._uuidpool import fast_uuid4
 from src.domain.entities.query import (
     QueryPriority,
     QueryType,
@@ -26,6 +32,7 @@ from src.domain.entities.research import (
     SearchResult,
     SourceCredibility,
 )
+from src.domain.ports.llm_port import LLMResponse
 
 
 class TestResearchQuery:
@@ -60,6 +67,25 @@ class TestResearchQuery:
         assert "FastAPI" in query.search_query
         assert "Python" in query.search_query
 
+    def test_query_search_query_cached(self) -> None:
+        """Test that the search string is built once and follows keyword updates."""
+        query = ResearchQuery.create(question="What are the best practices for FastAPI?")
+        search_query = query.search_query
+        updated = query.with_keywords(("deploy",))
+
+        assert search_query == "What are the best practices for FastAPI?"
+        assert query.search_query is search_query
+        assert updated.search_query == f"{search_query} deploy"
+        assert query == query.with_keywords(())
+
+    def test_query_question_tokens(self) -> None:
+        """Test that the question is tokenized once at creation."""
+        query = ResearchQuery.create(question="FastAPI Best Practices for FastAPI")
+
+        assert query.question_tokens == frozenset({"fastapi", "best", "practices", "for"})
+        assert query.with_keywords(("api",)).question_tokens == query.question_tokens
+        assert query.with_keywords(("api",)).question_tokens is query.question_tokens
+
     def test_query_immutable_update(self) -> None:
         """Test immutable keyword update."""
         original = ResearchQuery.create(
@@ -71,6 +97,16 @@ class TestResearchQuery:
         assert updated.keywords == ("new", "keywords")
         assert original.id == updated.id
 
+    def test_query_hashes_by_id(self) -> None:
+        """Test that queries can key dicts and compare by value."""
+        query = ResearchQuery.create(question="What are the best practices for FastAPI?")
+        updated = query.with_keywords(("api",))
+
+        assert hash(updated) == hash(query)
+        assert updated != query
+        assert {query: 1}[query] == 1
+        assert query.with_keywords(()) == query
+
     def test_query_validation_short_question(self) -> None:
         """Test validation rejects short questions."""
         with pytest.raises(ValueError, match="at least 10 characters"):
@@ -95,6 +131,19 @@ class TestResearchQuery:
         assert "id" in data
         assert data["question"] == "What are the best practices for FastAPI?"
         assert data["query_type"] == "technical"
+        assert type(data["query_type"]) is str
+        assert type(data["priority"]) is str
+
+    def test_query_to_dict_serializes_keywords_as_array(self) -> None:
+        """Test that the keyword tuple is shared and still dumps as a JSON array."""
+        query = ResearchQuery.create(
+            question="What are the best practices for FastAPI?",
+            keywords=("fastapi", "deploy"),
+        )
+        data = query.to_dict()
+
+        assert data["keywords"] is query.keywords
+        assert json.loads(json.dumps(data))["keywords"] == ["fastapi", "deploy"]
 
 
 class TestSearchResult:
@@ -131,6 +180,38 @@ class TestSearchResult:
         with pytest.raises(ValueError, match="Title cannot be empty"):
             SearchResult.create(title="", url="https://example.com", snippet="text")
 
+    def test_search_result_validation_blank_url(self) -> None:
+        """Test validation runs after stripping and results stay immutable."""
+        with pytest.raises(ValueError, match="URL cannot be empty"):
+            SearchResult.create(title="Title", url="   ", snippet="text")
+
+        result = SearchResult.create(title="Title", url="https://example.com", snippet="text")
+        with pytest.raises(AttributeError):
+            result.title = "Changed"  # type: ignore[misc]
+
+    def test_search_result_dict_strings_are_interned(self) -> None:
+        """Test that to_dict keys and enum values are the interned string objects."""
+        result = SearchResult.create(
+            title="Test",
+            url="https://example.com",
+            snippet="Snippet",
+            credibility=SourceCredibility.HIGH,
+        )
+        data = result.to_dict()
+
+        assert all(key is sys.intern(key) for key in data)
+        assert data["credibility"] is sys.intern("high")
+
+    def test_repeated_search_text_is_shared(self) -> None:
+        """Test that equal URLs, titles and snippets share one string object."""
+        url = "https://example.com/page"
+        first = SearchResult.create(title="Title", url=url, snippet="Snippet")
+        second = SearchResult.create(title="Title", url="".join(url), snippet=" Snippet ")
+
+        assert second.url is first.url
+        assert second.title is first.title
+        assert second.snippet is first.snippet
+
     def test_search_result_to_dict(self) -> None:
         """Test serialization to dictionary."""
         result = SearchResult.create(
@@ -205,6 +286,15 @@ class TestResearchResult:
         assert not failed.is_successful
         assert "Error: Connection timeout" in failed.key_findings
 
+    def test_result_hashes_by_id(self) -> None:
+        """Test that results key dicts by id, across status transitions."""
+        pending = ResearchResult.create_pending(UUID(int=1))
+        failed = pending.mark_failed("Connection timeout")
+
+        assert hash(failed) == hash(pending) == hash(pending.id)
+        assert failed != pending
+        assert {pending: 1}[pending] == 1
+
     def test_result_validation_confidence_range(self) -> None:
         """Test confidence score validation."""
         query = ResearchQuery.create(
@@ -221,6 +311,48 @@ class TestResearchResult:
                 processing_time_ms=100,
             )
 
+    def test_result_to_dict_is_cached_safely(self) -> None:
+        """Test that cached to_dict values are not shared with callers or carried over."""
+        pending = ResearchResult.create_pending(UUID(int=1))
+        data = pending.to_dict()
+        failed = pending.mark_failed("boom")
+
+        data["status"] = "mutated"
+        assert pending.to_dict()["status"] == "pending"
+        assert failed.to_dict()["status"] == "failed"
+        assert replace(pending) == pending  # the cache does not take part in equality
+
+        pending.synthesis = "Updated"
+        assert pending.to_dict()["synthesis"] == "Updated"
+
+    def test_result_to_dict_search_results(self) -> None:
+        """Test that to_dict serializes each search result."""
+        completed = ResearchResult.create_pending(UUID(int=1)).with_results(
+            search_results=(SearchResult.create(title="T", url="https://a.io", snippet="S"),),
+            key_findings=("Finding",),
+            synthesis="Synthesis",
+            confidence_score=0.5,
+            processing_time_ms=10,
+        )
+        full = completed.to_dict()
+
+        assert full["source_count"] == 1
+        assert [sr["url"] for sr in full["search_results"]] == ["https://a.io"]
+        assert ResearchResult.create_pending(UUID(int=2)).to_dict()["search_results"] == ()
+
+    def test_result_validation_processing_time(self) -> None:
+        """Test that negative processing times are rejected."""
+        pending = ResearchResult.create_pending(UUID(int=1))
+
+        with pytest.raises(ValueError, match="cannot be negative"):
+            pending.with_results(
+                search_results=(),
+                key_findings=(),
+                synthesis="",
+                confidence_score=0.5,
+                processing_time_ms=-1,
+            )
+
 
 class TestReportSection:
     """Tests for ReportSection entity."""
@@ -244,6 +376,14 @@ class TestReportSection:
         with pytest.raises(ValueError, match="title cannot be empty"):
             ReportSection.create(title="", content="Some content", order=0)
 
+    def test_section_default_sources(self) -> None:
+        """Test that sections built without sources share the empty tuple."""
+        first = ReportSection(title="A", content="a", order=0)
+        second = ReportSection(title="B", content="b", order=1)
+
+        assert first.sources == ()
+        assert first.sources is second.sources
+
 
 class TestResearchReport:
     """Tests for ResearchReport entity."""
@@ -281,7 +421,13 @@ class TestResearchReport:
         assert report.section_count == 1
         assert len(report.recommendations) == 2
         assert "Medium" in report.confidence_level
-        assert report.metadata["confidence_score"] == 0.75
+        assert report.metadata.confidence_score == 0.75
+        assert report.to_dict()["metadata"] == {
+            "sources_consulted": 0,
+            "findings_count": 1,
+            "processing_time_ms": 2000,
+            "confidence_score": 0.75,
+        }
 
     def test_report_to_markdown(self) -> None:
         """Test markdown generation."""
@@ -319,6 +465,112 @@ class TestResearchReport:
         assert "## Recommendations" in markdown
         assert "1. Do this" in markdown
 
+    def test_report_to_markdown_layout(self) -> None:
+        """Test the exact markdown layout, with sections in display order."""
+        research = ResearchResult.create_pending(UUID(int=1)).with_results(
+            search_results=(),
+            key_findings=(),
+            synthesis="Summary.",
+            confidence_score=0.9,
+            processing_time_ms=10,
+        )
+        report = ResearchReport.from_research(
+            research=research,
+            title="Report",
+            sections=(
+                ReportSection.create(title="Second", content="B.", order=2),
+                ReportSection.create(title="First", content="A.", order=1, sources=("s1", "s2")),
+            ),
+            recommendations=("Do this", "Then that"),
+        )
+
+        assert [s.title for s in report.get_sections_sorted()] == ["First", "Second"]
+        assert [s["title"] for s in report.to_dict()["sections"]] == ["First", "Second"]
+        assert report.to_markdown() == (
+            "# Report\n\n## Executive Summary\n\nSummary.\n\n"
+            "## First\n\nA.\n\n**Sources:**\n- s1\n- s2\n\n"
+            "## Second\n\nB.\n\n"
+            "## Recommendations\n\n1. Do this\n2. Then that\n\n"
+            f"---\n*Confidence Level: {report.confidence_level}*\n"
+            f"*Generated at: {report.created_at.isoformat()}*"
+        )
+
+    def test_report_to_dict_is_cached_safely(self) -> None:
+        """Test that callers get their own dict and assignments refresh the cache."""
+        report = ResearchReport.from_research(
+            research=ResearchResult.create_pending(UUID(int=1)),
+            title="Report",
+            sections=(),
+            recommendations=(),
+        )
+
+        report.to_dict()["title"] = "Mutated"
+        assert report.to_dict()["title"] == "Report"
+        report.title = "Renamed"
+        assert report.to_dict()["title"] == "Renamed"
+
+    def test_ordered_sections_are_not_copied(self) -> None:
+        """Test that sections already in display order are reused as-is."""
+        sections = (
+            ReportSection.create(title="First", content="A.", order=1),
+            ReportSection.create(title="Second", content="B.", order=2),
+        )
+        report = ResearchReport.from_research(
+            research=ResearchResult.create_pending(UUID(int=1)),
+            title="Report",
+            sections=sections,
+            recommendations=(),
+        )
+
+        assert report.sorted_sections is sections
+
+
+class TestLLMResponse:
+    """Tests for the LLMResponse value object."""
+
+    @pytest.mark.parametrize(
+        "finish_reason,expected",
+        [("stop", True), ("end_turn", True), ("complete", True), ("length", False), ("", False)],
+    )
+    def test_is_complete(self, finish_reason: str, expected: bool) -> None:
+        """Test which finish reasons count as a normal completion."""
+        response = LLMResponse(
+            content="text", model="m", tokens_used=1, finish_reason=finish_reason, metadata={}
+        )
+
+        assert response.is_complete is expected
+
+
+class TestRecentNow:
+    """Tests for the cached entity clock."""
+
+    def test_reuses_datetime_within_resolution(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the datetime is reused for one resolution step, then refreshed."""
+        clock = [10**12]
+        monkeypatch.setattr(_now.time, "monotonic_ns", lambda: clock[0])
+        monkeypatch.setattr(_now, "_cached", (0, datetime.min))
+
+        first = recent_now()
+        clock[0] += _now.RESOLUTION_NS - 1
+        assert recent_now() is first
+
+        clock[0] += 1
+        refreshed = recent_now()
+        assert refreshed is not first
+        assert refreshed >= first
+
+
+class TestFastUUID4:
+    """Tests for pooled UUID generation."""
+
+    def test_uuids_are_unique_version_4(self) -> None:
+        """Test that ids across several pool refills are distinct, valid v4 UUIDs."""
+        ids = [fast_uuid4() for _ in range(3 * _uuidpool.POOL_BYTES // 16)]
+
+        assert len(set(ids)) == len(ids)
+        assert all(u.version == 4 and u.variant == RFC_4122 for u in ids)
+        assert all(UUID(str(u)) == u for u in ids[:10])
+
 
 class TestConfidenceLevel:
     """Tests for confidence level calculation."""
@@ -354,3 +606,20 @@ class TestConfidenceLevel:
         )
 
         assert expected_keyword in report.confidence_level
+
+    @pytest.mark.parametrize(
+        "score,expected_level",
+        [
+            (0.0, "Very Low"),
+            (0.3999, "Very Low"),
+            (0.4, "Low"),
+            (0.6, "Medium"),
+            (0.8, "High"),
+            (1.0, "High"),
+        ],
+    )
+    def test_confidence_level_boundaries(self, score: float, expected_level: str) -> None:
+        """Test that each threshold belongs to the band above it."""
+        level = ResearchReport._calculate_confidence_level(score)
+
+        assert level.startswith(f"{expected_level} - ")
@@ -5,16 +5,86 @@ These tests verify the business logic in the application layer,
 including the memory manager and agent configuration.
 """
 
+import asyncio
 import gc
+import json
 import os
+import sqlite3
 import tempfile
+import threading
 import time
+from contextlib import closing
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from ddgs.exceptions import TimeoutException
+from langchain_core.agents import AgentAction
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake import FakeListLLM
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
 
-from src.application.services.sqlite_memory import MemoryEntry, SQLiteMemoryManager
+from src.application.services import sqlite_memory
+from src.application.services.research_agent import (
+    REACT_PROMPT_TEMPLATE,
+    TOOL_CALLING_PROMPT_TEMPLATE,
+    AgentConfig,
+    ResearchAgentService,
+    _assess_credibility,
+    _is_blocked_url,
+)
+from src.application.services.response_cache import CachedResearch, ResponseCache
+from src.application.services.semantic_cache import SemanticCache
+from src.application.services.sqlite_memory import (
+    CONTEXT_WINDOW,
+    WRITE_BATCH_SIZE,
+    MemoryEntry,
+    SQLiteMemoryManager,
+)
+from src.application.services.vectors import dot, normalize, quantize, similarity
+from src.application.tools import web_search
+from src.application.tools.text_analyzer import AnalysisType, TextAnalyzerTool
+from src.application.tools.web_search import NewsSearchTool, WebSearchTool
+from src.domain.entities.query import ResearchQuery
+from src.domain.entities.research import (
+    ResearchResult,
+    ResearchStatus,
+    SearchResult,
+    SourceCredibility,
+)
+from src.domain.ports.llm_port import LLMPort
+from src.domain.ports.search_port import SearchError
+from src.infrastructure.adapters import _rate_limit, _retry, duckduckgo_adapter
+from src.infrastructure.adapters._rate_limit import AsyncTokenBucket, TokenBucketRateLimiter
+from src.infrastructure.adapters._structured import strip_code_fence, structured_system_prompt
+from src.infrastructure.adapters.duckduckgo_adapter import DuckDuckGoAdapter
+from src.infrastructure.adapters.gemini_adapter import GeminiLLMAdapter
+from src.infrastructure.adapters.groq_adapter import GroqLLMAdapter
+
+
+class TopicEmbeddings(Embeddings):
+    """Fake embeddings that place texts on axes by the topics they mention."""
+
+    TOPICS = (("kubernetes", "k8s"), ("fastapi",), ("react",))
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        lowered = text.lower()
+        return [float(any(alias in lowered for alias in topic)) for topic in self.TOPICS]
+
+
+class ToolCallingFakeChatModel(FakeMessagesListChatModel):
+    """Fake chat model that accepts tool binding and replays canned messages."""
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> Any:
+        return self
 
 
 @pytest.fixture
@@ -61,6 +131,33 @@ class TestMemoryManager:
         assert entries[0].query == "What is FastAPI?"
         assert entries[0].response == "FastAPI is a modern web framework..."
 
+    def test_add_interaction_without_metadata(self, temp_db_path: str) -> None:
+        """Test that missing or empty metadata is stored as the column default."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        memory.add_interaction(query="No metadata", response="Response")
+        memory.add_interaction(query="Empty metadata", response="Response", metadata={})
+        memory.add_interaction(query="Metadata", response="Response", metadata={"k": 1})
+
+        assert [entry.metadata for entry in memory.get_recent_context()] == [{}, {}, {"k": 1}]
+        memory.close()
+        with closing(sqlite3.connect(temp_db_path)) as conn:
+            stored = [row[0] for row in conn.execute("SELECT metadata FROM memory_entries")]
+        assert stored[:2] == ["{}", "{}"]
+        assert json.loads(stored[2]) == {"k": 1}
+
+    def test_metadata_round_trip(self, temp_db_path: str) -> None:
+        """Test that nested metadata survives storage, with keys stringified like JSON."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        metadata = {"sources": ["a", "b"], "score": 0.5, "nested": {"ok": True}, 1: None}
+        memory.add_interaction(query="Metadata", response="Response", metadata=metadata)
+
+        assert memory.get_recent_context()[0].metadata == {
+            "sources": ["a", "b"],
+            "score": 0.5,
+            "nested": {"ok": True},
+            "1": None,
+        }
+
     def test_memory_limit(self, temp_db_path: str) -> None:
         """Test that memory respects max_entries limit."""
         memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=3)
@@ -128,6 +225,134 @@ class TestMemoryManager:
         # Should return empty string if no relevant matches
         assert context == "" or "Python" not in context
 
+    def test_get_relevant_context_only_searches_recent_window(self, temp_db_path: str) -> None:
+        """Test that entries evicted from the context window are not matched."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=100)
+
+        memory.add_interaction(query="Kubernetes operators", response="Operators extend...")
+        assert "Kubernetes" in memory.get_relevant_context("Kubernetes tips")
+
+        for i in range(CONTEXT_WINDOW):
+            memory.add_interaction(query=f"Query {i}", response=f"Response {i}")
+
+        assert memory.get_relevant_context("Kubernetes tips") == ""
+
+    def test_get_relevant_context_window_wraps(self, temp_db_path: str) -> None:
+        """Test that ties keep chronological order after the window wraps around."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=3)
+        assert memory.get_relevant_context("Topic") == ""
+
+        for i in range(7):
+            memory.add_interaction(query=f"Topic {i}", response=f"Response {i}")
+        context = memory.get_relevant_context("Topic", max_entries=3)
+
+        assert [line for line in context.splitlines() if line.startswith("Previous Query")] == [
+            "Previous Query: Topic 4",
+            "Previous Query: Topic 5",
+            "Previous Query: Topic 6",
+        ]
+
+    def test_get_relevant_context_recycles_token_bits(self, temp_db_path: str) -> None:
+        """Test that evicted tokens free their bits and overlap stays exact."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=3)
+        assert memory.get_relevant_context("warmup") == ""
+
+        for i in range(50):
+            memory.add_interaction(query=f"shared word{i} extra{i}", response=f"Response {i}")
+        context = memory.get_relevant_context("shared word49 extra49", max_entries=1)
+
+        assert context.startswith("Previous Query: shared word49 extra49\n")
+        # Three entries of three tokens each, one of them shared
+        assert len(memory._token_bits) == 7
+        assert max(memory._token_bits.values()) < 9
+
+    def test_get_relevant_context_does_not_query_database(
+        self, temp_db_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lookups are served from the in-memory window once it is loaded."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        memory.add_interaction(query="FastAPI deployment", response="Use Gunicorn")
+        memory.get_relevant_context("warmup")
+        memory.add_interaction(query="FastAPI testing", response="Use TestClient")
+
+        def no_database() -> None:
+            raise AssertionError("relevant context must not hit the database")
+
+        monkeypatch.setattr(memory, "_get_conn", no_database)
+        context = memory.get_relevant_context("FastAPI testing tips", max_entries=1)
+
+        assert context == "Previous Query: FastAPI testing\nPrevious Finding: Use TestClient..."
+
+    def test_get_relevant_context_after_reload(self, temp_db_path: str) -> None:
+        """Test that a new manager rebuilds its index from the database."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        memory.add_interaction(query="FastAPI dependency injection", response="Use Depends...")
+
+        reloaded = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        context = reloaded.get_relevant_context("FastAPI testing")
+
+        assert "FastAPI dependency injection" in context
+        assert "Use Depends" in context
+
+    def test_get_relevant_context_with_embeddings(self, temp_db_path: str) -> None:
+        """Test that semantic lookup matches related queries without shared words."""
+        memory = SQLiteMemoryManager(
+            db_path=temp_db_path, max_entries=10, embeddings=TopicEmbeddings()
+        )
+        memory.add_interaction(query="Kubernetes operators", response="Operators extend...")
+        memory.add_interaction(query="What is React?", response="React is a library...")
+
+        context = memory.get_relevant_context("K8s autoscaling")
+
+        assert "Kubernetes operators" in context
+        assert "React" not in context
+
+    def test_get_relevant_context_embeddings_persist(self, temp_db_path: str) -> None:
+        """Test that stored embeddings are reused after a reload."""
+        memory = SQLiteMemoryManager(
+            db_path=temp_db_path, max_entries=10, embeddings=TopicEmbeddings()
+        )
+        memory.add_interaction(query="Kubernetes operators", response="Operators extend...")
+
+        embeddings = TopicEmbeddings()
+        reloaded = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10, embeddings=embeddings)
+        embeddings.embed_query = MagicMock(wraps=embeddings.embed_query)  # type: ignore[method-assign]
+
+        assert "Kubernetes operators" in reloaded.get_relevant_context("K8s autoscaling")
+        embeddings.embed_query.assert_called_once_with("K8s autoscaling")
+
+    def test_get_relevant_context_ignores_other_model_vectors(self, temp_db_path: str) -> None:
+        """Test that vectors from another model or of another size are not compared."""
+        memory = SQLiteMemoryManager(
+            db_path=temp_db_path, max_entries=10, embeddings=TopicEmbeddings()
+        )
+        memory.add_interaction(query="Kubernetes operators", response="Operators extend...")
+        assert memory.get_relevant_context("K8s autoscaling", query_vector=(1.0,)) == ""
+        memory.close()
+
+        reloaded = SQLiteMemoryManager(
+            db_path=temp_db_path,
+            max_entries=10,
+            embeddings=TopicEmbeddings(),
+            embedding_model="other-model",
+        )
+
+        assert reloaded.get_relevant_context("K8s autoscaling") == ""
+
+    def test_get_relevant_context_cached_until_write(self, temp_db_path: str) -> None:
+        """Test that repeated lookups are cached and invalidated by new entries."""
+        embeddings = TopicEmbeddings()
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10, embeddings=embeddings)
+        memory.add_interaction(query="Kubernetes operators", response="Operators extend...")
+        embeddings.embed_query = MagicMock(wraps=embeddings.embed_query)  # type: ignore[method-assign]
+
+        first = memory.get_relevant_context("K8s autoscaling")
+        assert memory.get_relevant_context("K8s autoscaling") == first
+        assert embeddings.embed_query.call_count == 1
+
+        memory.add_interaction(query="Kubernetes networking", response="Use a CNI plugin...")
+        assert "Kubernetes networking" in memory.get_relevant_context("K8s autoscaling")
+
     def test_memory_summary(self, temp_db_path: str) -> None:
         """Test getting memory summary."""
         memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
@@ -141,6 +366,16 @@ class TestMemoryManager:
         assert summary["max_entries"] == 10
         assert summary["oldest_entry"] is not None
         assert summary["newest_entry"] is not None
+        assert summary["oldest_entry"] <= summary["newest_entry"]
+        assert summary["db_size_kb"] > 0
+
+    def test_memory_summary_empty(self, temp_db_path: str) -> None:
+        """Test the summary of an empty memory."""
+        summary = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10).get_summary()
+
+        assert summary["total_entries"] == 0
+        assert summary["oldest_entry"] is None
+        assert summary["newest_entry"] is None
 
     def test_clear_memory(self, temp_db_path: str) -> None:
         """Test clearing memory."""
@@ -152,6 +387,210 @@ class TestMemoryManager:
         memory.clear()
         assert len(memory) == 0
 
+    def test_database_uses_wal_and_reclaims_space(self, temp_db_path: str) -> None:
+        """Test that the database runs in WAL mode and clear() returns freed pages."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=200)
+        for i in range(100):
+            memory.add_interaction(query=f"Query {i}", response="x" * 2000)
+
+        memory.clear()
+
+        with closing(sqlite3.connect(temp_db_path)) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def test_memory_limit_follows_reconfiguration(self, temp_db_path: str) -> None:
+        """Test that reopening with a smaller limit prunes on the next insert."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        for i in range(6):
+            memory.add_interaction(query=f"Query {i}", response="Response")
+        memory.close()
+
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=2)
+        memory.add_interaction(query="Query 6", response="Response")
+
+        assert [entry.query for entry in memory.get_recent_context(10)] == ["Query 5", "Query 6"]
+
+    def test_migrates_text_timestamps(self, temp_db_path: str) -> None:
+        """Test that databases with ISO text timestamps are converted to integers."""
+        with closing(sqlite3.connect(temp_db_path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE memory_entries (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "query TEXT NOT NULL, response TEXT NOT NULL, timestamp TEXT NOT NULL, "
+                "metadata TEXT DEFAULT '{}')"
+            )
+            conn.execute(
+                "INSERT INTO memory_entries (query, response, timestamp, metadata) "
+                "VALUES ('Legacy query', 'Legacy response', '2024-05-01T10:30:00.123456', '{}')"
+            )
+
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        memory.add_interaction(query="New query", response="New response")
+
+        entries = memory.get_recent_context()
+        assert [entry.query for entry in entries] == ["Legacy query", "New query"]
+        assert [entry.query for entry in memory.search_memory("legacy")] == ["Legacy query"]
+        assert entries[0].timestamp == datetime(2024, 5, 1, 10, 30, 0, 123456)
+        assert memory.get_summary()["oldest_entry"] == "2024-05-01T10:30:00.123456"
+        memory.close()
+
+        with closing(sqlite3.connect(temp_db_path)) as conn:
+            assert {row[1]: row[2] for row in conn.execute("PRAGMA table_info(memory_entries)")}[
+                "timestamp"
+            ] == "INTEGER"
+
+    def test_search_memory(self, temp_db_path: str) -> None:
+        """Test full-text search by word prefix, requiring every keyword word."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=3)
+        memory.add_interaction(query="Deploying FastAPI", response="Use Gunicorn workers")
+        memory.add_interaction(query="React state", response="Prefer hooks")
+        memory.add_interaction(query="FastAPI testing", response="Use the TestClient")
+        memory.add_interaction(query="Django ORM", response="Use select_related")
+
+        assert [e.query for e in memory.search_memory("fast test")] == ["FastAPI testing"]
+        assert [e.query for e in memory.search_memory("hooks")] == ["React state"]
+        # Pruned entries leave the index with their rows
+        assert memory.search_memory("gunicorn") == []
+        # Search operators in the keyword are matched literally
+        assert memory.search_memory('react" OR "django') == []
+
+    def test_group_commit(self, temp_db_path: str) -> None:
+        """Test that queued interactions are written together and visible to reads."""
+
+        def stored_rows() -> int:
+            with closing(sqlite3.connect(temp_db_path)) as conn:
+                return int(conn.execute("SELECT COUNT(*) FROM memory_entries").fetchone()[0])
+
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=100, write_delay=60)
+        for i in range(3):
+            memory.add_interaction(query=f"Query {i}", response="Response")
+
+        assert stored_rows() == 0
+        assert len(memory) == 0  # counted once written
+        assert memory.get_recent_context()  # reads write the queue first
+        assert stored_rows() == 3
+        assert len(memory) == 3
+
+        for i in range(WRITE_BATCH_SIZE):
+            memory.add_interaction(query=f"Batch {i}", response="Response")
+        assert stored_rows() == 3 + WRITE_BATCH_SIZE
+
+        memory.add_interaction(query="Last", response="Response")
+        memory.close()
+        assert stored_rows() == 4 + WRITE_BATCH_SIZE
+
+    def test_failed_write_without_delay_raises(
+        self, temp_db_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a synchronous write failure reaches the caller and isn't counted."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=100)
+        monkeypatch.setattr(
+            sqlite_memory, "_INSERT_SQL", "INSERT INTO missing VALUES (?, ?, ?, ?, ?, ?)"
+        )
+
+        with pytest.raises(sqlite3.OperationalError):
+            memory.add_interaction(query="Retried", response="Response")
+        assert len(memory) == 0
+
+        monkeypatch.undo()
+        memory.close()  # the interaction stayed queued
+        assert len(memory) == 1
+
+    def test_failed_group_commit_keeps_rows_queued(
+        self, temp_db_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed write keeps the queue and does not fail unrelated reads."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=100, write_delay=60)
+        memory.add_interaction(query="First", response="Response")
+        memory.add_interaction(query="Second", response="Response")
+        monkeypatch.setattr(
+            sqlite_memory, "_INSERT_SQL", "INSERT INTO missing VALUES (?, ?, ?, ?, ?, ?)"
+        )
+
+        with pytest.raises(sqlite3.OperationalError):
+            memory.flush()
+        assert memory.get_summary()["total_entries"] == 0
+        assert len(memory) == 0
+        memory.add_interaction(query="Third", response="Response")
+
+        monkeypatch.undo()
+        memory.flush()
+
+        assert [entry.query for entry in memory.get_recent_context()] == [
+            "First",
+            "Second",
+            "Third",
+        ]
+        memory.close()
+
+    def test_group_commit_after_delay(self, temp_db_path: str) -> None:
+        """Test that the queue is written once the write delay elapses."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10, write_delay=0.05)
+        memory.add_interaction(query="Delayed", response="Response")
+
+        time.sleep(0.5)
+
+        with closing(sqlite3.connect(temp_db_path)) as conn:
+            assert conn.execute("SELECT query FROM memory_entries").fetchall() == [("Delayed",)]
+        memory.close()
+
+    def test_close_and_reopen(self, temp_db_path: str) -> None:
+        """Test that the shared connection reopens after close()."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        memory.add_interaction(query="Before close", response="Response")
+
+        memory.close()
+        memory.add_interaction(query="After close", response="Response")
+
+        assert [entry.query for entry in memory.get_recent_context()] == [
+            "Before close",
+            "After close",
+        ]
+        memory.close()
+
+    def test_interaction_indexed_once_during_first_lookup(self, temp_db_path: str) -> None:
+        """Test that a lookup loading the index while a row is queued doesn't index it twice."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10, write_delay=60)
+        lookups: list[threading.Thread] = []
+
+        class LookupOnRelease:
+            """Pending lock that starts the first lookup right after a row is queued."""
+
+            def __init__(self) -> None:
+                self._lock = threading.Lock()
+
+            def __enter__(self) -> None:
+                self._lock.acquire()
+
+            def __exit__(self, *exc_info: object) -> None:
+                self._lock.release()
+                if not lookups:
+                    lookups.append(
+                        threading.Thread(target=memory.get_relevant_context, args=("Kubernetes",))
+                    )
+                    lookups[0].start()
+                    lookups[0].join(0.2)
+
+        memory._pending_lock = LookupOnRelease()  # type: ignore[assignment]
+        memory.add_interaction(query="Kubernetes operators", response="Operators extend...")
+        lookups[0].join()
+
+        assert memory._count == 1
+        memory.close()
+
+    async def test_concurrent_writes_share_connection(self, temp_db_path: str) -> None:
+        """Test that writes from worker threads are serialized on one connection."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=100)
+
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(memory.add_interaction, query=f"Query {i}", response="Response")
+                for i in range(20)
+            )
+        )
+
+        assert len(memory) == 20
+
     def test_memory_to_list(self, temp_db_path: str) -> None:
         """Test converting memory to list."""
         memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
@@ -169,6 +608,16 @@ class TestMemoryManager:
         assert entries[0]["response"] == "Test response"
         assert entries[0]["metadata"]["key"] == "value"
 
+    def test_to_list_matches_entry_dicts(self, temp_db_path: str) -> None:
+        """Test that to_list returns exactly what the entries' to_dict would."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=3)
+        for i in range(5):
+            memory.add_interaction(query=f"Query {i}", response="Response", metadata={"i": i})
+
+        expected = [entry.to_dict() for entry in memory.get_recent_context(n=3)]
+        assert memory.to_list() == expected
+        assert [entry["query"] for entry in expected] == ["Query 2", "Query 3", "Query 4"]
+
     def test_memory_bool(self, temp_db_path: str) -> None:
         """Test memory truthiness."""
         memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
@@ -177,6 +626,21 @@ class TestMemoryManager:
         memory.add_interaction(query="Test", response="Response")
         assert memory
 
+    def test_len_tracks_count_across_reopen(self, temp_db_path: str) -> None:
+        """Test that the tracked count starts from the stored rows and honours pruning."""
+        memory = SQLiteMemoryManager(db_path=temp_db_path, max_entries=10)
+        for i in range(5):
+            memory.add_interaction(query=f"Query {i}", response="Response")
+        memory.close()
+
+        reopened = SQLiteMemoryManager(db_path=temp_db_path, max_entries=2)
+        assert len(reopened) == 5  # nothing pruned until the next insert
+        reopened.add_interaction(query="Query 5", response="Response")
+        assert len(reopened) == 2
+        reopened.close()
+        assert len(reopened) == 2
+        assert reopened._conn is None
+
 
 class TestMemoryEntry:
     """Tests for MemoryEntry dataclass."""
@@ -212,3 +676,995 @@ class TestMemoryEntry:
         assert data["response"] == "Response"
         assert data["timestamp"] == now.isoformat()
         assert data["id"] == 1
+        assert "query_tokens" not in data
+
+    def test_memory_entry_query_tokens(self) -> None:
+        """Test that the query is tokenized once at creation."""
+        entry = MemoryEntry(
+            id=1,
+            query="FastAPI Deployment best practices",
+            response="Response",
+            timestamp=datetime.now(),
+            metadata={},
+        )
+
+        assert entry.query_tokens == frozenset({"fastapi", "deployment", "best", "practices"})
+
+    def test_memory_entry_is_immutable(self) -> None:
+        """Test that stored entries cannot be modified."""
+        entry = MemoryEntry(
+            id=1,
+            query="Test",
+            response="Response",
+            timestamp=datetime.now(),
+            metadata={},
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            entry.response = "Changed"  # type: ignore[misc]
+
+
+class TestResponseCache:
+    """Tests for ResponseCache service."""
+
+    def test_get_missing_key(self) -> None:
+        """Test that unknown keys are cache misses."""
+        cache = ResponseCache(max_entries=2)
+
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cached = CachedResearch(
+            search_results=(),
+            key_findings=("Finding",),
+            synthesis="Synthesis",
+            confidence_score=0.5,
+        )
+
+        cache.put("a", cached)
+        cache.put("b", cached)
+        assert cache.get("a") is cached
+        cache.put("c", cached)
+
+        assert len(cache) == 2
+        assert cache.get("a") is cached
+        assert cache.get("b") is None
+
+    def test_expires_entries_after_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that entries older than the TTL are misses."""
+        now = 1000.0
+        monkeypatch.setattr("src.application.services.response_cache.time.monotonic", lambda: now)
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        cached = CachedResearch(
+            search_results=(),
+            key_findings=("Finding",),
+            synthesis="Synthesis",
+            confidence_score=0.5,
+        )
+
+        cache.put("a", cached)
+        now += 59
+        assert cache.get("a") is cached
+        now += 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestVectors:
+    """Tests for the vector helpers."""
+
+    def test_quantized_similarity_matches_float(self) -> None:
+        """Test that int8 quantization keeps cosine similarity close to float."""
+        a = normalize([0.3, -1.2, 0.05, 2.0, -0.7, 0.9])
+        b = normalize([0.1, -1.0, 0.4, 1.7, -0.2, 1.1])
+
+        assert similarity(a, quantize(b)) == pytest.approx(dot(a, b), abs=0.01)
+        assert similarity(a, quantize(a)) == pytest.approx(1.0, abs=0.01)
+
+    def test_quantize_clamps_to_int8(self) -> None:
+        """Test that components outside [-1, 1] saturate instead of overflowing."""
+        assert list(quantize([1.5, -2.0, 0.5])) == [127, -127, 64]
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache service."""
+
+    CACHED = CachedResearch(
+        search_results=(),
+        key_findings=("Use namespaces",),
+        synthesis="Kubernetes best practices...",
+        confidence_score=0.8,
+    )
+
+    async def test_matches_paraphrased_question(self) -> None:
+        """Test that a similar question in the same scope is a hit."""
+        cache = SemanticCache(embeddings=TopicEmbeddings())
+        cache.put(await cache.embed("Kubernetes best practices"), "technical", self.CACHED)
+
+        vector = await cache.embed("What are K8s best practices?")
+
+        assert cache.get(vector, "technical") is self.CACHED
+        assert cache.get(vector, "comparative") is None
+
+    async def test_ignores_dissimilar_question(self) -> None:
+        """Test that an unrelated question is a miss."""
+        cache = SemanticCache(embeddings=TopicEmbeddings())
+        cache.put(await cache.embed("Kubernetes best practices"), "technical", self.CACHED)
+
+        vector = await cache.embed("React best practices")
+
+        assert cache.get(vector, "technical") is None
+
+
+class TestPromptTemplates:
+    """Tests for the agent prompt templates."""
+
+    def test_react_prompt_keeps_static_prefix(self) -> None:
+        """Test that per-request variables only appear after the static prefix."""
+        variables = {"tools": "web_search: Search the web", "tool_names": "web_search"}
+        first = REACT_PROMPT_TEMPLATE.format(input="Question A", agent_scratchpad="", **variables)
+        second = REACT_PROMPT_TEMPLATE.format(input="Question B", agent_scratchpad="x", **variables)
+        prefix = first[: first.index("Question A")]
+
+        assert second.startswith(prefix)
+        assert len(prefix) > len(first) * 0.9
+
+    def test_tool_calling_prompt_starts_with_static_system_message(self) -> None:
+        """Test that the system message has no per-request variables."""
+        system = TOOL_CALLING_PROMPT_TEMPLATE.messages[0]
+
+        assert system.prompt.input_variables == []  # type: ignore[union-attr]
+
+
+class TestTextAnalyzerTool:
+    """Tests for the text analyzer's rule-based fallback."""
+
+    def test_prompt_includes_text_verbatim(self) -> None:
+        """Test that braces in the analyzed text are not treated as placeholders."""
+        tool = TextAnalyzerTool()
+
+        prompt = tool._get_analysis_prompt("Config uses {key: value}", "summarize")
+        assert prompt.endswith("2-3 sentences:\n\nConfig uses {key: value}")
+        assert tool._get_analysis_prompt("x", "unknown") == "Analyze the following text:\n\nx"
+
+    def test_sentiment_counts_whole_words(self) -> None:
+        """Test that sentiment counts word occurrences, not substrings."""
+        tool = TextAnalyzerTool()
+
+        result = tool._run("Great docs, great API. It is likely fine.", "sentiment")
+        assert result == "Sentiment: Positive (positive indicators: 2, negative indicators: 0)"
+
+    def test_sentiment_ignores_words_inside_other_words(self) -> None:
+        """Test that 'goodbye' and 'errors' are not counted as 'good' and 'error'."""
+        tool = TextAnalyzerTool()
+
+        result = tool._run("Say goodbye to errors and unlikely outcomes.", "sentiment")
+        assert result == "Sentiment: Neutral (positive indicators: 0, negative indicators: 0)"
+
+    def test_summary_splits_on_any_sentence_end(self) -> None:
+        """Test that questions and exclamations also end sentences."""
+        tool = TextAnalyzerTool()
+
+        result = tool._run("Why FastAPI? It is fast! It is typed.\nIt has docs.", "summarize")
+        assert result == "Summary: Why FastAPI? It has docs."
+
+    def test_technical_terms(self) -> None:
+        """Test that acronyms and known mixed-case terms are extracted."""
+        tool = TextAnalyzerTool()
+
+        result = tool._run(
+            "Expose a REST or GraphQL API (over HTTP2), not Graph.", "technical_terms"
+        )
+        assert result == "Technical Terms Found: API, GraphQL, HTTP2, REST"
+
+    def test_dispatches_by_analysis_type(self) -> None:
+        """Test that each analysis type reaches its handler and unknown types are reported."""
+        tool = TextAnalyzerTool()
+        text = "Caching is a key benefit. The main drawback is staleness."
+
+        assert tool._run(text, AnalysisType.KEY_POINTS).startswith("Key Points:\n• Caching")
+        assert tool._run(text, "pros_cons") == (
+            "Pros:\n+ Caching is a key benefit.\n\nCons:\n- The main drawback is staleness."
+        )
+        assert tool._run(text, "translate") == "Analysis type 'translate' not supported."
+
+
+class TestWebSearchTools:
+    """Tests for the DDGS-backed search tools."""
+
+    def test_tools_share_one_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that searches reuse a single DDGS client (and its HTTP sessions)."""
+        created: list[object] = []
+
+        class FakeDDGS:
+            def __init__(self) -> None:
+                created.append(self)
+
+            def text(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+                return [{"title": query, "href": "https://example.com", "body": "text"}]
+
+            def news(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+                return []
+
+        monkeypatch.setattr(web_search, "DDGS", FakeDDGS)
+        web_search._get_ddgs.cache_clear()
+        try:
+            assert "Title: fastapi" in WebSearchTool()._run("fastapi")
+            assert "Title: uvicorn" in WebSearchTool()._run("uvicorn")
+            assert NewsSearchTool()._run("python") == "No news articles found for the query."
+        finally:
+            web_search._get_ddgs.cache_clear()
+
+        assert len(created) == 1
+
+    async def test_async_search_runs_on_search_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that concurrent async searches run in parallel on the dedicated pool."""
+        barrier = threading.Barrier(3, timeout=5)
+        threads: list[str] = []
+
+        class FakeDDGS:
+            def text(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+                threads.append(threading.current_thread().name)
+                barrier.wait()  # only returns once all three searches are running
+                return []
+
+        monkeypatch.setattr(web_search, "_get_ddgs", FakeDDGS)
+        tool = WebSearchTool()
+
+        results = await asyncio.gather(*(tool._arun(f"query {i}") for i in range(3)))
+
+        assert results == ["No results found for the query."] * 3
+        assert all(name.startswith("search") for name in threads)
+
+    def test_search_tool_base_is_abstract(self) -> None:
+        """Test that the shared base can't be used without a search implementation."""
+        with pytest.raises(TypeError, match="abstract"):
+            web_search._SearchTool(name="search", description="Search")  # type: ignore[abstract]
+
+    async def test_search_tools_share_rate_limiter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that sync and async searches of both tools acquire the shared limiter."""
+
+        class FakeDDGS:
+            def text(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+                return []
+
+            def news(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+                return []
+
+        monkeypatch.setattr(web_search, "_get_ddgs", FakeDDGS)
+        limiter = MagicMock(spec=TokenBucketRateLimiter)
+        web_tool = WebSearchTool(rate_limiter=limiter)
+        news_tool = NewsSearchTool(rate_limiter=limiter)
+
+        web_tool._run("fastapi")
+        await web_tool._arun("fastapi")
+        await news_tool._arun("python")
+
+        assert limiter.acquire.call_count == 1
+        assert limiter.aacquire.await_count == 2
+
+
+class TestDuckDuckGoAdapter:
+    """Tests for the DuckDuckGo search adapter's result cache."""
+
+    class FakeDDGS:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def text(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+            self.calls += 1
+            return [{"title": query, "href": "https://example.com", "body": "text"}]
+
+    def test_missing_ddgs_fails_at_construction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a missing ddgs package is reported when the adapter is built."""
+        monkeypatch.setattr(duckduckgo_adapter, "DDGS", None)
+
+        with pytest.raises(SearchError, match="ddgs package not installed"):
+            DuckDuckGoAdapter()
+
+    async def test_repeated_search_is_cached(self) -> None:
+        """Test that identical searches hit DuckDuckGo once and return copies."""
+        adapter = DuckDuckGoAdapter()
+        fake = self.FakeDDGS()
+        adapter._ddgs = fake  # type: ignore[assignment]
+
+        first = await adapter.search("fastapi")
+        first.clear()
+        second = await adapter.search("fastapi")
+        await adapter.search("fastapi", region="es-es")
+
+        assert fake.calls == 2
+        assert [(r.title, r.url, r.snippet, r.position) for r in second] == [
+            ("fastapi", "https://example.com", "text", 1)
+        ]
+
+    async def test_rate_limit_is_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a transient 202 rate limit is retried, other errors are not."""
+        monkeypatch.setattr(DuckDuckGoAdapter, "BASE_DELAY", 0.0)
+        monkeypatch.setattr(_retry.random, "uniform", lambda a, b: 0.0)
+        errors = [RuntimeError("https://duckduckgo.com 202 Ratelimit")]
+
+        class FlakyDDGS(self.FakeDDGS):
+            def text(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+                if errors:
+                    raise errors.pop()
+                return super().text(query, **kwargs)
+
+        adapter = DuckDuckGoAdapter(cache_ttl=0)
+        fake = FlakyDDGS()
+        adapter._ddgs = fake  # type: ignore[assignment]
+
+        assert [r.title for r in await adapter.search("fastapi")] == ["fastapi"]
+
+        errors.append(TimeoutException("https://duckduckgo.com"))
+        assert [r.title for r in await adapter.search("fastapi")] == ["fastapi"]
+        assert fake.calls == 2
+
+        errors.append(RuntimeError("could not generate results for 2025"))
+        with pytest.raises(SearchError, match="could not generate") as exc_info:
+            await adapter.search("fastapi")
+        assert type(exc_info.value) is SearchError
+        assert fake.calls == 2 and not errors
+
+    async def test_search_many_runs_concurrently(self) -> None:
+        """Test that batched searches overlap, up to the concurrency limit."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BarrierDDGS(self.FakeDDGS):
+            def text(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+                barrier.wait()  # only returns once two searches are running
+                return super().text(query, **kwargs)
+
+        adapter = DuckDuckGoAdapter()
+        adapter._ddgs = BarrierDDGS()  # type: ignore[assignment]
+
+        results = await adapter.search_many(["a", "b", "c", "d"], concurrency=2)
+
+        assert [[r.title for r in batch] for batch in results] == [["a"], ["b"], ["c"], ["d"]]
+
+    async def test_context_manager_closes_adapter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that closing drops the client and cache, repeatably, and searches still work."""
+        monkeypatch.setattr(duckduckgo_adapter, "DDGS", lambda timeout: self.FakeDDGS())
+
+        async with DuckDuckGoAdapter() as adapter:
+            await adapter.search("fastapi")
+            assert adapter._cache
+
+        assert adapter._ddgs is None
+        assert not adapter._cache
+        await adapter.aclose()
+
+        assert [r.title for r in await adapter.search("fastapi")] == ["fastapi"]
+        assert adapter._ddgs is not None
+
+    async def test_health_check_success_is_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a healthy probe is trusted for the TTL, then repeated."""
+        adapter = DuckDuckGoAdapter()
+        fake = self.FakeDDGS()
+        adapter._ddgs = fake  # type: ignore[assignment]
+
+        assert await adapter.health_check()
+        assert await adapter.health_check()
+        assert fake.calls == 1
+
+        monkeypatch.setattr(DuckDuckGoAdapter, "HEALTH_CHECK_TTL", 0.0)
+        adapter._healthy_until = 0.0
+        assert await adapter.health_check()
+        assert fake.calls == 2
+
+    async def test_zero_ttl_disables_cache(self) -> None:
+        """Test that a TTL of 0 sends every search to DuckDuckGo."""
+        adapter = DuckDuckGoAdapter(cache_ttl=0)
+        fake = self.FakeDDGS()
+        adapter._ddgs = fake  # type: ignore[assignment]
+
+        await adapter.search("fastapi")
+        await adapter.search("fastapi")
+
+        assert fake.calls == 2
+
+
+class TestAsyncTokenBucket:
+    """Tests for the adapters' client-side rate limiter."""
+
+    async def test_burst_then_paced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the burst passes at once and later requests wait their turn."""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(_rate_limit.asyncio, "sleep", fake_sleep)
+        bucket = AsyncTokenBucket(rate=2.0, burst=2)
+
+        for _ in range(4):
+            await bucket.acquire()
+
+        # Third and fourth callers queue 0.5 s apart at 2 tokens per second
+        assert delays == pytest.approx([0.5, 1.0], abs=0.01)
+
+    async def test_cancelled_wait_refunds_tokens(self) -> None:
+        """Test that a caller cancelled while waiting gives its token back."""
+        bucket = AsyncTokenBucket(rate=1.0, burst=1)
+        await bucket.acquire()
+
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # Only the first request's debt remains
+        assert bucket._reserve(1) == pytest.approx(1.0, abs=0.05)
+
+    def test_rate_limiter_takes_from_every_bucket(self) -> None:
+        """Test that a request needs capacity in all buckets and takes none otherwise."""
+        minute = AsyncTokenBucket(rate=1.0, burst=2)
+        day = AsyncTokenBucket(rate=0.001, burst=1)
+        limiter = TokenBucketRateLimiter(minute, day)
+
+        assert limiter.acquire(blocking=False)
+        assert not limiter.acquire(blocking=False)
+        assert minute._try_reserve(1)
+
+
+class TestLLMAdapters:
+    """Tests for the Gemini and Groq LLM adapters."""
+
+    @pytest.mark.parametrize("adapter_class", [GeminiLLMAdapter, GroqLLMAdapter])
+    def test_override_clients_are_reused(self, adapter_class: type[LLMPort]) -> None:
+        """Test that a temperature override builds its client once, not per call."""
+        adapter: Any = adapter_class(api_key="test-key")  # type: ignore[call-arg]
+
+        structured = adapter._get_client(0.3, None)
+
+        assert adapter._get_client(0.3, None) is structured
+        assert adapter._get_client(None, None) is adapter._client
+        assert structured is not adapter._client
+
+    @pytest.mark.parametrize("adapter_class", [GeminiLLMAdapter, GroqLLMAdapter])
+    def test_clients_share_rate_limiter(self, adapter_class: type[LLMPort]) -> None:
+        """Test that the agent's client and override clients are paced by one limiter."""
+        adapter: Any = adapter_class(api_key="test-key")  # type: ignore[call-arg]
+
+        assert adapter.get_langchain_llm().rate_limiter is adapter._rate_limiter
+        assert adapter._get_client(0.3, None).rate_limiter is adapter._rate_limiter
+
+    def test_structured_prompt_uses_compact_schema(self) -> None:
+        """Test that the schema is embedded as compact JSON after the system prompt."""
+        prompt = structured_system_prompt({"result": "string", "score": "float"}, "Be brief.")
+
+        assert prompt == (
+            "Be brief.\n\nYou must respond with valid JSON matching this schema:\n"
+            '{"result":"string","score":"float"}\n\n'
+            "Respond ONLY with the JSON object, no additional text."
+        )
+
+    @pytest.mark.parametrize(
+        "reply",
+        [
+            '{"a": 1}',
+            '```\n{"a": 1}\n```',
+            '```json\n{"a": 1}\n```',
+            '```json\n{"a": 1}',  # closing fence cut off
+        ],
+    )
+    def test_strip_code_fence(self, reply: str) -> None:
+        """Test that fenced and bare JSON replies parse to the same object."""
+        assert json.loads(strip_code_fence(reply)) == {"a": 1}
+
+
+class TestAgentConfig:
+    """Tests for AgentConfig."""
+
+    def test_config_is_immutable_and_hashable(self) -> None:
+        """Test that the config cannot change after the executor is built."""
+        config = AgentConfig(verbose=False)
+
+        with pytest.raises(FrozenInstanceError):
+            config.max_iterations = 50  # type: ignore[misc]
+
+        assert hash(config) == hash(AgentConfig(verbose=False))
+
+
+class TestResearchAgentService:
+    """Tests for ResearchAgentService."""
+
+    @pytest.fixture
+    def agent(self, temp_db_path: str) -> ResearchAgentService:
+        """Create an agent whose executor returns a canned response."""
+        agent = ResearchAgentService(
+            llm=FakeListLLM(responses=["Final Answer: done"]),
+            tools=[],
+            memory_manager=SQLiteMemoryManager(db_path=temp_db_path, max_entries=10),
+            config=AgentConfig(verbose=False),
+            response_cache=ResponseCache(),
+        )
+        agent._agent_executor = MagicMock()
+        agent._agent_executor.ainvoke = AsyncMock(
+            return_value={
+                "output": "- FastAPI runs well behind Gunicorn with Uvicorn workers",
+                "intermediate_steps": [],
+            }
+        )
+        return agent
+
+    async def test_research_many(self, agent: ResearchAgentService) -> None:
+        """Test batched research keeps order, bounds concurrency and contains failures."""
+        running = 0
+        peak = 0
+
+        async def research(query: ResearchQuery) -> ResearchResult:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if query.question.startswith("Broken"):
+                raise RuntimeError("provider unavailable")
+            return ResearchResult.create_pending(query.id)
+
+        agent.research = research  # type: ignore[method-assign]
+        queries = [
+            ResearchQuery.create(question=f"{prefix} question number {i}?")
+            for i, prefix in enumerate(["Working", "Broken", "Working", "Working"])
+        ]
+
+        results = await agent.research_many(queries, concurrency=2)
+
+        assert [result.query_id for result in results] == [query.id for query in queries]
+        assert peak == 2
+        assert results[1].status == ResearchStatus.FAILED
+        assert results[1].key_findings == ("Error: provider unavailable",)
+        assert [result.status for result in results].count(ResearchStatus.FAILED) == 1
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    async def test_research_many_rejects_invalid_concurrency(
+        self, agent: ResearchAgentService, concurrency: int
+    ) -> None:
+        """Test that a concurrency below 1 is rejected instead of blocking forever."""
+        queries = [ResearchQuery.create(question="What are FastAPI deployment best practices?")]
+
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            await agent.research_many(queries, concurrency=concurrency)
+
+        assert agent._agent_executor.ainvoke.await_count == 0
+
+    async def test_research_uses_response_cache(self, agent: ResearchAgentService) -> None:
+        """Test that repeated queries are answered from the response cache."""
+        first = await agent.research(
+            ResearchQuery.create(question="What are FastAPI deployment best practices?")
+        )
+        second = await agent.research(
+            ResearchQuery.create(question="What are FastAPI deployment best practices?")
+        )
+
+        assert agent._agent_executor.ainvoke.await_count == 1
+        assert second.is_complete
+        assert second.synthesis == first.synthesis
+        assert second.key_findings == first.key_findings
+        assert second.query_id != first.query_id
+
+    async def test_research_stores_interaction(self, agent: ResearchAgentService) -> None:
+        """Test that completed research is parsed and stored in memory."""
+        result = await agent.research(
+            ResearchQuery.create(question="What are FastAPI deployment best practices?")
+        )
+
+        assert result.key_findings == ("FastAPI runs well behind Gunicorn with Uvicorn workers",)
+        entries = agent.memory.get_recent_context(1)
+        assert entries[0].query == "What are FastAPI deployment best practices?"
+        assert entries[0].response == result.synthesis
+
+    async def test_research_cache_ignores_case_and_spacing(
+        self, agent: ResearchAgentService
+    ) -> None:
+        """Test that questions differing only in case or spacing share a cache entry."""
+        await agent.research(
+            ResearchQuery.create(question="What are FastAPI deployment best practices?")
+        )
+        await agent.research(
+            ResearchQuery.create(question="what are  FastAPI deployment BEST practices?")
+        )
+
+        assert agent._agent_executor.ainvoke.await_count == 1
+
+    async def test_research_cache_key_includes_context(self, agent: ResearchAgentService) -> None:
+        """Test that queries with different context are not served from cache."""
+        await agent.research(
+            ResearchQuery.create(question="What are FastAPI deployment best practices?")
+        )
+        await agent.research(
+            ResearchQuery.create(
+                question="What are FastAPI deployment best practices?",
+                context="Focus on Kubernetes",
+            )
+        )
+
+        assert agent._agent_executor.ainvoke.await_count == 2
+
+    def test_cache_scope_keeps_field_boundaries(self, agent: ResearchAgentService) -> None:
+        """Test that separators inside context or keywords can't make scopes collide."""
+        question = "What are FastAPI deployment best practices?"
+
+        def scope(context: str, keywords: tuple[str, ...]) -> str:
+            query = ResearchQuery.create(question=question, context=context, keywords=keywords)
+            return agent._cache_scope(query)
+
+        assert scope("a", ("b|c",)) != scope("a|b", ("c",))
+        assert scope("", ("x,y",)) != scope("", ("x", "y"))
+        assert scope("", ("y", "x")) == scope("", ("x", "y"))
+
+    async def test_research_uses_semantic_cache(self, agent: ResearchAgentService) -> None:
+        """Test that paraphrased queries are answered from the semantic cache."""
+        agent._semantic_cache = SemanticCache(embeddings=TopicEmbeddings())
+
+        await agent.research(ResearchQuery.create(question="What are Kubernetes best practices?"))
+        result = await agent.research(ResearchQuery.create(question="Best practices for K8s?"))
+
+        assert agent._agent_executor.ainvoke.await_count == 1
+        assert result.is_complete
+
+    async def test_failed_extraction_is_not_remembered(
+        self, agent: ResearchAgentService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a run failing after the agent returns is not stored in memory."""
+
+        def fail(agent_response: dict[str, Any]) -> list[str]:
+            time.sleep(0.2)  # fail after anything running alongside has finished
+            raise RuntimeError("extraction failed")
+
+        monkeypatch.setattr(agent, "_extract_key_findings", fail)
+
+        result = await agent.research(
+            ResearchQuery.create(question="What are FastAPI deployment best practices?")
+        )
+
+        assert result.status == ResearchStatus.FAILED
+        assert len(agent.memory) == 0
+
+    async def test_research_embeds_question_once(
+        self, agent: ResearchAgentService, temp_db_path: str
+    ) -> None:
+        """Test that the semantic cache, memory lookup and stored interaction share one embedding."""
+        embeddings = TopicEmbeddings()
+        agent._memory = SQLiteMemoryManager(
+            db_path=temp_db_path, max_entries=10, embeddings=embeddings
+        )
+        agent._semantic_cache = SemanticCache(embeddings=embeddings)
+        agent.memory.add_interaction(query="Kubernetes operators", response="Operators extend...")
+
+        with patch.object(embeddings, "embed_query", wraps=embeddings.embed_query) as embed:
+            await agent.research(ResearchQuery.create(question="How do I autoscale K8s?"))
+
+        assert embed.call_count == 1
+        prompt = agent._agent_executor.ainvoke.await_args.args[0]["input"]
+        assert "Kubernetes operators" in prompt
+
+    def test_parse_search_observation(self, agent: ResearchAgentService) -> None:
+        """Test parsing web and news search tool output into results."""
+        observation = (
+            "Result 1:\n"
+            "Title: FastAPI Deployment\n"
+            "URL: fastapi.tiangolo.com/deployment/\n"
+            "Snippet: Deploy FastAPI with Uvicorn workers\n\n"
+            "News 1:\n"
+            "Title: Python 3.13 released\n"
+            "Source: Python Blog\n"
+            "URL: https://blog.python.org/2024/10/python-3130.html\n"
+            "Summary: The new release ships an experimental JIT\n"
+        )
+
+        results = agent._parse_search_observation(observation)
+
+        assert [r.title for r in results] == ["FastAPI Deployment", "Python 3.13 released"]
+        assert results[0].url == "https://fastapi.tiangolo.com/deployment/"
+        assert results[0].snippet == "Deploy FastAPI with Uvicorn workers"
+        assert results[1].url == "https://blog.python.org/2024/10/python-3130.html"
+        assert results[1].snippet == "The new release ships an experimental JIT"
+
+    def test_parse_search_observation_fallbacks(self, agent: ResearchAgentService) -> None:
+        """Test Link/Description labels, unlabelled snippet lines and missing fields."""
+        observation = (
+            "Title: Uvicorn settings\n"
+            "Link: //www.uvicorn.org/settings/\n"
+            "Description: All command line options\n"
+            "Title: Gunicorn design\n"
+            "short line\n"
+            "Workers are forked from a single master process\n"
+            "Title: Hypercorn\n"
+        )
+
+        results = agent._parse_search_observation(observation)
+
+        assert [(r.url, r.snippet) for r in results] == [
+            ("https://www.uvicorn.org/settings/", "All command line options"),
+            ("https://duckduckgo.com", "Workers are forked from a single master process"),
+            ("https://duckduckgo.com", "Hypercorn"),
+        ]
+
+    def test_parse_search_observation_skips_blocks_without_title(
+        self, agent: ResearchAgentService
+    ) -> None:
+        """Test that untitled blocks are dropped without touching the previous result."""
+        observation = (
+            "Result 1:\n"
+            "Title: Good one here\n"
+            "URL: https://docs.python.org/3/\n"
+            "Snippet: Official documentation\n\n"
+            "Result 2:\n"
+            "Title: \n"
+            "URL: https://blank.example\n"
+            "Snippet: Blank title\n\n"
+            "Result 3:\n"
+            "URL: https://spam.example\n"
+            "Snippet: No title at all\n"
+        )
+
+        results = agent._parse_search_observation(observation)
+
+        assert [(r.title, r.url, r.snippet) for r in results] == [
+            ("Good one here", "https://docs.python.org/3/", "Official documentation")
+        ]
+        assert results[0].credibility is SourceCredibility.HIGH
+
+    def test_extract_search_results_from_intermediate_steps(
+        self, agent: ResearchAgentService
+    ) -> None:
+        """Test the fallback that parses search steps when no observations were collected."""
+        steps = [
+            (
+                AgentAction(tool="web_search", tool_input="fastapi", log=""),
+                "Title: FastAPI docs\nURL: https://fastapi.tiangolo.com\nSnippet: Official docs\n",
+            ),
+            (
+                AgentAction(tool="text_analyzer", tool_input="fastapi", log=""),
+                "Title: Not a search result\nURL: https://example.com\n",
+            ),
+            (
+                AgentAction(tool="news_search", tool_input="fastapi", log=""),
+                "Title: FastAPI on Facebook\nURL: https://facebook.com/fastapi\n"
+                "Title: FastAPI release notes\nURL: https://github.com/fastapi/fastapi\n",
+            ),
+        ]
+
+        results, high_cred_count = agent._extract_search_results({"intermediate_steps": steps})
+
+        assert [r.title for r in results] == ["FastAPI docs", "FastAPI release notes"]
+        assert high_cred_count == 1
+
+    def test_extract_key_findings(self, agent: ResearchAgentService) -> None:
+        """Test extracting bullet and numbered findings from the agent output."""
+        output = (
+            "Summary of the research:\n"
+            "- Use Gunicorn with Uvicorn workers\n"
+            "  * Keep endpoints async where possible\n"
+            "2) Put a reverse proxy in front of the app\n"
+            "- Too short\n"
+        )
+
+        findings = agent._extract_key_findings({"output": output})
+
+        assert findings == [
+            "Use Gunicorn with Uvicorn workers",
+            "Keep endpoints async where possible",
+            "Put a reverse proxy in front of the app",
+        ]
+
+    def test_extract_key_findings_marker_styles(self, agent: ResearchAgentService) -> None:
+        """Test that every supported bullet and numbering style is stripped."""
+        output = (
+            "→ Arrow bullets mark recommended steps\n"
+            "✓ Checkmarks list verified practices\n"
+            "► Pointers highlight important notes\n"
+            "• Round bullets are common in docs\n"
+            "10. Multi-digit numbering is supported\n"
+            "3- Dashed numbering is supported too\n"
+        )
+
+        findings = agent._extract_key_findings({"output": output})
+
+        assert findings == [
+            "Arrow bullets mark recommended steps",
+            "Checkmarks list verified practices",
+            "Pointers highlight important notes",
+            "Round bullets are common in docs",
+            "Multi-digit numbering is supported",
+            "Dashed numbering is supported too",
+        ]
+
+    def test_extract_key_findings_from_sentences(self, agent: ResearchAgentService) -> None:
+        """Test falling back to key sentences when the output has no list."""
+        output = (
+            "FastAPI is a modern framework. "
+            "You should always run it behind a production ASGI server. "
+            "It was created in 2018 by an independent developer"
+        )
+
+        findings = agent._extract_key_findings({"output": output})
+
+        assert findings == ["You should always run it behind a production ASGI server."]
+
+    def test_extract_key_findings_maps_keywords_to_sentences(
+        self, agent: ResearchAgentService
+    ) -> None:
+        """Test that keyword matches anywhere in the text select their own sentence."""
+        output = (
+            "Uvicorn is an ASGI server written in Python.\n"
+            "The MAIN process supervises every worker in production. "
+            "Workers are restarted when they crash unexpectedly. "
+            "Gunicorn is Essential for managing Uvicorn workers"
+        )
+
+        findings = agent._extract_key_findings({"output": output})
+
+        assert findings == [
+            "The MAIN process supervises every worker in production.",
+            "Gunicorn is Essential for managing Uvicorn workers.",
+        ]
+
+    def test_build_research_prompt(self, agent: ResearchAgentService) -> None:
+        """Test the research prompt layout with optional sections."""
+        agent.memory.add_interaction(query="FastAPI testing", response="Use TestClient")
+        query = ResearchQuery.create(
+            question="FastAPI deployment",
+            context="Production on Kubernetes",
+            keywords=["uvicorn", "gunicorn"],
+        )
+
+        prompt = agent._build_research_prompt(query)
+
+        assert prompt == (
+            "Research Question: FastAPI deployment\n\n"
+            "Additional Context: Production on Kubernetes\n\n"
+            "Focus Keywords: uvicorn, gunicorn\n\n"
+            "Research Type: technical\n\n"
+            "Maximum Sources: 5\n\n"
+            "Relevant Previous Research:\n"
+            "Previous Query: FastAPI testing\n"
+            "Previous Finding: Use TestClient..."
+        )
+
+    def test_build_research_prompt_minimal(self, agent: ResearchAgentService) -> None:
+        """Test that omitted optional sections leave no blank lines or braces behind."""
+        query = ResearchQuery.create(question="What is {placeholder} syntax in Python?")
+
+        prompt = agent._build_research_prompt(query)
+
+        assert prompt == (
+            "Research Question: What is {placeholder} syntax in Python?\n\n"
+            "Research Type: technical\n\n"
+            "Maximum Sources: 5"
+        )
+
+    def test_calculate_confidence(self, agent: ResearchAgentService) -> None:
+        """Test confidence scoring from sources, findings and credibility."""
+        assert agent._calculate_confidence(0, 0, 0) == 0.0
+        assert agent._calculate_confidence(3, 2, 2) == pytest.approx(0.67)
+        assert agent._calculate_confidence(12, 10, 8) == pytest.approx(1.0)
+
+    def test_filter_irrelevant_sources(self, agent: ResearchAgentService) -> None:
+        """Test dropping blocked domains and non-Latin titles."""
+        sources = [
+            SearchResult.create(
+                title="Guía de despliegue de FastAPI",
+                url="https://fastapi.tiangolo.com/es/deployment/",
+                snippet="Cómo desplegar FastAPI en producción",
+            ),
+            SearchResult.create(
+                title="FastAPI discussion",
+                url="https://www.facebook.com/groups/fastapi",
+                snippet="A post about FastAPI",
+            ),
+            SearchResult.create(
+                title="如何部署FastAPI应用程序",
+                url="https://example.cn/fastapi",
+                snippet="FastAPI deployment",
+            ),
+        ]
+
+        filtered, high_cred_count = agent._filter_irrelevant_sources(sources)
+
+        assert [source.title for source in filtered] == ["Guía de despliegue de FastAPI"]
+        assert high_cred_count == 0
+
+    def test_filter_irrelevant_sources_limit(self, agent: ResearchAgentService) -> None:
+        """Test that filtering stops once enough sources are kept."""
+        sources = [
+            SearchResult.create(
+                title=f"FastAPI guide {i}",
+                url=f"https://example{i}.org",
+                snippet="FastAPI deployment guide",
+                credibility=SourceCredibility.HIGH if i % 2 else SourceCredibility.MEDIUM,
+            )
+            for i in range(6)
+        ]
+
+        filtered, high_cred_count = agent._filter_irrelevant_sources(iter(sources), limit=3)
+
+        assert [source.title for source in filtered] == [f"FastAPI guide {i}" for i in range(3)]
+        assert high_cred_count == 1
+
+    def test_is_blocked_url(self) -> None:
+        """Test blocklist matching by host, parent domain and path."""
+        assert _is_blocked_url("https://www.facebook.com/groups/fastapi")
+        assert _is_blocked_url("https://m.facebook.com/fastapi")
+        assert _is_blocked_url("https://X.com/fastapi")
+        assert _is_blocked_url("https://www.linkedin.com/in/someone")
+        assert not _is_blocked_url("https://www.linkedin.com/company/fastapi")
+        assert not _is_blocked_url("https://www.dropbox.com/fastapi")
+        assert not _is_blocked_url("https://example.com/?ref=facebook.com")
+
+    def test_malformed_url_is_blocked_and_medium_credibility(
+        self, agent: ResearchAgentService
+    ) -> None:
+        """Test that a URL urlsplit() rejects is dropped instead of failing the research."""
+        assert _is_blocked_url("http://[abc/x")
+        assert _assess_credibility("http://[abc/x") == SourceCredibility.MEDIUM
+
+        parsed = agent._parse_search_observation(
+            "Title: Broken link\nURL: http://[abc/x\nSnippet: Malformed IPv6 host\n\n"
+            "Title: FastAPI docs\nURL: https://fastapi.tiangolo.com\nSnippet: Official docs\n"
+        )
+        filtered, _ = agent._filter_irrelevant_sources(parsed)
+
+        assert [r.title for r in filtered] == ["FastAPI docs"]
+
+    def test_assess_credibility(self) -> None:
+        """Test credibility classification by URL domain."""
+        assert _assess_credibility("https://docs.python.org/3/") == SourceCredibility.HIGH
+        assert _assess_credibility("https://www.NASA.gov/missions") == SourceCredibility.HIGH
+        assert _assess_credibility("https://dev.to/fastapi") == SourceCredibility.MEDIUM
+        assert _assess_credibility("https://example.com") == SourceCredibility.MEDIUM
+
+    def test_assess_credibility_ignores_path_and_query(self) -> None:
+        """Test that only the hostname decides credibility."""
+        assert (
+            _assess_credibility("https://example.com/?ref=github.com") == SourceCredibility.MEDIUM
+        )
+        assert _assess_credibility("https://example.com/wiki/nasa.gov") == SourceCredibility.MEDIUM
+
+    async def test_research_runs_tool_calls_concurrently(self, temp_db_path: str) -> None:
+        """Test that tool calls requested in one step run in parallel."""
+        running = 0
+        peak = 0
+
+        @tool
+        async def web_search(query: str) -> str:
+            """Search the web."""
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return f"Title: {query} guide\nURL: https://example.org/{query}\nSnippet: {query}\n"
+
+        llm = ToolCallingFakeChatModel(
+            responses=[
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "web_search", "args": {"query": "uvicorn"}, "id": "1"},
+                        {"name": "web_search", "args": {"query": "gunicorn"}, "id": "2"},
+                    ],
+                ),
+                AIMessage(content="- FastAPI runs well behind Gunicorn with Uvicorn workers"),
+            ]
+        )
+        agent = ResearchAgentService(
+            llm=llm,
+            tools=[web_search],
+            memory_manager=SQLiteMemoryManager(db_path=temp_db_path, max_entries=10),
+            config=AgentConfig(verbose=False),
+        )
+
+        result = await agent.research(ResearchQuery.create(question="How to deploy FastAPI apps?"))
+
+        assert result.is_complete
+        assert peak == 2
+        assert [source.title for source in result.search_results] == [
+            "uvicorn guide",
+            "gunicorn guide",
+        ]